@@ -0,0 +1,6 @@
+# Paket animasi 3D evolusi model atom
+# Import paket ini hanya memuat API (tanpa NumPy/matplotlib); scene dan modul render dimuat
+# saat dipakai, mis. animasi_atom.render('atom2', quality='draft') atau python -m animasi_atom atom2
+from .api import SCENES, load_scene, render  # API render
+
+__all__ = ['SCENES', 'load_scene', 'render']
@@ -0,0 +1,38 @@
+# Command line: python -m animasi_atom [scene] [opsi], mis. python -m animasi_atom atom2 --quality draft
+import argparse  # Untuk argumen command line
+import sys  # Untuk exit code
+
+from .api import SCENES, render  # API render
+from .quality import PROFILES  # Nama profil kualitas
+from .renditions import RENDITIONS  # Nama rendition output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m animasi_atom",
+                                     description="Render animasi 3D evolusi model atom")
+    parser.add_argument('scene', nargs='?', default='atom', choices=list(SCENES),
+                        help="Scene yang dirender (default: atom)")
+    parser.add_argument('--quality', choices=list(PROFILES),
+                        help="Profil kualitas (default: ATOM_QUALITY atau production)")
+    parser.add_argument('--backend', help="Backend render mplot3d atau impostor (default: ATOM_BACKEND atau mplot3d)")
+    parser.add_argument('--output', help="File video output (default: nama file scene per profil)")
+    parser.add_argument('--workers', type=int, help="Jumlah proses render (default: jumlah CPU)")
+    parser.add_argument('--no-segment-cache', action='store_true',
+                        help="Render semua bagian tanpa cache segmen")
+    parser.add_argument('--audio', help="File audio background (default: music.mp3)")
+    parser.add_argument('--renditions',
+                        help=f"Varian output tambahan dipisah koma dari render yang sama "
+                             f"({', '.join(RENDITIONS)}; default: ATOM_RENDITIONS)")
+    parser.add_argument('--preview', metavar='GIF',
+                        help="Buat preview GIF dan poster per bagian dari render yang sama "
+                             "(mis. preview.gif; juga dengan worker dan cache segmen)")
+    args = parser.parse_args(argv)
+
+    render(args.scene, output=args.output, quality=args.quality, backend=args.backend,
+           workers=args.workers, segment_cache=False if args.no_segment_cache else None,
+           audio=args.audio, renditions=args.renditions, preview=args.preview)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+# API render: memilih scene, profil dan backend lalu merender video; modul berat dimuat saat dipakai
+import importlib  # Untuk memuat modul scene
+import os  # Untuk environment profil dan backend
+import sys  # Untuk modul scene yang sudah dimuat
+
+# Nama pendek scene -> modul (nama modul lengkap juga diterima)
+SCENES = {
+    'atom': f"{__package__}.atom",    # Evolusi model atom: mesh mplot3d dan teks 3D
+    'atom2': f"{__package__}.atom2",  # Versi partikel dengan glow dan overlay teks 2D
+}
+
+
+def scene_module(name):
+    """Nama modul scene dari nama pendek ('atom', 'atom2') atau nama modul lengkap"""
+    return SCENES.get(name, name)
+
+
+def load_scene(name, quality=None, backend=None):
+    """Memuat modul scene dengan profil dan backend tertentu
+
+    Scene membaca ATOM_QUALITY dan ATOM_BACKEND saat di-import, jadi pilihan diset di
+    environment (juga diwarisi worker) dan scene yang sudah dimuat dengan pilihan lain dimuat ulang."""
+    from .impostor_scene import BACKEND_ENV, load_backend
+    from .quality import QUALITY_ENV, load_profile
+
+    if quality is not None:
+        os.environ[QUALITY_ENV] = load_profile(quality)['name']
+    if backend is not None:
+        os.environ[BACKEND_ENV] = load_backend(backend)
+    module_name = scene_module(name)
+    module = sys.modules.get(module_name)
+    if module is None:
+        return importlib.import_module(module_name)
+    if module.QUALITY['name'] != load_profile()['name'] or module.RENDER_BACKEND != load_backend():
+        module = importlib.reload(module)
+    return module
+
+
+def render(scene='atom', output=None, quality=None, backend=None, workers=None,
+           segment_cache=None, audio=None, renditions=None, preview=None):
+    """Render scene ke file video (dengan audio) dan mengembalikan path output
+
+    Parameter None memakai konstanta scene: OUTPUT_FILE, RENDER_WORKERS, SEGMENT_CACHE dan
+    AUDIO_FILE. Worker paralel mewarisi modul scene yang sudah dimuat di sini. renditions
+    (nama dari RENDITIONS, default ATOM_RENDITIONS) di-encode dari frame yang sama ke file
+    <output>_<nama>.mp4. preview (path .gif) membuat preview GIF dan poster per bagian dari
+    frame yang sama dengan video: render serial memakai satu tap, render paralel dan segmen
+    menyimpan sampel per potongan lalu menggabungkannya sesuai urutan frame."""
+    module = load_scene(scene, quality, backend)
+
+    from .audio_cache import prepare_audio
+    from .parallel_render import render_parallel
+    from .preview_tap import PreviewTap
+    from .quality import encoder_args, video_bitrate
+    from .renditions import rendition_paths, resolve_renditions
+    from .segment_cache import render_sections
+    from .telemetry import RenderTelemetry
+    from .video_writer import RawVideoWriter, render_frames
+
+    output = output or module.OUTPUT_FILE
+    workers = module.RENDER_WORKERS if workers is None else workers
+    segment_cache = module.SEGMENT_CACHE if segment_cache is None else segment_cache
+    size = (module.VIDEO_WIDTH, module.VIDEO_HEIGHT)
+
+    # Jendela audio sepanjang durasi video (dari cache jika sudah pernah diproses)
+    audio_path = prepare_audio(audio or module.AUDIO_FILE, module.VIDEO_DURATION)
+    # Argumen encoder dan bitrate sesuai profil kualitas
+    extra_args = encoder_args(module.QUALITY)
+    bitrate = video_bitrate(module.VIDEO_BITRATE, module.QUALITY)
+    # Varian output (skala, crop, bitrate) dari render yang sama
+    renditions = resolve_renditions(renditions, size, module.QUALITY, module.VIDEO_BITRATE)
+
+    tap = None
+    if preview:
+        # Sampel frame GIF dan poster diambil dari buffer yang sama dengan encode utama
+        tap = PreviewTap(preview, module.TOTAL_FRAMES, module.TABLE.spans,
+                         [clip.name for clip in module.TIMELINE.clips])
+
+    # Video dan audio ditulis langsung ke file output dalam satu encode
+    try:
+        if segment_cache:
+            # Render per bagian: segmen yang tidak berubah diambil dari cache lalu digabung
+            render_sections(module.__name__, output, module.TOTAL_FRAMES, module.VIDEO_FPS,
+                            workers, size, bitrate=bitrate, extra_args=extra_args,
+                            audio_path=audio_path, renditions=renditions, preview=tap)
+        elif workers > 1:
+            # Render paralel: setiap worker merender potongan frame lalu digabung berurutan
+            render_parallel(module.__name__, output, module.TOTAL_FRAMES, module.VIDEO_FPS,
+                            workers, size, bitrate=bitrate, extra_args=extra_args,
+                            audio_path=audio_path, renditions=renditions, preview=tap)
+        else:
+            # Render serial: buffer RGBA setiap frame dikirim langsung ke FFmpeg
+            with RawVideoWriter(output, module.VIDEO_FPS, size, bitrate=bitrate,
+                                extra_args=extra_args, audio_path=audio_path,
+                                renditions=renditions) as writer:
+                render_frames(module.fig, module.update, range(module.TOTAL_FRAMES), writer,
+                              getattr(module, 'post_process', None),
+                              RenderTelemetry.from_env(module.TABLE, module.TIMELINE, module.scene),
+                              tap)
+    except BaseException:
+        if tap is not None:
+            tap.discard()
+        raise
+    if tap is not None:
+        tap.close()
+
+    print(f"{module.TITLE} complete! Saved to {', '.join(rendition_paths(output, renditions))}")
+    return output
@@ -0,0 +1,290 @@
+# Scene model atom (Dalton, Thomson, Rutherford, Bohr); dirender lewat animasi_atom.render
+
+# Import library numpy untuk komputasi numerik
+import numpy as np
+
+# Import modul os untuk jumlah CPU
+import os
+
+# Import Figure dan canvas Agg (tanpa pyplot: tidak ada backend GUI yang dimuat)
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Import scene retained sesuai backend render (mplot3d atau sphere impostor NumPy)
+from .impostor_scene import create_scene, load_backend
+
+# Import cache geometri untuk jalur orbit
+from .geometry_cache import circle_orbit
+
+# Import teks bertahap dari raster string penuh yang di-cache
+from .glyph_cache import reveal_text
+
+# Import profil kualitas render (draft / preview / production)
+from . import quality
+
+# Import timeline keyframe (clip, kurva, interval show/hide)
+from .timeline import Clip, Interval, Timeline, ramp, stagger
+
+# Konfigurasi video vertikal dengan rasio 9:16
+QUALITY = quality.load_profile()  # Profil kualitas (environment ATOM_QUALITY, default production)
+VIDEO_DURATION = 120  # Durasi video dalam detik (30 detik per model atom)
+VIDEO_FPS = quality.render_fps(30, QUALITY)  # Frame rate video (30 fps, dikurangi frame stride)
+TOTAL_FRAMES = VIDEO_DURATION * VIDEO_FPS  # Total frame video
+VIDEO_WIDTH, VIDEO_HEIGHT = quality.scaled_size(1080, 1920, QUALITY)  # Ukuran video (format vertikal)
+VIDEO_DPI = 100 * QUALITY['scale']  # DPI figure: ukuran inci tetap, resolusi mengikuti profil
+PARTICLE_RESOLUTION = quality.mesh_resolution(20, QUALITY)  # Resolusi mesh sphere partikel
+OUTPUT_FILE = quality.output_path("atomic_models_animation.mp4", QUALITY)  # Nama file output
+VIDEO_BITRATE = 10000  # Bitrate video production (kbps), diskalakan per profil
+TITLE = "Atomic models animation"  # Nama animasi untuk pesan selesai render
+AUDIO_FILE = "music.mp3"  # File audio background
+RENDER_WORKERS = os.cpu_count() or 1  # Jumlah proses render (1 = render serial)
+SEGMENT_CACHE = True  # Render ulang hanya bagian yang berubah
+RENDER_BACKEND = load_backend()  # Backend render (environment ATOM_BACKEND: mplot3d atau impostor)
+
+# Warna modern untuk visualisasi
+COLORS = {
+    'background': '#121212',  # Warna latar belakang gelap
+    'text': '#FFFFFF',        # Warna teks putih
+    'electron': '#4285F4',    # Warna elektron (biru)
+    'proton': '#EA4335',      # Warna proton (merah)
+    'neutron': '#34A853',     # Warna neutron (hijau)
+    'nucleus': '#FBBC05',     # Warna nukleus (kuning)
+    'orbit': '#9C27B0',       # Warna orbit (ungu)
+    'highlight': '#00ACC1'    # Warna highlight (cyan)
+}
+
+# Membuat figure dengan orientasi vertikal (rasio 9:16)
+fig = Figure(figsize=(10.8, 19.2), dpi=VIDEO_DPI)  # Ukuran dalam inci
+FigureCanvasAgg(fig)  # Canvas offscreen untuk render frame
+ax = fig.add_subplot(111, projection='3d')  # Subplot 3D
+
+# Set batas sumbu 3D
+ax.set_xlim(-5, 5)
+ax.set_ylim(-5, 5)
+ax.set_zlim(-5, 5)
+
+# Menghilangkan sumbu
+ax.set_axis_off()
+
+# Set warna latar belakang
+ax.set_facecolor(COLORS['background'])
+fig.set_facecolor(COLORS['background'])
+
+# Fungsi untuk membuat orbit 3D
+def create_orbit(radius, color, alpha=0.3, resolution=100):
+    """Membuat orbit lingkaran 2D di ruang 3D"""
+    # Jalur orbit diambil dari cache (parameter tidak berubah dalam satu bagian)
+    return circle_orbit(radius, resolution)
+
+# Teks judul animasi
+title = ax.text(0, 0, 6, "", color=COLORS['text'], 
+                ha='center', va='center', fontsize=36, fontweight='bold')
+
+# Teks deskripsi model atom (efek mesin ketik digambar dari raster string penuh)
+description = reveal_text(ax.text(0, -4.5, 5, "", color=COLORS['text'], 
+                                  ha='center', va='center', fontsize=24, wrap=True))
+
+# Scene retained: artist dibuat sekali per bagian, bukan setiap frame
+scene = create_scene(ax, RENDER_BACKEND, QUALITY['lod_tolerance'])
+
+# Model Atom Dalton (1803)
+DALTON_ATOMS = [(-2, -1, 0, 0.8, COLORS['proton']),
+                (2, 1, 0, 1.0, COLORS['electron']),
+                (0, -2, 1, 0.6, COLORS['neutron'])]
+
+def build_dalton():
+    """Setup artist model Dalton"""
+    for i, (x, y, z, size, color) in enumerate(DALTON_ATOMS):
+        # Sphere masuk ke batch partikel (resolusi mesh mengikuti ukuran di layar)
+        scene.add_particle(f"atom{i}", x, y, z, size, color, resolution=PARTICLE_RESOLUTION)
+        
+        # Label elemen
+        scene.add_text(f"label{i}", x, y, z + size + 0.3, f"Element {i+1}", 
+                       color=COLORS['text'], ha='center', fontsize=12)
+
+def compose_dalton(clip):
+    """Keyframe model Dalton (waktu = progress dalam clip, 0-1)"""
+    clip.add(title.set_text, "Dalton's Atomic Model (1803)")
+    
+    # Deskripsi model Dalton
+    desc_text = "John Dalton proposed that:\n" \
+               "1. Matter is made of indivisible atoms\n" \
+               "2. Atoms of same element are identical\n" \
+               "3. Compounds form from atom combinations"
+    clip.reveal(description, desc_text, ramp(0, 1/3))
+    
+    # Visualisasi model Dalton sebagai bola pejal
+    for i in range(len(DALTON_ATOMS)):
+        clip.add(scene.particle, f"atom{i}", visible=Interval(0.2), alpha=ramp(0.2, 0.2 + 1/1.5))
+        clip.add(scene.text, f"label{i}", visible=Interval(0.5))
+
+# Model Atom Thomson (1904) - Plum Pudding
+THOMSON_ELECTRONS = 9  # Jumlah elektron maksimum (int(section_progress * 10))
+
+# Posisi acak elektron dalam bola (theta, phi, r), urutan acak sama dengan seed 42
+THOMSON_PATHS = np.random.RandomState(42).uniform([0, 0, 1], [2*np.pi, np.pi, 2.8], 
+                                                  size=(THOMSON_ELECTRONS, 3))
+
+def build_thomson():
+    """Setup artist model Thomson"""
+    # Bola positif besar (pudding)
+    scene.add_particle("pudding", 0, 0, 0, 3, COLORS['nucleus'], resolution=PARTICLE_RESOLUTION)
+    
+    # Elektron kecil tersebar acak (plum)
+    theta, phi, r = THOMSON_PATHS.T
+    x = r * np.sin(phi) * np.cos(theta)  # Koordinat elektron
+    y = r * np.sin(phi) * np.sin(theta)
+    z = r * np.cos(phi)
+    for i in range(THOMSON_ELECTRONS):
+        scene.add_particle(f"electron{i}", x[i], y[i], z[i], 0.2, COLORS['electron'], 
+                           resolution=PARTICLE_RESOLUTION)
+
+def compose_thomson(clip):
+    """Keyframe model Thomson"""
+    clip.add(title.set_text, "Thomson's Plum Pudding Model (1904)")
+    
+    # Deskripsi model Thomson
+    desc_text = "J.J. Thomson discovered electrons and proposed:\n" \
+               "1. Atoms contain negatively charged electrons\n" \
+               "2. Electrons are embedded in a positively charged 'pudding'\n" \
+               "3. Overall atom is electrically neutral"
+    clip.reveal(description, desc_text, ramp(0, 1/3))
+    
+    clip.add(scene.particle, "pudding", visible=Interval(0.1), alpha=0.3)  # Pudding transparan
+    
+    # Elektron muncul satu per satu (10 per clip) setelah 0.3
+    for i in range(THOMSON_ELECTRONS):
+        clip.add(scene.particle, f"electron{i}", visible=stagger(i, 0.3, 10))
+
+# Model Atom Rutherford (1911) - Nuklir
+RUTHERFORD_ORBITS = 3  # Jumlah orbit
+
+def build_rutherford():
+    """Setup artist model Rutherford"""
+    # Inti atom kecil
+    scene.add_particle("nucleus", 0, 0, 0, 0.5, COLORS['nucleus'], resolution=PARTICLE_RESOLUTION)
+    
+    for i in range(RUTHERFORD_ORBITS):
+        radius = 1.5 + i * 1.0  # Radius orbit bertambah
+        x_o, y_o, z_o = create_orbit(radius, COLORS['orbit'], 0.2)
+        scene.add_line(f"orbit{i}", x_o, y_o, z_o, color=COLORS['orbit'], alpha=0.5, linestyle='--')
+        
+        # Elektron dibuat di pusat, lalu digeser per frame
+        scene.add_particle(f"electron{i}", 0, 0, 0, 0.2, COLORS['electron'], 
+                           resolution=PARTICLE_RESOLUTION)
+
+def circular_motion(radius, turns, phase):
+    """Gerak melingkar: turns putaran per clip, dimulai dari fase (dalam putaran)"""
+    def path(t, progress):
+        angle = (t * turns + phase) * 2 * np.pi  # Sudut orbit
+        return np.stack([radius * np.cos(angle), radius * np.sin(angle), np.zeros_like(angle)], axis=-1)
+    return path
+
+def compose_rutherford(clip):
+    """Keyframe model Rutherford"""
+    clip.add(title.set_text, "Rutherford's Nuclear Model (1911)")
+    
+    # Deskripsi model Rutherford
+    desc_text = "Ernest Rutherford's gold foil experiment showed:\n" \
+               "1. Atom has a tiny, dense nucleus\n" \
+               "2. Electrons orbit the nucleus\n" \
+               "3. Most of atom is empty space"
+    clip.reveal(description, desc_text, ramp(0, 1/3))
+    
+    clip.add(scene.particle, "nucleus", visible=Interval(0.1))
+    
+    for i in range(RUTHERFORD_ORBITS):
+        # Gambar orbit secara bertahap
+        clip.add(scene.line, f"orbit{i}", visible=Interval(0.3 + i*0.2))
+        
+        # Elektron yang mengorbit (10 putaran per clip)
+        clip.add(scene.particle, f"electron{i}", visible=Interval(0.4 + i*0.2), 
+                 offset=circular_motion(1.5 + i * 1.0, 10, i))
+
+# Model Atom Bohr (1913) - Tingkat Energi
+BOHR_ORBITS = 3
+
+def build_bohr():
+    """Setup artist model Bohr"""
+    # Inti atom
+    scene.add_particle("nucleus", 0, 0, 0, 0.5, COLORS['nucleus'], resolution=PARTICLE_RESOLUTION)
+    
+    # Orbit diskrit (tingkat energi)
+    for i in range(BOHR_ORBITS):
+        radius = 1.0 + i * 1.5  # Radius orbit
+        x_o, y_o, z_o = create_orbit(radius, COLORS['orbit'], 0.3)
+        scene.add_line(f"orbit{i}", x_o, y_o, z_o, color=COLORS['orbit'], alpha=0.7, linewidth=2)
+        
+        # Label tingkat energi
+        scene.add_text(f"level{i}", radius, 0, 0.3, f"n={i+1}", color=COLORS['text'], ha='center')
+    
+    # Elektron yang berpindah tingkat energi
+    scene.add_particle("electron", 0, 0, 0, 0.2, COLORS['electron'], resolution=PARTICLE_RESOLUTION)
+    
+    # Emisi foton
+    scene.add_line("photon", [0, 0], [0, 0], [0, 3], color=COLORS['highlight'], linewidth=3)
+    scene.add_text("photon_label", 0, 0, 3.5, "Photon emitted", color=COLORS['highlight'], 
+                   ha='center', fontsize=16)
+
+def bohr_electron_path(t, progress):
+    """Posisi elektron Bohr: n=1, transisi ke n=2, lalu n=2 (array per frame)"""
+    phases = [t < 0.7, t < 0.8]
+    level = np.select(phases, [0, (t - 0.7) * 10], 1)
+    angle = np.select(phases, [t * 10 * 2 * np.pi, 0], (t - 0.8) * 5 * 2 * np.pi)
+    radius = 1.0 + level * 1.5
+    return np.stack([radius * np.cos(angle), radius * np.sin(angle), np.zeros_like(angle)], axis=-1)
+
+def compose_bohr(clip):
+    """Keyframe model Bohr"""
+    clip.add(title.set_text, "Bohr's Quantum Model (1913)")
+    
+    # Deskripsi model Bohr
+    desc_text = "Niels Bohr introduced quantum theory to atoms:\n" \
+               "1. Electrons move in fixed orbits (energy levels)\n" \
+               "2. Orbits have quantized energy\n" \
+               "3. Light is emitted when electrons jump levels"
+    clip.reveal(description, desc_text, ramp(0, 1/3))
+    
+    clip.add(scene.particle, "nucleus", visible=Interval(0.1))
+    
+    # Gambar orbit dan label secara bertahap
+    for i in range(BOHR_ORBITS):
+        clip.add(scene.line, f"orbit{i}", visible=Interval(0.2 + i*0.2))
+        clip.add(scene.text, f"level{i}", visible=Interval(0.3 + i*0.2))
+    
+    # Elektron berpindah tingkat energi
+    clip.add(scene.particle, "electron", visible=Interval(0.5), offset=bohr_electron_path)
+    
+    # Animasi emisi foton saat transisi
+    clip.add(scene.line, "photon", visible=Interval(0.7, 0.75), alpha=ramp(0.7, 0.9))
+    clip.add(scene.text, "photon_label", visible=Interval(0.7, 0.75))
+
+# Track global: rotasi kamera sepanjang video
+def compose_camera(timeline):
+    """Keyframe kamera (waktu = progress global, 0-1)"""
+    timeline.add(ax.view_init, 
+                 elev=lambda t, progress: 15 + 10 * np.sin(progress * np.pi/2),  # Elevasi kamera
+                 azim=ramp(0, 1, 0, 360))                                      # Azimuth kamera
+
+# Timeline: setiap model atom adalah clip (nama, durasi dalam detik, setup artist, keyframe)
+TIMELINE = Timeline([Clip("Dalton", 30, build_dalton, compose_dalton),
+                     Clip("Thomson", 30, build_thomson, compose_thomson),
+                     Clip("Rutherford", 30, build_rutherford, compose_rutherford),
+                     Clip("Bohr", 30, build_bohr, compose_bohr)],
+                    compose=compose_camera)
+
+# Semua keyframe disampling sekali sebelum render (setiap worker membangun tabel identik)
+TABLE = TIMELINE.table(TOTAL_FRAMES)
+
+# Fungsi update untuk animasi
+def update(frame):
+    """Update frame animasi: hanya mengindeks tabel per frame"""
+    # Setup artist hanya saat bagian berganti, lalu terapkan baris tabel
+    section = TABLE.section[frame]
+    scene.enter(section, TIMELINE.clips[section].build)
+    TABLE.apply(frame)
+    
+    # Semua partikel frame ini disusun sebagai satu koleksi (resolusi LOD dipilih di sini)
+    scene.commit()
+    
+    return []  # Return empty list karena tidak menggunakan blit
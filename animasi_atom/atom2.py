@@ -0,0 +1,329 @@
+# Scene model atom dengan efek partikel dan glow; dirender lewat animasi_atom.render
+import numpy as np  # Untuk operasi matematika dan array
+import os  # Untuk jumlah CPU
+from matplotlib.figure import Figure  # Figure tanpa pyplot (tidak ada backend GUI yang dimuat)
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # Canvas offscreen
+from matplotlib.colors import LinearSegmentedColormap  # Untuk gradien warna
+from .impostor_scene import create_scene, load_backend  # Untuk scene retained sesuai backend render
+from .geometry_cache import elliptical_orbit  # Untuk cache orbit
+from .text_overlay import TextOverlay  # Untuk overlay teks 2D ter-cache
+from .glow import ScreenGlow  # Untuk glow layar (post-process)
+from . import quality  # Untuk profil kualitas render
+from .timeline import Clip, Interval, Keyframes, Timeline, ramp, stagger  # Untuk timeline keyframe
+
+# Konfigurasi video vertikal 9:16
+QUALITY = quality.load_profile()  # Profil kualitas (ATOM_QUALITY=draft/preview/production)
+VIDEO_DURATION = 120  # Durasi video dalam detik (30 detik per model atom)
+VIDEO_FPS = quality.render_fps(30, QUALITY)  # Frame rate video
+TOTAL_FRAMES = VIDEO_DURATION * VIDEO_FPS  # Total frame video
+VIDEO_WIDTH, VIDEO_HEIGHT = quality.scaled_size(1080, 1920, QUALITY)  # Ukuran video vertikal
+VIDEO_DPI = 100 * QUALITY['scale']  # Resolusi figure mengikuti profil
+PARTICLE_RESOLUTION = quality.mesh_resolution(40, QUALITY)  # Resolusi mesh partikel
+OUTPUT_FILE = quality.output_path("atomic_models_animation_enhanced.mp4", QUALITY)  # Nama file output
+VIDEO_BITRATE = 12000  # Bitrate video production (kbps), diskalakan per profil
+TITLE = "Enhanced atomic models animation"  # Nama animasi untuk pesan selesai render
+AUDIO_FILE = "music.mp3"  # File audio background
+RENDER_WORKERS = os.cpu_count() or 1  # Jumlah proses render (1 = render serial)
+SEGMENT_CACHE = True  # Segmen per bagian di-cache, bagian yang tidak berubah tidak dirender ulang
+RENDER_BACKEND = load_backend()  # Backend render: mplot3d atau impostor (ATOM_BACKEND)
+
+# Warna modern dengan transparansi
+COLORS = {
+    'background': '#121212',  # Warna background gelap
+    'text': '#FFFFFF',  # Warna teks putih
+    'electron': '#4285F4',  # Biru untuk elektron
+    'proton': '#EA4335',    # Merah untuk proton
+    'neutron': '#34A853',   # Hijau untuk neutron
+    'nucleus': '#FBBC05',   # Kuning untuk inti atom
+    'orbit': '#9C27B0',     # Ungu untuk orbit
+    'highlight': '#00ACC1', # Cyan untuk highlight
+    'glow': '#FFFFFF'       # Putih untuk efek glow
+}
+
+# Kekuatan glow layar per warna objek (pengganti lapisan sphere glow putih)
+GLOW_COLORS = {
+    COLORS['nucleus']: 0.7,
+    COLORS['electron']: 0.8,
+    COLORS['proton']: 0.7,
+    COLORS['neutron']: 0.7,
+}
+
+# Fungsi untuk membuat gradien warna partikel
+def create_particle_cmap(base_color):
+    return LinearSegmentedColormap.from_list('particle_cmap', 
+                                           ['#FFFFFF', base_color, '#000000'])
+
+# Buat figure dengan orientasi vertikal
+fig = Figure(figsize=(10.8, 19.2), dpi=VIDEO_DPI)  # Rasio 9:16 (1080x1920 pada production)
+FigureCanvasAgg(fig)  # Canvas offscreen untuk render frame
+ax = fig.add_subplot(111, projection='3d')  # Subplot 3D
+ax.set_xlim(-8, 8)  # Batas sumbu x
+ax.set_ylim(-8, 8)  # Batas sumbu y
+ax.set_zlim(-8, 8)  # Batas sumbu z
+ax.set_axis_off()  # Matikan sumbu
+ax.set_facecolor(COLORS['background'])  # Warna background
+fig.set_facecolor(COLORS['background'])  # Warna background figure
+
+# Fungsi untuk membuat orbit 3D elips
+def create_elliptical_orbit(a, b, c, color, alpha=0.3, resolution=100, z_rotate=0):
+    # Orbit elips (termasuk rotasi) diambil dari cache
+    return elliptical_orbit(a, b, c, resolution, z_rotate)
+
+# Teks judul dan deskripsi: overlay 2D yang dirasterisasi sekali per state teks
+overlay = TextOverlay((VIDEO_WIDTH, VIDEO_HEIGHT), dpi=VIDEO_DPI)
+
+title = overlay.add_text(0.5, 0.92, "", color=COLORS['text'],
+                         ha='center', va='center', fontsize=48, fontweight='bold',
+                         fontfamily='sans-serif')
+
+subtitle = overlay.add_text(0.5, 0.88, "", color=COLORS['highlight'],
+                            ha='center', va='center', fontsize=32, fontweight='normal',
+                            fontfamily='sans-serif')
+
+description = overlay.add_text(0.5, 0.12, "", color=COLORS['text'],
+                               ha='center', va='center', fontsize=30, wrap=True,
+                               fontfamily='sans-serif', bbox=dict(facecolor='#12121280', edgecolor='none', pad=10))
+
+# Glow dihitung dari frame yang sudah digambar (profil draft tanpa glow)
+glow = ScreenGlow(GLOW_COLORS, COLORS['background'], COLORS['glow'], QUALITY['scale']) \
+    if QUALITY['glow'] else None
+
+# Glow lalu overlay teks dikomposit ke frame yang sudah digambar (dipanggil oleh loop render)
+def post_process(frame):
+    if glow is not None:
+        glow.apply(frame)
+    overlay.composite(frame)
+
+# Scene retained: artist dibuat sekali per bagian, bukan setiap frame
+scene = create_scene(ax, RENDER_BACKEND, QUALITY['lod_tolerance'])
+
+# Transisi antar model: fade in 10% awal dan fade out 10% akhir setiap clip
+TRANSITION = Keyframes([(0, 0), (0.1, 1), (0.9, 1), (1, 0)])
+
+# Track teks clip: judul tetap, deskripsi muncul bertahap
+def compose_section_text(clip, title_text, subtitle_text, desc_text):
+    clip.add(title.set_text, title_text)
+    clip.add(subtitle.set_text, subtitle_text)
+    clip.add(title.set_alpha, alpha=1)
+    clip.add(subtitle.set_alpha, alpha=1)
+    clip.add(description.set_alpha, alpha=ramp(0, 1/3))
+    clip.reveal(description, desc_text, ramp(0, 1/3))
+
+# Model Atom Dalton (1803)
+DALTON_ATOMS = [
+    (-3, -2, 0, 1.6, COLORS['proton'], 0, 0),
+    (3, 2, 0, 2.0, COLORS['electron'], np.pi/4, np.pi/4),
+    (0, -3, 2, 1.2, COLORS['neutron'], np.pi/3, -np.pi/3)
+]
+
+def build_dalton():
+    for i, (x, y, z, size, color, rot_x, rot_y) in enumerate(DALTON_ATOMS):
+        # Partikel dengan gradien warna (glow ditambahkan di post-process)
+        scene.add_particle(f"atom{i}", x, y, z, size, color, cmap=create_particle_cmap(color), 
+                           resolution=PARTICLE_RESOLUTION)
+        
+        # Label elemen
+        scene.add_text(f"label{i}", x, y, z + size + 0.5, f"Element {i+1}", 
+                       color=COLORS['text'], ha='center', fontsize=18)
+
+def compose_dalton(clip):
+    clip.add(title.set_text, "Dalton's Atomic Model")
+    clip.add(subtitle.set_text, "(1803)")
+    
+    desc_text = "John Dalton proposed that:\n" \
+               "• Matter is made of indivisible atoms\n" \
+               "• Atoms of same element are identical\n" \
+               "• Compounds form from atom combinations"
+    
+    # Animasikan teks: judul muncul dulu, deskripsi setelah 0.3
+    title_alpha = Keyframes([(0, 0), (0.3, 0.9), (0.3, 1)])
+    clip.add(title.set_alpha, alpha=title_alpha)
+    clip.add(subtitle.set_alpha, alpha=title_alpha)
+    clip.add(description.set_alpha, alpha=ramp(0.3, 0.8))
+    clip.reveal(description, desc_text, ramp(0.3, 0.3 + 1/3))
+    
+    # Visualisasi model Dalton
+    for i in range(len(DALTON_ATOMS)):
+        clip.add(scene.particle, f"atom{i}", visible=Interval(0.2), alpha=TRANSITION*0.9)
+        clip.add(scene.text, f"label{i}", visible=Interval(0.5), alpha=ramp(0.5, 1.0))
+
+# Model Atom Thomson (1904)
+THOMSON_ELECTRONS = 12  # Jumlah elektron maksimum
+
+# (theta, phi, r) dasar setiap elektron, urutan acak sama dengan seed 42
+THOMSON_PATHS = np.random.RandomState(42).uniform([0, 0, 2], [2*np.pi, np.pi, 4.5], 
+                                                  size=(THOMSON_ELECTRONS, 3))
+
+def build_thomson():
+    # Bola positif besar
+    scene.add_particle("pudding", 0, 0, 0, 5, COLORS['nucleus'], resolution=PARTICLE_RESOLUTION)
+    
+    # Elektron dibuat di pusat, lalu digeser per frame
+    for i in range(THOMSON_ELECTRONS):
+        scene.add_particle(f"electron{i}", 0, 0, 0, 0.4, COLORS['electron'], 
+                           resolution=PARTICLE_RESOLUTION)
+
+# Gerak acak elektron di dalam pudding (berdasarkan progress global)
+def thomson_motion(i):
+    theta, phi, r = THOMSON_PATHS[i]
+    def path(t, progress):
+        move_factor = np.sin(progress*5 + i) * 0.5
+        x = r * np.sin(phi + move_factor) * np.cos(theta + progress*3)
+        y = r * np.sin(phi + move_factor) * np.sin(theta + progress*3)
+        z = r * np.cos(phi + move_factor)
+        return np.stack([x, y, z], axis=-1)
+    return path
+
+def compose_thomson(clip):
+    desc_text = "J.J. Thomson discovered electrons and proposed:\n" \
+               "• Atoms contain negatively charged electrons\n" \
+               "• Electrons are embedded in positive 'pudding'\n" \
+               "• Overall atom is electrically neutral"
+    compose_section_text(clip, "Thomson's Plum Pudding Model", "(1904)", desc_text)
+    
+    # Visualisasi model Thomson
+    clip.add(scene.particle, "pudding", visible=Interval(0.1), alpha=TRANSITION*0.3)
+    
+    # Elektron muncul satu per satu (20 per clip) setelah 0.2, lalu bergerak acak
+    for i in range(THOMSON_ELECTRONS):
+        clip.add(scene.particle, f"electron{i}", visible=stagger(i, 0.2, 20), 
+                 alpha=TRANSITION*0.9, offset=thomson_motion(i))
+
+# Model Atom Rutherford (1911)
+RUTHERFORD_ORBITS = 3
+
+def build_rutherford():
+    # Inti atom kecil
+    scene.add_particle("nucleus", 0, 0, 0, 1.0, COLORS['nucleus'], resolution=PARTICLE_RESOLUTION)
+    
+    # Orbit elektron elips 3D
+    for i in range(RUTHERFORD_ORBITS):
+        a = 2.5 + i * 1.5
+        b = 2.0 + i * 1.2
+        c = 0.8 + i * 0.5
+        
+        # Buat orbit dengan rotasi unik
+        x_o, y_o, z_o = create_elliptical_orbit(
+            a, b, c, COLORS['orbit'], 0.3, 100, z_rotate=i*np.pi/6)
+        scene.add_line(f"orbit{i}", x_o, y_o, z_o, color=COLORS['orbit'], 
+                       linestyle='--', linewidth=2.0)
+        
+        scene.add_particle(f"electron{i}", 0, 0, 0, 0.4, COLORS['electron'], 
+                           resolution=PARTICLE_RESOLUTION)
+
+# Gerak elips 3D: turns putaran sepanjang video (berdasarkan progress global)
+def elliptical_motion(a, b, c, turns, phase):
+    def path(t, progress):
+        angle = (progress * turns + phase) * 2 * np.pi
+        return np.stack([a * np.cos(angle), b * np.sin(angle), c * np.sin(angle/2)], axis=-1)
+    return path
+
+def compose_rutherford(clip):
+    desc_text = "Rutherford's gold foil experiment showed:\n" \
+               "• Atom has a tiny, dense nucleus\n" \
+               "• Electrons orbit the nucleus\n" \
+               "• Most of atom is empty space"
+    compose_section_text(clip, "Rutherford's Nuclear Model", "(1911)", desc_text)
+    
+    # Visualisasi model Rutherford
+    clip.add(scene.particle, "nucleus", visible=Interval(0.1), alpha=TRANSITION*0.9)
+    
+    for i in range(RUTHERFORD_ORBITS):
+        a = 2.5 + i * 1.5
+        b = 2.0 + i * 1.2
+        c = 0.8 + i * 0.5
+        
+        # Gambar orbit bertahap
+        clip.add(scene.line, f"orbit{i}", visible=Interval(0.2 + i*0.15), alpha=TRANSITION*0.5)
+        
+        # Elektron yang mengorbit
+        clip.add(scene.particle, f"electron{i}", visible=Interval(0.3 + i*0.15), 
+                 alpha=TRANSITION*0.9, offset=elliptical_motion(a, b, c, 10, i))
+
+# Model Atom Bohr (1913)
+BOHR_ORBITS = 3
+
+def build_bohr():
+    # Inti atom dengan glow
+    scene.add_particle("nucleus", 0, 0, 0, 1.0, COLORS['nucleus'], resolution=PARTICLE_RESOLUTION)
+    
+    # Orbit diskrit (tingkat energi)
+    for i in range(BOHR_ORBITS):
+        radius = 1.5 + i * 2.0
+        x_o, y_o, z_o = create_elliptical_orbit(
+            radius, radius*0.9, radius*0.3, COLORS['orbit'], 0.3, 100, z_rotate=i*np.pi/8)
+        scene.add_line(f"orbit{i}", x_o, y_o, z_o, color=COLORS['orbit'], linewidth=2.5)
+        
+        # Label tingkat energi
+        scene.add_text(f"level{i}", radius, 0, 0.5, f"n={i+1}", color=COLORS['text'], 
+                       ha='center', fontsize=18)
+    
+    # Elektron yang berpindah tingkat energi
+    scene.add_particle("electron", 0, 0, 0, 0.5, COLORS['electron'], resolution=PARTICLE_RESOLUTION)
+    
+    # Panah foton saat transisi
+    scene.add_line("photon", [0, 0], [0, 0], [0, 4], color=COLORS['highlight'], linewidth=4)
+    scene.add_text("photon_label", 0, 0, 5, "Photon emitted", color=COLORS['highlight'], 
+                   ha='center', fontsize=20)
+
+# Posisi elektron Bohr: n=1, transisi ke n=2 (naik vertikal), lalu n=2
+def bohr_electron_path(t, progress):
+    phases = [t < 0.6, t < 0.7]
+    radius = Keyframes([(0.6, 1.5), (0.7, 3.5)])(t)
+    angle = np.select(phases, [progress * 10 * 2 * np.pi] * 2, (progress - 0.1) * 5 * 2 * np.pi)
+    z_e = Keyframes([(0.6, 0), (0.7, 1.5), (0.7, 0)])(t)  # Gerakan vertikal saat transisi
+    return np.stack([radius * np.cos(angle), radius * np.sin(angle), z_e], axis=-1)
+
+# Panah foton dari posisi elektron: data garis (frame, 3, 2)
+def photon_arrow(t, progress):
+    start = bohr_electron_path(t, progress)
+    return np.stack([start, start + [0, 0, 4]], axis=-1)
+
+def compose_bohr(clip):
+    desc_text = "Niels Bohr introduced quantum theory:\n" \
+               "• Electrons move in fixed orbits (energy levels)\n" \
+               "• Orbits have quantized energy\n" \
+               "• Light is emitted when electrons jump levels"
+    compose_section_text(clip, "Bohr's Quantum Model", "(1913)", desc_text)
+    
+    # Visualisasi model Bohr
+    clip.add(scene.particle, "nucleus", visible=Interval(0.1), alpha=TRANSITION*0.9)
+    
+    for i in range(BOHR_ORBITS):
+        clip.add(scene.line, f"orbit{i}", visible=Interval(0.2 + i*0.15), alpha=TRANSITION*0.7)
+        clip.add(scene.text, f"level{i}", visible=Interval(0.3 + i*0.15), alpha=TRANSITION)
+    
+    clip.add(scene.particle, "electron", visible=Interval(0.5), alpha=TRANSITION*0.9, 
+             offset=bohr_electron_path)
+    
+    # Panah foton saat transisi
+    photon = Interval(0.6, 0.65)
+    clip.add(scene.line, "photon", visible=photon, data=photon_arrow, alpha=ramp(0.6, 0.7))
+    clip.add(scene.text, "photon_label", visible=photon, alpha=ramp(0.6, 0.7), 
+             position=lambda t, progress: bohr_electron_path(t, progress) + [0, 0, 5])
+
+# Track global: rotasi kamera dengan variasi
+def compose_camera(timeline):
+    timeline.add(ax.view_init, elev=lambda t, progress: 20 + 10 * np.sin(progress * np.pi/3), 
+                 azim=ramp(0, 1, 0, 360))
+
+# Timeline: setiap model atom adalah clip (nama, durasi dalam detik, setup artist, keyframe)
+TIMELINE = Timeline([Clip("Dalton", 30, build_dalton, compose_dalton),
+                     Clip("Thomson", 30, build_thomson, compose_thomson),
+                     Clip("Rutherford", 30, build_rutherford, compose_rutherford),
+                     Clip("Bohr", 30, build_bohr, compose_bohr)],
+                    compose=compose_camera)
+
+TABLE = TIMELINE.table(TOTAL_FRAMES)  # Semua keyframe disampling sekali sebelum render
+
+# Fungsi update untuk animasi
+def update(frame):
+    # Setup artist hanya saat bagian berganti, lalu terapkan satu baris tabel
+    section = TABLE.section[frame]
+    scene.enter(section, TIMELINE.clips[section].build)
+    TABLE.apply(frame)
+    
+    # Semua partikel frame ini digambar sebagai satu koleksi
+    scene.commit()
+    
+    return []  # Return empty list for blit=False
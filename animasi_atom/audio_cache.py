@@ -0,0 +1,42 @@
+# Persiapan audio: hanya jendela waktu yang dibutuhkan di-encode, hasilnya di-cache
+import hashlib  # Untuk hash isi file audio
+import os  # Untuk operasi sistem file
+import subprocess  # Untuk menjalankan FFmpeg
+
+AUDIO_CACHE_DIR = os.path.join(".render_cache", "audio")  # Lokasi cache audio
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """Hash SHA-256 isi file, dibaca per blok agar memori tetap kecil"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def prepare_audio(audio_path, duration, start=0, cache_dir=AUDIO_CACHE_DIR):
+    """Mengembalikan audio AAC untuk jendela [start, start + duration) dari cache"""
+    key = f"{file_hash(audio_path)[:16]}_{start:g}_{duration:g}"
+    cached_path = os.path.join(cache_dir, key + ".m4a")
+    if os.path.exists(cached_path):
+        return cached_path  # Render ulang tidak perlu memproses audio lagi
+
+    os.makedirs(cache_dir, exist_ok=True)
+    partial_path = cached_path + ".part.m4a"
+    cmd = [
+        'ffmpeg',
+        '-y',
+        '-loglevel', 'warning',
+        '-ss', str(start),      # Seek sebelum input: bagian awal tidak di-decode
+        '-t', str(duration),    # Hanya durasi video yang dibaca
+        '-i', audio_path,
+        '-vn',                  # Abaikan cover art / stream video
+        '-c:a', 'aac',
+        '-b:a', '192k',
+        partial_path
+    ]
+    subprocess.run(cmd, check=True)
+    # Rename atomik: file cache tidak pernah terlihat setengah jadi
+    os.replace(partial_path, cached_path)
+    return cached_path
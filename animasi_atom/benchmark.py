@@ -0,0 +1,220 @@
+# Benchmark render: sampel frame tetap per bagian, waktu dipisah update / draw / encode
+# (python -m animasi_atom.benchmark)
+import argparse  # Untuk argumen command line
+import json  # Untuk hasil yang bisa dibandingkan antar commit
+import os  # Untuk environment dan path
+import platform  # Untuk informasi mesin
+import shutil  # Untuk mencari FFmpeg
+import statistics  # Untuk median pengulangan
+import subprocess  # Untuk membaca commit git
+import sys  # Untuk exit code
+import time  # Untuk pengukuran waktu
+
+import matplotlib  # Backend headless harus dipilih sebelum pyplot di-import
+matplotlib.use("Agg")
+
+import numpy as np  # Untuk sampel frame
+
+from .api import SCENES, load_scene  # Scene yang diukur
+from .impostor_scene import BACKEND_ENV, BACKENDS, DEFAULT_BACKEND, load_backend  # Backend render scene
+from .quality import encoder_args  # Argumen encoder sesuai profil
+from .video_writer import RawVideoWriter  # Writer rawvideo ke FFmpeg
+
+DEFAULT_SCENES = list(SCENES)        # Scene yang diukur
+DEFAULT_SAMPLES = 12                 # Frame terukur per bagian
+DEFAULT_THRESHOLD = 0.10             # Penurunan fps > 10% dianggap regresi
+
+
+def git_commit():
+    """Commit git saat ini (None jika bukan repo git)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def sample_frames(start, stop, samples):
+    """Frame sampel tetap di dalam satu bagian; frame pertama dipakai untuk setup"""
+    return [int(f) for f in np.unique(np.linspace(start + 1, stop - 1, samples).astype(int))
+            if start < f < stop]
+
+
+def null_writer(scene, queue_size=0):
+    """Writer FFmpeg yang meng-encode ke null muxer (tanpa file output)
+
+    Tanpa antrean (default) waktu encode terukur terpisah; dengan antrean encode tumpang tindih
+    dengan render sehingga waktu encode hanya berisi salinan dan tunggu backpressure."""
+    width, height = scene.fig.canvas.get_width_height()
+    return RawVideoWriter(os.devnull, scene.VIDEO_FPS, (width, height),
+                          extra_args=encoder_args(scene.QUALITY) + ['-f', 'null'],
+                          faststart=False, queue_size=queue_size)
+
+
+def bench_section(scene, section, frames, encode, queue_size=0):
+    """Mengukur setup, update, draw dan encode untuk sampel frame satu bagian"""
+    post_process = getattr(scene, 'post_process', None)
+    canvas = scene.fig.canvas
+    result = {'frames': len(frames), 'setup_s': 0.0, 'update_s': 0.0, 'draw_s': 0.0, 'encode_s': 0.0}
+
+    # Frame pertama bagian: membangun artist (dicatat terpisah dari waktu per frame). Scene
+    # retained dikosongkan dulu agar setiap pengulangan mengukur build, bukan bagian yang sudah aktif
+    scene.scene.clear()
+    start = time.perf_counter()
+    scene.update(scene.TABLE.spans[section][0])
+    canvas.draw()
+    result['setup_s'] = time.perf_counter() - start
+
+    writer = null_writer(scene, queue_size).open() if encode else None
+    try:
+        for frame in frames:
+            t0 = time.perf_counter()
+            scene.update(frame)
+            t1 = time.perf_counter()
+            canvas.draw()
+            buffer = canvas.buffer_rgba()
+            if post_process is not None:
+                post_process(np.asarray(buffer))
+            t2 = time.perf_counter()
+            if writer is not None:
+                writer.write_buffer(buffer)
+            result['update_s'] += t1 - t0
+            result['draw_s'] += t2 - t1
+            result['encode_s'] += time.perf_counter() - t2
+        if writer is not None:
+            # Sisa frame di pipe di-encode sebelum FFmpeg selesai
+            t0 = time.perf_counter()
+            writer.close()
+            result['encode_s'] += time.perf_counter() - t0
+    except BaseException:
+        if writer is not None:
+            writer.__exit__(*sys.exc_info())
+        raise
+    return result
+
+
+def summarize(result):
+    """Menambahkan total waktu dan fps ke hasil satu bagian"""
+    total = result['update_s'] + result['draw_s'] + result['encode_s']
+    result['total_s'] = total
+    result['fps'] = result['frames'] / total if total > 0 else 0.0
+    return result
+
+
+def bench_module(module_name, samples, repeat, encode, queue_size=0):
+    """Benchmark semua bagian satu skrip; setiap tahap diambil median dari pengulangan"""
+    scene = load_scene(module_name)
+    sections = {}
+    for section, clip in enumerate(scene.TIMELINE.clips):
+        start, stop = scene.TABLE.spans[section]
+        frames = sample_frames(start, stop, samples)
+        if not frames:
+            continue
+        runs = [bench_section(scene, section, frames, encode, queue_size) for _ in range(repeat)]
+        result = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        result['frames'] = len(frames)  # Median pengulangan genap bisa berupa float
+        sections[clip.name] = summarize(result)
+
+    overall = {key: sum(result[key] for result in sections.values())
+               for key in ('frames', 'setup_s', 'update_s', 'draw_s', 'encode_s')}
+    return {'size': list(scene.fig.canvas.get_width_height()), 'sections': sections,
+            'total': summarize(overall)}
+
+
+def compare(results, baseline, threshold):
+    """Daftar regresi: bagian yang fps-nya turun lebih dari threshold dibanding baseline"""
+    regressions = []
+    for module_name, module in results['modules'].items():
+        base_module = baseline.get('modules', {}).get(module_name)
+        if base_module is None:
+            continue
+        for name, result in list(module['sections'].items()) + [('total', module['total'])]:
+            base = base_module['total'] if name == 'total' else base_module['sections'].get(name)
+            if not base or not base['fps']:
+                continue
+            change = result['fps'] / base['fps'] - 1
+            if change < -threshold:
+                regressions.append((module_name, name, base['fps'], result['fps'], change))
+    return regressions
+
+
+def print_report(results):
+    """Tabel ringkas hasil benchmark"""
+    print(f"{'modul':8} {'bagian':11} {'frame':>5} {'fps':>7} {'update':>8} {'draw':>8} {'encode':>8}")
+    for module_name, module in results['modules'].items():
+        for name, result in list(module['sections'].items()) + [('total', module['total'])]:
+            n = max(result['frames'], 1)
+            print(f"{module_name:8} {name:11} {result['frames']:5d} {result['fps']:7.2f} "
+                  f"{1000 * result['update_s'] / n:6.1f}ms {1000 * result['draw_s'] / n:6.1f}ms "
+                  f"{1000 * result['encode_s'] / n:6.1f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark render animasi atom")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_SCENES,
+                        help="Scene (atom, atom2 atau nama modul lengkap)")
+    parser.add_argument('--quality', help="Profil kualitas (default: ATOM_QUALITY atau production)")
+    parser.add_argument('--backend', choices=BACKENDS,
+                        help="Backend render (default: ATOM_BACKEND atau mplot3d)")
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, help="Frame per bagian")
+    parser.add_argument('--repeat', type=int, default=3, help="Pengulangan (diambil median)")
+    parser.add_argument('--no-encode', action='store_true', help="Lewati encode FFmpeg")
+    parser.add_argument('--queue', type=int, default=0,
+                        help="Buffer antrean writer (0 = encode sinkron, tahap terukur terpisah)")
+    parser.add_argument('--output', default="benchmark.json", help="File hasil JSON")
+    parser.add_argument('--baseline', help="Hasil JSON pembanding (mis. dari commit sebelumnya)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Batas penurunan fps relatif sebelum dianggap regresi")
+    args = parser.parse_args(argv)
+
+    if args.quality:
+        # Diset sebelum modul scene di-import karena profil dibaca saat import
+        os.environ['ATOM_QUALITY'] = args.quality
+    if args.backend:
+        os.environ[BACKEND_ENV] = args.backend
+    encode = not args.no_encode and shutil.which('ffmpeg') is not None
+    if not args.no_encode and not encode:
+        print("FFmpeg tidak ditemukan, encode dilewati")
+
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'quality': os.environ.get('ATOM_QUALITY', 'production'),
+            'backend': load_backend(),
+            'samples': args.samples,
+            'repeat': args.repeat,
+            'encode': encode,
+            'queue': args.queue,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__,
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'modules': {name: bench_module(name, args.samples, args.repeat, encode, args.queue)
+                    for name in args.modules},
+    }
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print_report(results)
+    print(f"Hasil disimpan ke {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('quality') != results['meta']['quality']:
+            print("Peringatan: profil kualitas baseline berbeda")
+        # Baseline lama tanpa field backend diukur dengan backend default
+        if baseline.get('meta', {}).get('backend', DEFAULT_BACKEND) != results['meta']['backend']:
+            print("Peringatan: backend render baseline berbeda")
+        regressions = compare(results, baseline, args.threshold)
+        for module_name, name, before, after, change in regressions:
+            print(f"REGRESI {module_name}/{name}: {before:.2f} -> {after:.2f} fps ({change:+.1%})")
+        if regressions:
+            return 1
+        print(f"Tidak ada regresi di atas {args.threshold:.0%} dibanding {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
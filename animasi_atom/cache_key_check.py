@@ -0,0 +1,100 @@
+# Pemeriksaan kunci cache segmen: mengedit setup tingkat modul scene (konstanta, axes, gaya teks)
+# harus mengubah kunci semua bagian, mengedit fungsi satu bagian hanya mengubah kunci bagian itu
+# (python -m animasi_atom.cache_key_check)
+import argparse  # Untuk argumen command line
+import json  # Untuk kunci dari subprocess
+import os  # Untuk operasi sistem file
+import shutil  # Untuk menyalin paket
+import subprocess  # Untuk menghitung kunci di interpreter terpisah
+import sys  # Untuk interpreter dan exit code
+import tempfile  # Untuk salinan paket sementara
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))  # Paket yang disalin untuk setiap edit
+CONFIG = ("cek", 1200, 30, (1080, 1920), None, [], [])  # Konfigurasi tetap untuk semua kunci
+
+# Edit per scene: (keterangan, teks lama, teks baru, bagian yang kuncinya harus berubah; None = semua)
+EDITS = {
+    'atom': [
+        ("warna elektron", "'electron': '#4285F4'", "'electron': '#4285F5'", None),
+        ("batas axes", "ax.set_xlim(-5, 5)", "ax.set_xlim(-7, 7)", None),
+        ("ukuran judul", "fontsize=36", "fontsize=54", None),
+        ("fungsi bagian Dalton", "def build_dalton():\n", "def build_dalton():\n    pass\n", [0]),
+    ],
+    'atom2': [
+        ("kekuatan GLOW_COLORS", "    COLORS['nucleus']: 0.7,", "    COLORS['nucleus']: 0.1,", None),
+        ("batas axes", "ax.set_xlim(-8, 8)", "ax.set_xlim(-12, 12)", None),
+        ("ukuran judul", "fontsize=48", "fontsize=72", None),
+        ("fungsi bagian Bohr", "def build_bohr():\n", "def build_bohr():\n    pass\n", [3]),
+    ],
+}
+
+_KEYS_SCRIPT = """
+import importlib, json, sys
+from animasi_atom.segment_cache import section_key
+module = importlib.import_module(sys.argv[1])
+config = json.loads(sys.argv[2])
+print(json.dumps([section_key(module, section, config)
+                  for section in range(len(module.TIMELINE.clips))]))
+"""
+
+
+def _section_keys(root, scene, quality):
+    """Kunci semua bagian scene dari salinan paket di root (interpreter baru, tanpa modul ter-cache)"""
+    env = dict(os.environ, PYTHONPATH=root, ATOM_QUALITY=quality, MPLBACKEND="Agg")
+    output = subprocess.run([sys.executable, "-c", _KEYS_SCRIPT, f"animasi_atom.{scene}",
+                             json.dumps(CONFIG)],
+                            env=env, cwd=root, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def check_keys(scene='atom', quality='draft'):
+    """Membandingkan kunci sebelum dan sesudah setiap edit; mengembalikan daftar kegagalan"""
+    failures = []
+    with tempfile.TemporaryDirectory() as root:
+        package = os.path.join(root, "animasi_atom")
+        shutil.copytree(PACKAGE_DIR, package, ignore=shutil.ignore_patterns("__pycache__"))
+        scene_path = os.path.join(package, f"{scene}.py")
+        with open(scene_path, encoding="utf-8") as f:
+            original = f.read()
+
+        base = _section_keys(root, scene, quality)
+        if _section_keys(root, scene, quality) != base:
+            failures.append("kunci berubah tanpa edit")
+        for label, old, new, expected in EDITS[scene]:
+            if old not in original:
+                failures.append(f"{label}: teks '{old.strip()}' tidak ada di {scene}.py")
+                continue
+            with open(scene_path, "w", encoding="utf-8") as f:
+                f.write(original.replace(old, new, 1))
+            keys = _section_keys(root, scene, quality)
+            changed = [section for section, (a, b) in enumerate(zip(base, keys)) if a != b]
+            wanted = list(range(len(base))) if expected is None else expected
+            status = "OK" if changed == wanted else "GAGAL"
+            print(f"{status} {label}: bagian berubah {changed}")
+            if changed != wanted:
+                failures.append(f"{label}: bagian berubah {changed}, seharusnya {wanted}")
+        with open(scene_path, "w", encoding="utf-8") as f:
+            f.write(original)
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m animasi_atom.cache_key_check",
+                                     description="Edit scene mengubah kunci cache segmen yang tepat")
+    parser.add_argument('scenes', nargs='*', default=sorted(EDITS),
+                        help="Scene yang diperiksa (default: semua)")
+    parser.add_argument('--quality', default='draft', help="Profil kualitas (default: draft)")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for scene in args.scenes:
+        print(f"{scene}:")
+        failures += [f"{scene}: {failure}" for failure in check_keys(scene, args.quality)]
+    for failure in failures:
+        print(f"GAGAL: {failure}")
+    print("OK" if not failures else f"{len(failures)} kegagalan")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+# Kamera mplot3d: proyeksi titik data ke piksel buffer untuk satu frame
+import numpy as np  # Untuk operasi array
+
+
+class Camera:
+    """Kamera view_init mplot3d untuk satu frame: titik -> piksel dan kedalaman"""
+
+    def __init__(self, ax, height):
+        ax.apply_aspect()
+        ax.M = ax.get_proj()  # Matriks yang juga dipakai Line3D dan Text3D saat digambar
+        # Baris x, y dan w proyeksi perspektif (baris z mplot3d tidak membawa kedalaman)
+        self.rows = ax.M[[0, 1, 3]]
+        (self.x0, self.y0), (x1, y1) = ax.transData.transform([(0, 0), (1, 1)])
+        self.sx, self.sy = x1 - self.x0, y1 - self.y0  # Skala koordinat proyeksi -> piksel
+        self.height = height
+        self.depth_gradient = self.rows[2, :3]  # w affine terhadap koordinat data
+
+    def project(self, points):
+        """Kolom, baris (piksel buffer) dan kedalaman w titik-titik (N, 3)"""
+        h = np.asarray(points, dtype=float) @ self.rows[:, :3].T + self.rows[:, 3]
+        w = h[:, 2]
+        return h[:, 0] / w * self.sx + self.x0, self.height - (h[:, 1] / w * self.sy + self.y0), w
+
+    def jacobian(self, point):
+        """Turunan (kolom, baris) piksel terhadap koordinat data di sebuah titik, (2, 3)"""
+        R = self.rows[:, :3]
+        h = R @ point + self.rows[:, 3]
+        return np.array([self.sx * (R[0] * h[2] - h[0] * R[2]),
+                         -self.sy * (R[1] * h[2] - h[1] * R[2])]) / h[2] ** 2
+
+    def pixel_radius(self, center, radius):
+        """Radius proyeksi sphere dalam piksel (sumbu terpanjang elips di layar)"""
+        J = self.jacobian(np.asarray(center, dtype=float))
+        # Setengah sumbu elips = radius * nilai singular terbesar jacobian
+        return radius * np.linalg.norm(J, ord=2)
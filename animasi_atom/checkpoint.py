@@ -0,0 +1,110 @@
+# Checkpoint render: potongan frame berukuran tetap dengan manifest, render yang gagal dilanjutkan
+import json  # Untuk file manifest
+import os  # Untuk operasi sistem file
+import shutil  # Untuk menghapus direktori checkpoint
+
+CHECKPOINT_DIR = os.path.join(".render_cache", "chunks")  # Lokasi potongan yang sedang dirender
+CHUNK_FRAMES = 150  # Frame per potongan (5 detik pada 30 fps); tetap agar batas sama saat dilanjutkan
+MANIFEST = "manifest.json"  # Nama file manifest di setiap direktori checkpoint
+
+
+def fixed_chunks(start, stop, chunk_frames=CHUNK_FRAMES):
+    """Membagi rentang frame [start, stop) menjadi potongan (start, stop) berukuran tetap"""
+    return [(first, min(first + chunk_frames, stop)) for first in range(start, stop, chunk_frames)]
+
+
+class ChunkManifest:
+    """Manifest satu direktori checkpoint: hash konfigurasi dan potongan yang sudah selesai
+
+    Potongan hanya dicatat setelah writer-nya selesai, jadi file setengah jadi dari proses
+    yang mati tidak pernah dianggap selesai. Manifest dengan hash konfigurasi lain (kode
+    atau parameter berubah) dianggap usang dan potongannya dibuang; begitu juga manifest
+    dengan pilihan sampel preview yang berbeda."""
+
+    def __init__(self, directory, config_hash, start, stop, chunk_frames=CHUNK_FRAMES,
+                 renditions=None, preview=False):
+        self.directory = directory      # Direktori potongan dan manifest
+        self.config_hash = config_hash  # Hash kode dan parameter render
+        self.chunk_frames = chunk_frames
+        self.ranges = fixed_chunks(start, stop, chunk_frames)
+        self.renditions = [name for name, _, _ in renditions or ()]
+        self.preview = bool(preview)    # Potongan menyimpan sampel preview GIF
+        self.path = os.path.join(directory, MANIFEST)
+        os.makedirs(directory, exist_ok=True)
+        self.completed = self._load()
+
+    def _identity(self):
+        """Bagian manifest yang harus sama agar potongan bisa dipakai ulang"""
+        return {'config': self.config_hash, 'chunk_frames': self.chunk_frames,
+                'renditions': self.renditions, 'preview': self.preview}
+
+    def _read(self):
+        """Isi manifest di disk, atau None jika belum ada atau rusak"""
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _load(self):
+        """Potongan selesai dari manifest; checkpoint usang dikosongkan"""
+        data = self._read()
+        if data is not None and {key: data.get(key) for key in self._identity()} == self._identity():
+            return data.get('chunks', {})
+        if data is not None:
+            print(f"Checkpoint usang di {self.directory} (konfigurasi berubah), potongan dibuang")
+        # Mulai dari awal: buang potongan lama agar tidak tercampur
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
+        return {}
+
+    def _save(self):
+        """Menulis manifest secara atomik (file sementara lalu rename)"""
+        partial_path = self.path + ".part"
+        with open(partial_path, "w") as f:
+            json.dump(dict(self._identity(), chunks=self.completed), f, indent=1, sort_keys=True)
+        os.replace(partial_path, self.path)
+
+    @staticmethod
+    def _key(start, stop):
+        return f"{start}-{stop}"
+
+    def chunk_path(self, start, stop):
+        """Path file video utama sebuah potongan"""
+        return os.path.join(self.directory, f"chunk_{start:06d}_{stop:06d}.mp4")
+
+    def _valid(self, entry):
+        """Semua file potongan ada dengan ukuran yang tercatat"""
+        return all(os.path.exists(path) and os.path.getsize(path) == size
+                   for path, size in zip(entry['files'], entry['bytes']))
+
+    def pending(self):
+        """Potongan (start, stop) yang belum selesai atau file-nya hilang/berubah"""
+        return [(start, stop) for start, stop in self.ranges
+                if not (self._key(start, stop) in self.completed
+                        and self._valid(self.completed[self._key(start, stop)]))]
+
+    def mark_done(self, start, stop, paths):
+        """Mencatat potongan yang selesai beserta file dan ukurannya"""
+        self.completed[self._key(start, stop)] = {
+            'files': list(paths),
+            'bytes': [os.path.getsize(path) for path in paths],
+        }
+        self._save()
+
+    def paths(self):
+        """Daftar path per potongan sesuai urutan frame; gagal jika ada potongan hilang atau usang"""
+        data = self._read()
+        if data is None or {key: data.get(key) for key in self._identity()} != self._identity():
+            raise RuntimeError(f"Manifest {self.path} hilang atau usang, render ulang diperlukan")
+        completed = data.get('chunks', {})
+        missing = [f"{start}-{stop}" for start, stop in self.ranges
+                   if not (self._key(start, stop) in completed
+                           and self._valid(completed[self._key(start, stop)]))]
+        if missing:
+            raise RuntimeError(f"Potongan hilang atau rusak di {self.directory}: {', '.join(missing)}")
+        return [completed[self._key(start, stop)]['files'] for start, stop in self.ranges]
+
+    def remove(self):
+        """Menghapus direktori checkpoint setelah hasil akhir tersimpan"""
+        shutil.rmtree(self.directory, ignore_errors=True)
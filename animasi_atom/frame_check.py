@@ -0,0 +1,83 @@
+# Pemeriksaan determinisme frame: frame yang dirender dingin (proses baru, seperti awal potongan
+# worker, segmen atau shard) harus identik piksel dengan frame yang sama dalam render berurutan
+# (python -m animasi_atom.frame_check atom --quality draft --backend impostor)
+import argparse  # Untuk argumen command line
+import multiprocessing  # Untuk proses baru per frame dingin
+import sys  # Untuk exit code
+
+import numpy as np  # Untuk membandingkan buffer
+
+from .api import SCENES, load_scene  # Scene yang diperiksa
+
+
+def draw_frame(module, frame):
+    """Update dan gambar satu frame seperti render_frames, mengembalikan salinan buffer RGBA"""
+    module.update(frame)
+    canvas = module.fig.canvas
+    canvas.draw()
+    buffer = np.array(canvas.buffer_rgba())
+    post_process = getattr(module, 'post_process', None)
+    if post_process is not None:
+        post_process(buffer)
+    return buffer
+
+
+def _cold_frame(task):
+    """Worker (proses baru): scene dimuat lalu langsung merender satu frame"""
+    scene, quality, backend, frame = task
+    return draw_frame(load_scene(scene, quality, backend), frame)
+
+
+def check_frames(scene, quality=None, backend=None, frames=None):
+    """Membandingkan frame dingin dengan frame render berurutan dari frame 0
+
+    Mengembalikan {frame: (jumlah piksel berbeda, selisih maksimum)}; default satu frame di
+    awal dan di tengah setiap bagian."""
+    module = load_scene(scene, quality, backend)
+    if frames is None:
+        frames = {frame for start, stop in module.TABLE.spans if stop > start
+                  for frame in (start + min(10, stop - start - 1), (start + stop) // 2)}
+    frames = sorted(set(frames))
+
+    # Render berurutan: state (cache raster, scene retained) terbawa dari frame sebelumnya
+    sequential = {}
+    for frame in range(frames[-1] + 1):
+        buffer = draw_frame(module, frame)
+        if frame in frames:
+            sequential[frame] = buffer
+
+    # Setiap frame dingin dirender di interpreter baru (spawn, satu tugas per proses)
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        cold = pool.map(_cold_frame, [(module.__name__, module.QUALITY['name'],
+                                       module.RENDER_BACKEND, frame) for frame in frames])
+
+    results = {}
+    for frame, buffer in zip(frames, cold):
+        diff = np.abs(sequential[frame].astype(np.int16) - buffer.astype(np.int16))
+        results[frame] = (int(np.count_nonzero(diff.any(axis=-1))), int(diff.max()))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m animasi_atom.frame_check",
+                                     description="Frame dingin harus identik dengan render berurutan")
+    parser.add_argument('scenes', nargs='*', default=list(SCENES), help="Scene yang diperiksa")
+    parser.add_argument('--quality', default='draft', help="Profil kualitas (default: draft)")
+    parser.add_argument('--backend', help="Backend render (default: ATOM_BACKEND atau mplot3d)")
+    parser.add_argument('--frames', type=int, nargs='+',
+                        help="Frame yang diperiksa (default: awal dan tengah setiap bagian)")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for scene in args.scenes:
+        for frame, (pixels, max_diff) in check_frames(scene, args.quality, args.backend,
+                                                      args.frames).items():
+            failed |= pixels > 0
+            status = "OK" if pixels == 0 else "BEDA"
+            print(f"{scene} frame {frame}: {status} ({pixels} piksel, selisih maks {max_diff})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# Tabel per frame: semua posisi, alpha dan visibilitas dihitung sekali dengan operasi array
+import numpy as np  # Untuk operasi array
+
+
+class FrameTable:
+    """Tabel hasil sampling timeline; update() hanya mengindeks tabel ini
+
+    Per frame seluruh video hanya section, progress dan section_progress. Frame setiap bagian
+    berurutan, jadi bagian disimpan sebagai rentang spans[bagian] = (start, stop) dan track-nya
+    di tracks[bagian] sebagai (setter, args, kolom); setiap kolom read-only sepanjang bagian
+    itu saja (baris = frame - start), bukan sepanjang video."""
+
+    def __init__(self, total_frames, bounds):
+        frames = np.arange(total_frames)
+        bounds = np.asarray(bounds, dtype=float)  # Batas bagian dalam progress, naik dari 0 ke 1
+        n_sections = len(bounds) - 1
+        self.total_frames = total_frames
+        self.progress = frames / total_frames     # Progress global (0-1)
+        # Bagian aktif setiap frame lewat pencarian biner pada batas bagian
+        self.section = np.clip(np.searchsorted(bounds, self.progress, side='right') - 1,
+                               0, n_sections - 1)
+        start = bounds[self.section]
+        self.section_progress = (self.progress - start) / (bounds[self.section + 1] - start)
+        # Frame setiap bagian berurutan, jadi cukup disimpan sebagai rentang [start, stop)
+        edges = np.searchsorted(self.section, np.arange(n_sections + 1))
+        self.spans = [(int(edges[s]), int(edges[s + 1])) for s in range(n_sections)]
+        self.tracks = [[] for _ in range(n_sections)]  # Track per bagian
+
+    def frames(self, section):
+        """Slice frame milik satu bagian"""
+        return slice(*self.spans[section])
+
+    def add(self, section, setter, *args, **columns):
+        """Track: setter(*args, kolom=nilai[frame]) dipanggil di setiap frame bagian ini"""
+        length = self.spans[section][1] - self.spans[section][0]
+        stored = []
+        for key, values in columns.items():
+            values = np.asarray(values, dtype=bool if key == 'visible' else float)
+            if values.shape[:1] != (length,):
+                values = np.broadcast_to(values, (length,) + values.shape)
+            values = np.ascontiguousarray(values)
+            values.setflags(write=False)
+            stored.append((key, values))
+        self.tracks[section].append((setter, args, tuple(stored)))
+
+    def apply(self, frame):
+        """Menerapkan satu baris tabel ke scene (tanpa perhitungan di loop render)"""
+        section = self.section[frame]
+        row = frame - self.spans[section][0]  # Baris di dalam kolom bagian
+        for setter, args, columns in self.tracks[section]:
+            setter(*args, **{key: values[row] for key, values in columns})
+
+    def nbytes(self):
+        """Ukuran semua kolom track dalam byte"""
+        return sum(values.nbytes for tracks in self.tracks
+                   for _, _, columns in tracks for _, values in columns)
+
+
+def reveal_chars(full_text, progress):
+    """Jumlah karakter teks bertahap per frame (setara int(progress * len(teks)))"""
+    return np.trunc(np.asarray(progress) * len(full_text)).astype(int)
+
+
+def text_reveal(text_obj, full_text):
+    """Setter yang menampilkan sejumlah karakter pertama full_text
+
+    Objek dengan set_reveal (RevealText3D, OverlayText) menggambar prefix dari raster string
+    penuh yang di-cache; objek lain menerima prefix lewat set_text."""
+    if hasattr(text_obj, 'set_reveal'):
+        def set_chars(chars):
+            text_obj.set_reveal(full_text, int(chars))
+    else:
+        def set_chars(chars):
+            text_obj.set_text(full_text[:int(chars)])
+    return set_chars
@@ -0,0 +1,82 @@
+# Cache geometri: mesh sphere satuan dan jalur orbit dihitung sekali
+from functools import lru_cache  # Untuk cache LRU terbatas
+
+import numpy as np  # Untuk operasi array
+
+GEOMETRY_CACHE_SIZE = 64  # Jumlah maksimum entri geometri yang disimpan
+
+
+def _build_sphere(resolution):
+    """Mesh sphere satuan (radius 1, pusat di origin)"""
+    u = np.linspace(0, 2 * np.pi, resolution)  # Sudut azimuth
+    v = np.linspace(0, np.pi, resolution)      # Sudut polar
+    x = np.outer(np.cos(u), np.sin(v))
+    y = np.outer(np.sin(u), np.sin(v))
+    z = np.outer(np.ones(np.size(u)), np.cos(v))
+    return x, y, z
+
+
+def _build_circle(resolution, radius):
+    """Orbit lingkaran datar"""
+    theta = np.linspace(0, 2*np.pi, resolution)
+    x = radius * np.cos(theta)
+    y = radius * np.sin(theta)
+    z = np.zeros_like(x)
+    return x, y, z
+
+
+def _build_ellipse(resolution, a, b, c, z_rotate):
+    """Orbit elips dengan variasi sumbu z dan rotasi opsional"""
+    theta = np.linspace(0, 2*np.pi, resolution)
+    x = a * np.cos(theta)
+    y = b * np.sin(theta)
+    z = c * np.sin(theta/2)
+
+    if z_rotate != 0:
+        rot_matrix = np.array([
+            [np.cos(z_rotate), -np.sin(z_rotate), 0],
+            [np.sin(z_rotate), np.cos(z_rotate), 0],
+            [0, 0, 1]
+        ])
+        x, y, z = np.dot(rot_matrix, np.vstack([x, y, z]))
+    return x, y, z
+
+
+_BUILDERS = {
+    'sphere': _build_sphere,
+    'circle': _build_circle,
+    'ellipse': _build_ellipse,
+}
+
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def geometry(kind, resolution, params=()):
+    """Geometri ter-cache berdasarkan (jenis, resolusi, parameter bentuk)"""
+    arrays = _BUILDERS[kind](resolution, *params)
+    for array in arrays:
+        array.setflags(write=False)  # Dibagi antar pemanggil, jadi hanya-baca
+    return arrays
+
+
+def surface_polys(X, Y, Z):
+    """Membuat poligon quad (N, 4, 3) dengan urutan yang sama seperti plot_surface"""
+    grid = np.stack([X, Y, Z], axis=-1)
+    # Sudut quad: (r, c), (r, c+1), (r+1, c+1), (r+1, c)
+    quads = np.stack([grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]], axis=2)
+    return quads.reshape(-1, 4, 3)
+
+
+def sphere(x, y, z, radius, resolution):
+    """Mesh sphere yang diskalakan dan digeser dari mesh satuan, tanpa trigonometri"""
+    unit_x, unit_y, unit_z = geometry('sphere', resolution)
+    return x + radius * unit_x, y + radius * unit_y, z + radius * unit_z
+
+
+def circle_orbit(radius, resolution=100):
+    """Jalur orbit lingkaran ter-cache"""
+    return geometry('circle', resolution, (float(radius),))
+
+
+def elliptical_orbit(a, b, c, resolution=100, z_rotate=0):
+    """Jalur orbit elips ter-cache"""
+    return geometry('ellipse', resolution, (float(a), float(b), float(c), float(z_rotate)))
@@ -0,0 +1,166 @@
+# Glow layar: bright pass per warna objek, blur Gaussian resolusi rendah, lalu komposit aditif
+import numpy as np  # Untuk operasi array
+from matplotlib import colors as mcolors  # Untuk konversi warna
+
+DOWNSAMPLE = 4          # Faktor resolusi rendah bright pass (pada production)
+SCALES = ((12, 0.4), (36, 0.6), (100, 1.4))  # (sigma piksel production, bobot) blur halo
+MIN_SIGMA = 3           # Sigma minimum (piksel) sebelum gambar diperkecil lagi untuk blur
+FLOOR = 1.0             # Glow di bawah ~1 level warna dibuang (ekor Gaussian tidak dikomposit)
+MATCH_COS = 0.9         # Kemiripan arah warna minimum agar piksel dianggap milik warna objek
+BOX_PASSES = 3          # Jumlah box blur berurutan yang mendekati satu Gaussian
+
+
+def _along(axis, index):
+    """Indeks tuple untuk slice pada satu sumbu array 2D"""
+    return (index, slice(None)) if axis == 0 else (slice(None), index)
+
+
+def _box_blur(image, radius, axis):
+    """Rata-rata jendela 2*radius+1 sepanjang satu sumbu (cumsum, tepi diisi nol)"""
+    n = image.shape[axis]
+    window = 2 * radius + 1
+    # Jumlah kumulatif dengan radius + 1 nol di depan dan nilai akhir diulang radius kali
+    shape = list(image.shape)
+    shape[axis] = n + window
+    total = np.empty(shape, dtype=np.float32)
+    total[_along(axis, slice(0, radius + 1))] = 0
+    np.cumsum(image, axis=axis, out=total[_along(axis, slice(radius + 1, radius + 1 + n))])
+    total[_along(axis, slice(radius + 1 + n, None))] = total[_along(axis, slice(radius + n, radius + n + 1))]
+    out = total[_along(axis, slice(window, window + n))] - total[_along(axis, slice(0, n))]
+    out *= np.float32(1 / window)
+    return out
+
+
+def _downsample(image, factor):
+    """Rata-rata blok factor x factor (sisa tepi dibuang)"""
+    height, width = image.shape[0] // factor, image.shape[1] // factor
+    blocks = image[:height * factor, :width * factor].reshape(height, factor, width, factor)
+    return blocks.mean(axis=(1, 3), dtype=np.float32)
+
+
+def _upsample(image, factor, shape):
+    """Interpolasi bilinear (pusat piksel sejajar) sebesar factor, dipotong/diisi ke shape"""
+    for axis in (0, 1):
+        if factor == 1:
+            break
+        n = image.shape[axis]
+        # Satu piksel tepi diulang di kedua sisi
+        padded = np.concatenate([image[_along(axis, slice(0, 1))], image,
+                                 image[_along(axis, slice(n - 1, n))]], axis=axis)
+        center = padded[_along(axis, slice(1, n + 1))]
+        size = list(image.shape)
+        size[axis] *= factor
+        out = np.empty(size, dtype=np.float32)
+        for k in range(factor):
+            offset = (k + 0.5) / factor - 0.5  # Posisi piksel output relatif ke pusat piksel rendah
+            neighbor = padded[_along(axis, slice(0, n) if offset < 0 else slice(2, n + 2))]
+            phase = out[_along(axis, slice(k, None, factor))]
+            np.subtract(neighbor, center, out=phase)
+            phase *= np.float32(abs(offset))
+            phase += center
+        image = out
+    if image.shape == tuple(shape):
+        return image
+    result = np.zeros(shape, dtype=np.float32)
+    rows, cols = min(shape[0], image.shape[0]), min(shape[1], image.shape[1])
+    result[:rows, :cols] = image[:rows, :cols]
+    return result
+
+
+def gaussian_blur(image, sigma):
+    """Blur Gaussian terpisah dari beberapa box blur; sigma besar dihitung di resolusi lebih kecil"""
+    factor = 1
+    while sigma / (2 * factor) >= MIN_SIGMA and min(image.shape) // (2 * factor) >= 8:
+        factor *= 2
+    small = _downsample(image, factor) if factor > 1 else image
+    # Variansi BOX_PASSES box selebar w adalah BOX_PASSES (w^2 - 1) / 12
+    radius = int(round((np.sqrt(12 * (sigma / factor) ** 2 / BOX_PASSES + 1) - 1) / 2))
+    if radius >= 1:
+        for axis in (0, 1):
+            for _ in range(BOX_PASSES):
+                small = _box_blur(small, radius, axis)
+    return _upsample(small, factor, image.shape) if factor > 1 else small
+
+
+class ScreenGlow:
+    """Post-process glow: piksel berwarna objek dipendarkan di sekitarnya secara aditif
+
+    colors memetakan warna objek ke kekuatan glow. Pemilihan berdasarkan arah warna, sehingga
+    objek yang sedang fade-in atau ter-shading gelap memancarkan glow yang lebih lemah. Blur
+    beberapa skala dijumlahkan: energi objek kecil tersebar tipis pada skala besar, jadi
+    lebar halo mengikuti ukuran objek seperti lapisan glow sphere."""
+
+    def __init__(self, colors, background, tint='#FFFFFF', scale=1.0, scales=SCALES):
+        self.factor = max(1, int(round(DOWNSAMPLE * scale)))  # Faktor resolusi rendah
+        self.background = 255 * np.array(mcolors.to_rgb(background), dtype=np.float32)
+        # Piksel RGBA background sebagai uint32 (little-endian) untuk perbandingan cepat
+        self._background_pixel = np.array(mcolors.to_rgba_array(background) * 255 + 0.5,
+                                          dtype=np.uint8).view('<u4')[0, 0]
+        self.tint = np.array(mcolors.to_rgb(tint), dtype=np.float32)  # Warna glow (0-1)
+        # Arah satuan warna objek relatif terhadap background, dan panjangnya (warna penuh = 1)
+        targets = 255 * np.array([mcolors.to_rgb(color) for color in colors], dtype=np.float32)
+        targets -= self.background
+        self.lengths = np.linalg.norm(targets, axis=1)
+        self.directions = targets / self.lengths[:, np.newaxis]
+        self.strengths = np.array(list(colors.values()), dtype=np.float32)
+        # Sigma dalam piksel resolusi rendah beserta bobotnya
+        self.scales = [(sigma * scale / self.factor, weight) for sigma, weight in scales]
+
+    def emission(self, frame):
+        """Intensitas glow (jumlah semua warna dikali kekuatan) pada resolusi rendah"""
+        f = self.factor
+        height, width = frame.shape[0] // f, frame.shape[1] // f
+        # Satu sampel di tengah setiap blok; warna dihitung hanya untuk piksel selain background
+        pixels = frame.view('<u4')[f // 2:height * f:f, f // 2:width * f:f, 0]
+        index = np.flatnonzero(pixels.ravel() != self._background_pixel)
+        total = np.zeros(height * width, dtype=np.float32)
+        if len(index) == 0:
+            return total.reshape(height, width)
+        rows, cols = np.divmod(index, width)
+        low = frame[rows * f + f // 2, cols * f + f // 2, :3] - self.background
+        np.maximum(low, 0, out=low)
+        norm = np.linalg.norm(low, axis=1)
+        norm[norm == 0] = np.inf
+        dot = low @ self.directions.T  # (piksel, warna)
+        # Cosinus arah dinaikkan linear dari MATCH_COS ke 1, dikali intensitas relatif warna penuh
+        match = np.clip((dot / norm[:, np.newaxis] - MATCH_COS) / (1 - MATCH_COS), 0, 1)
+        intensity = np.clip(dot / self.lengths, 0, 1)
+        total[index] = (match * intensity) @ self.strengths
+        return total.reshape(height, width)
+
+    def apply(self, frame):
+        """Menambahkan glow ke frame RGBA uint8 secara in-place"""
+        emission = self.emission(frame)
+        rows = np.flatnonzero(emission.any(axis=1))
+        if len(rows) == 0:
+            return
+        cols = np.flatnonzero(emission.any(axis=0))
+        glow = np.zeros_like(emission)
+        for sigma, weight in self.scales:
+            # Blur hanya di sekitar piksel yang memancar (margin 3 sigma)
+            margin = int(np.ceil(3 * sigma))
+            r0, r1 = max(rows[0] - margin, 0), min(rows[-1] + 1 + margin, glow.shape[0])
+            c0, c1 = max(cols[0] - margin, 0), min(cols[-1] + 1 + margin, glow.shape[1])
+            glow[r0:r1, c0:c1] += weight * gaussian_blur(emission[r0:r1, c0:c1], sigma)
+        # Hanya area yang cukup terang yang di-upsample dan dikomposit
+        visible = glow >= (FLOOR + 0.5) / 255
+        rows = np.flatnonzero(visible.any(axis=1))
+        if len(rows) == 0:
+            return
+        cols = np.flatnonzero(visible[rows[0]:rows[-1] + 1].any(axis=0))
+        r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        f = self.factor
+        full = _upsample(glow[r0:r1, c0:c1], f, ((r1 - r0) * f, (c1 - c0) * f))
+        region = frame[r0 * f:r1 * f, c0 * f:c1 * f]
+        amounts = {}  # Jumlah uint8 per nilai tint (kanal dengan tint sama dihitung sekali)
+        for c, tint in enumerate(self.tint):
+            if tint not in amounts:
+                amount = full * np.float32(255 * tint)
+                amount += 0.5 - FLOOR * tint  # Dikurangi FLOOR agar batas area tetap mulus
+                np.maximum(amount, 0, out=amount)
+                np.minimum(amount, 255, out=amount)
+                amounts[tint] = amount.astype(np.uint8)
+            # Penjumlahan jenuh uint8: target + min(glow, 255 - target)
+            target = region[..., c]
+            add = np.minimum(amounts[tint], 255 - target)
+            target += add
@@ -0,0 +1,289 @@
+# Cache raster teks bertahap (efek mesin ketik): string penuh di-layout dan dirasterisasi sekali,
+# lalu prefix digambar dengan memotong raster per baris sehingga biaya per frame tetap
+from collections import OrderedDict  # Untuk cache LRU raster
+from contextlib import contextmanager  # Untuk posisi teks sementara
+
+import numpy as np  # Untuk operasi array
+from matplotlib.backends.backend_agg import RendererAgg  # Renderer offscreen
+from matplotlib.colors import to_rgba  # Warna teks sebagai kunci cache
+from matplotlib.text import Text  # Metode dasar set_text dan draw
+from matplotlib.transforms import IdentityTransform  # Posisi teks langsung dalam piksel
+from mpl_toolkits.mplot3d.art3d import Text3D  # Teks 3D yang dibuka bertahap
+
+from .camera import Camera  # Posisi anchor teks 3D di piksel
+
+RASTER_CACHE_SIZE = 8  # Jumlah string penuh yang raster-nya disimpan per artist
+
+
+class LineRecorder(RendererAgg):
+    """Renderer Agg yang mencatat setiap baris teks yang digambar (posisi baseline dan font)"""
+
+    def __init__(self, width, height, dpi):
+        super().__init__(width, height, dpi)
+        self.lines = []
+        self._extents = {}  # Ukuran teks per (string, font, ismath); tidak bergantung posisi
+
+    def clear(self):
+        super().clear()
+        self.lines = []
+
+    def draw_text(self, gc, x, y, s, prop, angle, ismath=False, mtext=None):
+        # x kiri dan y baseline (baris buffer dari atas) setelah wrapping dan alignment
+        self.lines.append((x, y, s, prop, ismath))
+        super().draw_text(gc, x, y, s, prop, angle, ismath, mtext)
+
+    def text_extent(self, s, prop, ismath=False):
+        """get_text_width_height_descent dengan memo: raster lain dari string yang sama
+        (anchor atau paritas berbeda) tidak mengukur ulang lebar setiap prefix"""
+        extent = self._extents.get((s, prop, ismath))
+        if extent is None:
+            extent = self.get_text_width_height_descent(s, prop, ismath)
+            self._extents[(s, prop.copy(), ismath)] = extent  # Salinan: font artist bisa berubah
+        return extent
+
+
+class RevealRaster:
+    """Raster string penuh beserta batas setiap glyph; regions(chars) memilih layer per blok"""
+
+    def __init__(self, row, col, shape, full, box, visible, starts, cuts, bands, glyphs=None):
+        self.row, self.col = row, col  # Posisi kiri atas tile relatif terhadap anchor
+        self.shape = shape             # Ukuran tile (baris, kolom)
+        self.full = full               # Layer teks lengkap (termasuk kotak bbox)
+        self.box = box                 # Layer kotak bbox saja (None jika teks tanpa bbox)
+        self.glyphs = glyphs           # Layer glyph tanpa kotak (None jika teks tanpa bbox)
+        self.visible = visible         # Jumlah glyph (karakter bukan spasi) per panjang prefix
+        self.starts = starts           # Indeks glyph pertama setiap baris (+ total di akhir)
+        self.cuts = cuts               # Kolom tepi kanan setiap glyph di dalam tile
+        self.bands = bands             # Batas baris piksel antar baris teks
+
+    def regions(self, chars, separate_box=False):
+        """Blok (r0, r1, c0, c1, layer) untuk prefix chars karakter; O(log n) per frame
+
+        Dengan separate_box kotak bbox menjadi blok pertama seluas tile dan prefix diambil dari
+        layer glyph, jadi pemakai bisa memberi alpha teks tanpa ikut memudarkan kotaknya."""
+        glyphs = self.visible[min(chars, len(self.visible) - 1)]
+        height, width = self.shape
+        if glyphs <= 0:
+            return []
+        separate = separate_box and self.box is not None
+        text = self.glyphs if separate else self.full
+        head = [(0, height, 0, width, self.box)] if separate else []
+        if glyphs >= self.starts[-1]:
+            return head + [(0, height, 0, width, text)]
+        # Baris yang sedang diketik: kiri dari glyph terakhir tampil penuh, sisanya kotak saja
+        line = np.searchsorted(self.starts, glyphs, side='right') - 1
+        top, bottom = self.bands[line], self.bands[line + 1]
+        cut = self.cuts[glyphs - 1] if glyphs > self.starts[line] else 0
+        blocks = head + [(0, top, 0, width, text), (top, bottom, 0, cut, text)]
+        if not separate:
+            blocks += [(top, bottom, cut, width, self.box), (bottom, height, 0, width, self.box)]
+        return [block for block in blocks
+                if block[4] is not None and block[0] < block[1] and block[2] < block[3]]
+
+
+def text_style(text):
+    """Gaya yang menentukan layout dan raster teks (alpha tidak: diterapkan saat komposit)"""
+    patch = text.get_bbox_patch()
+    box = None if patch is None else (tuple(patch.get_facecolor()), tuple(patch.get_edgecolor()),
+                                      patch.get_linewidth())
+    return (text.get_fontproperties().copy(), to_rgba(text.get_color()),
+            text.get_horizontalalignment(), text.get_verticalalignment(), text.get_rotation(),
+            text.get_wrap(), text.get_linespacing(), box)
+
+
+@contextmanager
+def _placed_at(text, renderer, anchor):
+    """Sementara memindahkan titik acuan text tepat ke piksel anchor (baris dari atas, kolom)"""
+    saved = text._x, text._y, text._transform
+    text._x, text._y = anchor[1], renderer.height - anchor[0]
+    text._transform = IdentityTransform()
+    try:
+        yield text
+    finally:
+        text._x, text._y, text._transform = saved
+
+
+def wrap_at(text, s, renderer, anchor):
+    """String s setelah wrapping matplotlib untuk artist text dengan titik acuan di piksel anchor
+
+    Lebar wrap bergantung pada jarak anchor ke tepi figure; anchor bulat membuat hasilnya sama
+    untuk render berurutan maupun render yang dimulai dari frame mana pun. Lebar kata di-cache
+    matplotlib per renderer, jadi pemanggilan per frame murah."""
+    if not text.get_wrap():
+        return s
+    saved = text._text
+    text._text = s
+    try:
+        with _placed_at(text, renderer, anchor):
+            text._renderer = renderer  # Dipakai matplotlib untuk mengukur lebar baris
+            return text._get_wrapped_text()
+    finally:
+        text._text = saved
+
+
+def raster_anchor(text, renderer, anchor):
+    """Anchor tetap tempat raster teks digambar: tepi atau tengah frame sesuai alignment
+
+    Agg membulatkan posisi glyph dengan round half to even, jadi raster yang digambar di anchor
+    dengan paritas baris dan kolom yang sama hanya bergeser dari raster di anchor asli. Raster
+    ini bisa dipakai ulang selama teks bergerak; kuncinya (teks ter-wrap, anchor ini, gaya)."""
+    height, width = int(renderer.height), int(renderer.width)
+    row = {'top': 0, 'bottom': height - 2}.get(text.get_verticalalignment(), height // 2)
+    col = {'left': 0, 'right': width - 2}.get(text.get_horizontalalignment(), width // 2)
+    return row - row % 2 + anchor[0] % 2, col - col % 2 + anchor[1] % 2
+
+
+def draw_text_at(text, renderer, anchor):
+    """Menggambar text apa adanya (tanpa wrapping ulang) dengan titik acuan di piksel anchor"""
+    wrap = text._wrap
+    text._wrap = False  # Teks sudah di-wrap oleh wrap_at untuk anchor aslinya
+    try:
+        with _placed_at(text, renderer, anchor):
+            Text.draw(text, renderer)
+    finally:
+        text._wrap = wrap
+
+
+def rasterize_reveal(text, full_text, renderer, anchor=None, convert=np.copy):
+    """Layout dan rasterisasi full_text dengan gaya artist text (opacity penuh) sekali
+
+    renderer adalah LineRecorder seukuran frame; full_text yang sudah di-wrap (wrap_at) digambar
+    apa adanya dengan titik acuan di piksel anchor (baris, kolom), atau di posisinya sendiri
+    jika anchor None (posisi tile absolut), dan convert mengubah potongan RGBA uint8 ke format
+    layer pemakai."""
+    shown, alpha = text.get_text(), text.get_alpha()
+    Text.set_text(text, full_text)  # Metode dasar: status reveal artist tidak di-reset
+    text.set_alpha(None)  # Alpha diterapkan saat komposit, jadi fade tidak membuat raster baru
+    try:
+        renderer.clear()
+        if anchor is None:
+            text.draw(renderer)
+        else:
+            draw_text_at(text, renderer, anchor)
+        lines = renderer.lines
+        buffer = np.asarray(renderer.buffer_rgba())
+        # Alpha adalah byte tertinggi dari RGBA little-endian; piksel kosong berupa putih transparan
+        opaque = buffer.view('<u4')[..., 0] > 0x00FFFFFF
+        rows = np.flatnonzero(opaque.any(axis=1))
+        if len(rows) == 0 or not lines:
+            return None
+        y0, y1 = rows[0], rows[-1] + 1
+        cols = np.flatnonzero(opaque[y0:y1].any(axis=0))
+        x0, x1 = cols[0], cols[-1] + 1
+        full = convert(buffer[y0:y1, x0:x1])
+        # Kotak bbox digambar sendiri (posisi dan ukurannya sudah diperbarui oleh draw di atas),
+        # lalu glyph tanpa kotak agar alpha teks bisa diterapkan tanpa kotaknya
+        patch = text.get_bbox_patch()
+        box = glyphs = None
+        if patch is not None:
+            renderer.clear()
+            patch.draw(renderer)
+            box = convert(np.asarray(renderer.buffer_rgba())[y0:y1, x0:x1])
+            renderer.clear()
+            patch.set_visible(False)
+            try:
+                if anchor is None:
+                    text.draw(renderer)
+                else:
+                    draw_text_at(text, renderer, anchor)
+            finally:
+                patch.set_visible(True)
+            glyphs = convert(np.asarray(renderer.buffer_rgba())[y0:y1, x0:x1])
+    finally:
+        Text.set_text(text, shown)
+        text.set_alpha(alpha)
+
+    # Tepi kanan setiap glyph dari lebar prefix baris, diukur sekali per string
+    starts, cuts, extents = [0], [], []
+    for x, y, s, prop, ismath in lines:
+        width, height, descent = renderer.text_extent(s, prop, ismath)
+        extents.append((y - (height - descent), y + descent))
+        for i, char in enumerate(s):
+            if not char.isspace():
+                prefix = renderer.text_extent(s[:i + 1], prop, ismath)[0]
+                cuts.append(int(np.ceil(x + prefix)) - x0)
+        starts.append(len(cuts))
+    # Batas antar baris di tengah celah antara descent baris atas dan ascent baris bawah
+    bands = [0] + [int(round((bottom + top) / 2)) - y0
+                   for (_, bottom), (top, _) in zip(extents[:-1], extents[1:])] + [y1 - y0]
+    visible = np.concatenate([[0], np.cumsum([not char.isspace() for char in full_text])])
+    row, col = anchor or (0, 0)
+    return RevealRaster(y0 - row, x0 - col, (y1 - y0, x1 - x0), full, box,
+                        visible, np.array(starts), np.array(cuts, dtype=int), bands, glyphs)
+
+
+class RevealText3D(Text3D):
+    """Text3D dengan efek mesin ketik: prefix digambar dari raster string penuh yang di-cache"""
+
+    _reveal = None   # (teks penuh, jumlah karakter) selama efek berjalan, selain itu None
+    _rasters = None  # Cache LRU RevealRaster, dibuat saat reveal pertama digambar
+    _scratch = None  # LineRecorder offscreen untuk rasterisasi string penuh
+
+    @property
+    def reveal(self):
+        return self._reveal
+
+    def set_text(self, s):
+        self._reveal = None
+        super().set_text(s)
+
+    def set_reveal(self, full_text, chars):
+        """Menampilkan chars karakter pertama full_text (get_text tetap mengembalikan prefix)"""
+        super().set_text(full_text[:chars])
+        self._reveal = (full_text, chars)
+
+    def draw(self, renderer):
+        # Teks biasa, rasterisasi string penuh (LineRecorder) dan renderer non-Agg memakai Text3D
+        if self._reveal is None or isinstance(renderer, LineRecorder) \
+                or not isinstance(renderer, RendererAgg):
+            return super().draw(renderer)
+        if not self.get_visible() or not self.get_text():
+            return
+        full_text, chars = self._reveal
+        height = int(renderer.height)
+        cols, rows, _ = Camera(self.axes, height).project([self.get_position_3d()])
+        anchor = int(round(rows[0])), int(round(cols[0]))
+        raster = self._raster(full_text, renderer, anchor)
+        if raster is None:
+            return
+
+        # Prefix disusun dari layer ter-cache lalu digambar sebagai satu image
+        image = np.zeros(raster.shape + (4,), dtype=np.uint8)
+        for r0, r1, c0, c1, layer in raster.regions(chars):
+            image[r0:r1, c0:c1] = layer[r0:r1, c0:c1]
+        alpha = self.get_alpha()
+        if alpha is not None and alpha < 1:
+            image[..., 3] = image[..., 3] * alpha + 0.5
+        gc = renderer.new_gc()
+        # draw_image memakai titik kiri bawah (y dari bawah) dan baris image dari bawah ke atas
+        renderer.draw_image(gc, anchor[1] + raster.col,
+                            height - (anchor[0] + raster.row + raster.shape[0]), image[::-1])
+        gc.restore()
+        self.stale = False
+
+    def _raster(self, full_text, renderer, anchor):
+        """Raster string penuh untuk anchor, di-cache per (teks ter-wrap, ukuran frame, anchor
+        raster, gaya); posisi raster relatif terhadap anchor"""
+        if self._rasters is None:
+            self._rasters = OrderedDict()
+        scratch = self._scratch
+        if scratch is None or (scratch.width, scratch.height) != (renderer.width, renderer.height):
+            scratch = self._scratch = LineRecorder(int(renderer.width), int(renderer.height),
+                                                   renderer.dpi)
+        wrapped = wrap_at(self, full_text, scratch, anchor)
+        fixed = raster_anchor(self, scratch, anchor)
+        key = (wrapped, renderer.width, renderer.height, fixed, text_style(self))
+        if key in self._rasters:
+            self._rasters.move_to_end(key)
+            return self._rasters[key]
+        raster = rasterize_reveal(self, wrapped, scratch, fixed)
+        self._rasters[key] = raster
+        if len(self._rasters) > RASTER_CACHE_SIZE:
+            self._rasters.popitem(last=False)  # Buang raster yang paling lama tidak dipakai
+        return raster
+
+
+def reveal_text(text):
+    """Mengubah Text3D hasil ax.text menjadi RevealText3D (seperti art3d.text_2d_to_3d)"""
+    text.__class__ = RevealText3D
+    return text
@@ -0,0 +1,343 @@
+# Backend impostor: sphere dirasterisasi per piksel dengan NumPy, garis dan teks tetap digambar Agg
+import os  # Untuk pilihan backend dari environment
+from collections import OrderedDict  # Untuk cache LRU tile teks
+
+import numpy as np  # Untuk rasterisasi array
+from matplotlib import colors as mcolors  # Untuk konversi warna
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # Canvas Agg
+from matplotlib.text import Text  # Metode dasar set_text (status reveal tidak di-reset)
+
+from .camera import Camera  # Proyeksi kamera mplot3d ke piksel
+# Raster, wrap dan kunci cache teks
+from .glyph_cache import (LineRecorder, draw_text_at, raster_anchor, rasterize_reveal, text_style,
+                          wrap_at)
+from .particle_batch import LIGHT_SOURCE, unit_sphere_polys  # Cahaya dan mesh sphere mplot3d
+from .retained_scene import RetainedScene  # Antarmuka scene yang sama dengan backend mplot3d
+
+BACKEND_ENV = "ATOM_BACKEND"           # Variabel environment pemilih backend (juga dibaca worker)
+BACKENDS = ("mplot3d", "impostor")     # mplot3d = mesh Poly3DCollection, impostor = sphere per piksel
+DEFAULT_BACKEND = "mplot3d"            # Backend jika tidak dipilih
+TEXT_CACHE_SIZE = 128                  # Jumlah maksimum tile teks di cache
+
+
+def load_backend(name=None):
+    """Nama backend render berdasarkan argumen atau variabel environment ATOM_BACKEND"""
+    name = name or os.environ.get(BACKEND_ENV, DEFAULT_BACKEND)
+    if name not in BACKENDS:
+        raise ValueError(f"Backend render tidak dikenal: {name!r} (pilihan: {', '.join(BACKENDS)})")
+    return name
+
+
+def create_scene(ax, backend=DEFAULT_BACKEND, lod_tolerance=None):
+    """Scene retained untuk backend yang dipilih (LOD mesh hanya berlaku untuk mplot3d)"""
+    return ImpostorScene(ax) if backend == "impostor" else RetainedScene(ax, lod_tolerance)
+
+
+def fit_sphere(X, Y, Z):
+    """Pusat dan radius sphere dari grid mesh (least squares), error jika grid bukan sphere"""
+    points = np.stack([np.ravel(X), np.ravel(Y), np.ravel(Z)], axis=-1).astype(float)
+    # |p|^2 = 2 c.p + (r^2 - |c|^2) linear terhadap c dan konstanta
+    A = np.column_stack([2 * points, np.ones(len(points))])
+    solution = np.linalg.lstsq(A, (points ** 2).sum(axis=1), rcond=None)[0]
+    center = solution[:3]
+    radius = np.sqrt(solution[3] + center @ center)
+    if not np.allclose(np.linalg.norm(points - center, axis=1), radius, rtol=1e-6, atol=1e-9):
+        raise ValueError("Backend impostor hanya mendukung surface berbentuk sphere")
+    return center, radius
+
+
+def text_layer(tile):
+    """Tile RGBA uint8 -> kanal warna float per kanal dan coverage 0-1"""
+    tile = tile.astype(np.float32)
+    return [np.ascontiguousarray(tile[..., c]) for c in range(3)], tile[..., 3] / 255
+
+
+def blend(region, channels, alpha):
+    """Alpha blending kanal premultiplied ke blok RGBA uint8 secara in-place, satu kanal per operasi"""
+    inverse = 1 - alpha
+    for c, channel in enumerate(channels):
+        target = region[..., c]
+        out = target * inverse
+        out += channel
+        out += 0.5
+        np.copyto(target, out, casting='unsafe')
+
+
+class SphereImpostor:
+    """Sphere yang dirasterisasi per piksel: warna shading atau colormap, posisi dan alpha per frame"""
+
+    def __init__(self, center, radius, color=None, cmap=None, resolution=40, alpha=1.0):
+        self.center = np.asarray(center, dtype=float)  # Pusat saat dibuat
+        self.radius = float(radius)
+        if cmap is not None:
+            # Rentang z colormap sama dengan rata-rata z face mesh (seperti colormap_colors)
+            polys = self.center + self.radius * unit_sphere_polys(resolution)[0]
+            avg_z = polys[..., 2].mean(axis=-1)
+            self.z_range = (avg_z.min(), avg_z.max())
+            self.lut = (255 * cmap(np.linspace(0, 1, 256))[:, :3].T).astype(np.float32)  # (3, 256)
+            self.rgb = None
+        else:
+            self.rgb = 255 * np.array(mcolors.to_rgb(color), dtype=np.float32)
+            self.lut = None
+        self.visible = False
+        self.offset = None
+        self.alpha = 1.0 if alpha is None else float(alpha)
+
+    def position(self):
+        """Pusat sphere pada frame ini"""
+        return self.center if self.offset is None else self.center + self.offset
+
+    def colors(self, normal_z, shade, alpha):
+        """Kanal R, G, B per piksel (premultiplied alpha) dari normal z dan dot product normal-cahaya"""
+        if self.lut is not None:
+            z_min, z_max = self.z_range
+            z = self.center[2] + self.radius * normal_z
+            index = np.clip((z - z_min) * (255 / (z_max - z_min)), 0, 255).astype(np.intp)
+            return [lut.take(index) * alpha for lut in self.lut]
+        # Dot product [-1, 1] dipetakan ke fraksi shading [0.3, 1] (sama dengan shade_colors)
+        weight = (0.3 + 0.35 * (np.clip(shade, -1, 1) + 1)) * alpha
+        return [weight * value for value in self.rgb]
+
+
+class ImpostorScene(RetainedScene):
+    """Scene retained dengan sphere impostor; garis dan teks tetap artist matplotlib"""
+
+    def __init__(self, ax):
+        super().__init__(ax)
+        self.spheres = {}          # Sphere bernama pada bagian aktif (surface dan partikel)
+        self._depth = None         # Depth buffer (w) sphere opaque
+        self._depth_dirty = []     # Blok depth buffer yang ditulis frame sebelumnya
+        self._scratch = None       # Renderer offscreen untuk rasterisasi tile teks
+        self._text_tiles = OrderedDict()
+        ImpostorCanvas(ax.figure, self)  # Canvas figure diganti agar draw() memakai scene ini
+
+    def clear(self):
+        """Teardown artist dan sphere bagian sebelumnya"""
+        super().clear()
+        self.spheres.clear()
+
+    def add_surface(self, name, X, Y, Z, color=None, cmap=None, alpha=None, **kwargs):
+        """Surface sphere (mis. dari create_particle) disimpan sebagai impostor"""
+        center, radius = fit_sphere(X, Y, Z)
+        self.spheres[name] = SphereImpostor(center, radius, color, cmap, len(X), alpha)
+
+    def add_particle(self, name, x, y, z, radius, color, cmap=None, resolution=40):
+        """Partikel sphere sebagai impostor"""
+        self.spheres[name] = SphereImpostor((x, y, z), radius, color, cmap, resolution)
+
+    def surface(self, name, visible=True, offset=None, alpha=None):
+        """Seperti RetainedScene.surface: offset/alpha None berarti tidak berubah"""
+        sphere = self.spheres[name]
+        sphere.visible = visible
+        if not visible:
+            return
+        if offset is not None:
+            sphere.offset = np.asarray(offset, dtype=float)
+        if alpha is not None:
+            sphere.alpha = float(np.clip(alpha, 0, 1))
+
+    def particle(self, name, visible=True, offset=None, alpha=None):
+        """Seperti ParticleBatch.set: offset None berarti posisi dasar"""
+        sphere = self.spheres[name]
+        sphere.visible = visible
+        sphere.offset = None if offset is None else np.asarray(offset, dtype=float)
+        if alpha is not None:
+            sphere.alpha = float(np.clip(alpha, 0, 1))
+
+    def counts(self):
+        """Jumlah objek yang terlihat; impostor tidak memiliki poligon"""
+        artists = sum(artist.get_visible() for artist in self.artists.values())
+        return int(artists + sum(sphere.visible for sphere in self.spheres.values())), 0
+
+    def render(self, renderer):
+        """Menggambar satu frame ke buffer renderer: latar, garis, sphere, lalu teks
+
+        Hanya sphere yang dirasterisasi NumPy. Garis tetap digambar Agg (sekitar 1,3 ms/frame
+        pada bagian dengan orbit) dan tile teks ter-cache di-blend setiap frame; keduanya
+        menjadi batas bawah waktu frame backend ini."""
+        frame = np.asarray(renderer.buffer_rgba())
+        background = np.array(mcolors.to_rgba(self.ax.figure.get_facecolor())) * 255 + 0.5
+        frame.view(np.uint32).fill(background.astype(np.uint8).view(np.uint32)[0])
+        camera = Camera(self.ax, frame.shape[0])
+
+        # Garis lebih dulu: di mplot3d garis (zorder 2) selalu tergambar di bawah koleksi surface
+        for line in self.ax.lines:
+            if line.get_visible():
+                line.draw(renderer)
+        self._draw_spheres(frame, camera)
+        for text in self.ax.texts:
+            if text.get_visible() and text.get_text():
+                self._draw_text(frame, camera, text)
+
+    def _draw_spheres(self, frame, camera):
+        """Semua sphere terlihat, diurutkan dari belakang ke depan dengan depth test"""
+        if self._depth is None or self._depth.shape != frame.shape[:2]:
+            self._depth = np.full(frame.shape[:2], np.inf, dtype=np.float32)
+        for r0, r1, c0, c1 in self._depth_dirty:
+            self._depth[r0:r1, c0:c1] = np.inf
+        self._depth_dirty.clear()
+
+        layers = []
+        for sphere in self.spheres.values():
+            if not sphere.visible or sphere.alpha <= 0:
+                continue
+            center = sphere.position()
+            depth = camera.project(center[np.newaxis])[2][0]
+            extent = sphere.radius * np.linalg.norm(camera.depth_gradient)
+            if sphere.alpha < 1:
+                # Sphere transparan: permukaan belakang terlihat melalui permukaan depan
+                layers.append((depth + extent, sphere, center, True))
+            layers.append((depth - extent, sphere, center, False))
+        layers.sort(key=lambda layer: layer[0], reverse=True)
+        for _, sphere, center, back in layers:
+            self._draw_sphere(frame, camera, sphere, center, back)
+
+    def _draw_sphere(self, frame, camera, sphere, center, back):
+        """Satu permukaan sphere sebagai elips di layar dengan normal analitik per piksel"""
+        (col,), (row,), (center_depth,) = camera.project(center[np.newaxis])
+        if center_depth <= 0:
+            return
+        # Proyeksi dilinearkan di pusat sphere: offset piksel d -> normal n = P d + s k,
+        # dengan k arah pandang (ruang nol jacobian) dan s = sqrt(1 - |P d|^2)
+        radius = sphere.radius
+        J = camera.jacobian(center)
+        P = np.linalg.pinv(J) / radius
+        k = np.cross(J[0], J[1])
+        k /= np.linalg.norm(k)
+        if k @ camera.depth_gradient > 0:
+            k = -k  # Menghadap kamera (w mengecil)
+        if back:
+            k = -k
+        Q = (P.T @ P).astype(np.float32)  # Elips siluet: d^T Q d <= 1
+        half = radius * np.sqrt(np.diag(J @ J.T))  # Setengah lebar kotak elips (kolom, baris)
+        height, width = frame.shape[:2]
+        c0, c1 = max(int(col - half[0]) - 1, 0), min(int(np.ceil(col + half[0])) + 2, width)
+        r0, r1 = max(int(row - half[1]) - 1, 0), min(int(np.ceil(row + half[1])) + 2, height)
+        if r0 >= r1 or c0 >= c1:
+            return
+
+        dx = np.arange(c0, c1, dtype=np.float32) + np.float32(0.5 - col)
+        dy = (np.arange(r0, r1, dtype=np.float32) + np.float32(0.5 - row))[:, np.newaxis]
+        inside = 1 - ((Q[0, 0] * dx * dx) + (Q[1, 1] * dy * dy + (2 * Q[0, 1] * dy) * dx))
+        # Cakupan tepi satu piksel (antialiasing) dari jari-jari rata-rata elips
+        coverage = inside * np.float32(0.5 * np.linalg.det(Q.astype(float)) ** -0.25)
+        coverage += 0.5
+        np.clip(coverage, 0, 1, out=coverage)
+        s = np.sqrt(np.maximum(inside, 0))
+
+        def linear(vector):
+            """Komponen normal searah vektor: (P^T v) . d + s (k . v)"""
+            a, b = (P.T @ vector).astype(np.float32)
+            return (a * dx + b * dy) + s * np.float32(k @ vector)
+
+        # Depth test hanya jika blok ini sudah ditulis sphere opaque pada frame ini
+        opaque = sphere.alpha >= 1 and not back
+        occluded = any(a0 < r1 and r0 < a1 and b0 < c1 and c0 < b1
+                       for a0, a1, b0, b1 in self._depth_dirty)
+        depth = self._depth[r0:r1, c0:c1]
+        if opaque or occluded:
+            w = np.float32(center_depth) + np.float32(radius) * linear(camera.depth_gradient)
+            if occluded:
+                coverage *= w < depth
+                if not coverage.any():
+                    return
+
+        # Normal dalam koordinat data, sama dengan normal face mesh
+        shade = linear(LIGHT_SOURCE.direction)
+        normal_z = linear(np.array([0.0, 0.0, 1.0])) if sphere.lut is not None else None
+        alpha = coverage * np.float32(sphere.alpha)
+        blend(frame[r0:r1, c0:c1], sphere.colors(normal_z, shade, alpha), alpha)
+        if opaque:
+            # Sphere opaque menutupi permukaan di belakangnya
+            np.copyto(depth, w, where=coverage >= 0.5)
+            self._depth_dirty.append((r0, r1, c0, c1))
+
+    def _draw_text(self, frame, camera, text):
+        """Teks 3D: tile di-cache per (teks ter-wrap, anchor raster, gaya) lalu di-blend"""
+        cols, rows, _ = camera.project([text.get_position_3d()])
+        anchor_row, anchor_col = int(round(rows[0])), int(round(cols[0]))
+        scratch = self._scratch_renderer(frame.shape)
+        # Teks bertahap (RevealText3D) memakai satu raster string penuh untuk semua prefix
+        reveal = getattr(text, 'reveal', None)
+        # Wrap mengikuti anchor asli; raster digambar di anchor tetap dan dipakai ulang saat bergerak
+        wrapped = wrap_at(text, text.get_text() if reveal is None else reveal[0], scratch,
+                          (anchor_row, anchor_col))
+        fixed = raster_anchor(text, scratch, (anchor_row, anchor_col))
+        key = (text, reveal is not None, wrapped, fixed, text_style(text))
+        if key in self._text_tiles:
+            self._text_tiles.move_to_end(key)
+            tile = self._text_tiles[key]
+        else:
+            tile = self._rasterize_text(text, wrapped, fixed, reveal is not None)
+            self._text_tiles[key] = tile
+            if len(self._text_tiles) > TEXT_CACHE_SIZE:
+                self._text_tiles.popitem(last=False)  # Buang tile yang paling lama tidak dipakai
+        if tile is None:
+            return
+
+        alpha = np.float32(1.0 if text.get_alpha() is None else text.get_alpha())
+        if reveal is None:
+            dr, dc, (rgb, coverage) = tile
+            self._blend_tile(frame, anchor_row + dr, anchor_col + dc, rgb, coverage, alpha)
+            return
+        for r0, r1, c0, c1, (rgb, coverage) in tile.regions(reveal[1]):
+            self._blend_tile(frame, anchor_row + tile.row + r0, anchor_col + tile.col + c0,
+                             [channel[r0:r1, c0:c1] for channel in rgb], coverage[r0:r1, c0:c1], alpha)
+
+    @staticmethod
+    def _blend_tile(frame, r0, c0, rgb, coverage, alpha):
+        """Blend tile (kanal warna + coverage) di posisi piksel (r0, c0), dipotong di tepi frame"""
+        height, width = frame.shape[:2]
+        r1, c1 = r0 + coverage.shape[0], c0 + coverage.shape[1]
+        tr0, tc0 = max(-r0, 0), max(-c0, 0)
+        tr1 = coverage.shape[0] - max(r1 - height, 0)
+        tc1 = coverage.shape[1] - max(c1 - width, 0)
+        if tr0 >= tr1 or tc0 >= tc1:
+            return
+        alpha = coverage[tr0:tr1, tc0:tc1] * alpha
+        blend(frame[r0 + tr0:r0 + tr1, c0 + tc0:c0 + tc1],
+              [channel[tr0:tr1, tc0:tc1] * alpha for channel in rgb], alpha)
+
+    def _scratch_renderer(self, shape):
+        """Renderer offscreen seukuran frame untuk wrapping dan rasterisasi teks"""
+        height, width = shape[:2]
+        if self._scratch is None or (self._scratch.height, self._scratch.width) != (height, width):
+            self._scratch = LineRecorder(width, height, self.ax.figure.dpi)
+        return self._scratch
+
+    def _rasterize_text(self, text, wrapped, anchor, reveal=False):
+        """Menggambar teks ter-wrap dengan Agg (opacity penuh) lalu memotong tile relatif anchor"""
+        anchor_row, anchor_col = anchor
+        if reveal:
+            return rasterize_reveal(text, wrapped, self._scratch, anchor, convert=text_layer)
+        self._scratch.clear()
+        shown, alpha = text.get_text(), text.get_alpha()
+        Text.set_text(text, wrapped)
+        text.set_alpha(None)  # Alpha diterapkan saat komposit, jadi fade tidak membuat tile baru
+        try:
+            draw_text_at(text, self._scratch, anchor)
+        finally:
+            Text.set_text(text, shown)
+            text.set_alpha(alpha)
+        buffer = np.asarray(self._scratch.buffer_rgba())
+        # Alpha adalah byte tertinggi dari RGBA little-endian; piksel kosong berupa putih transparan
+        opaque = buffer.view('<u4')[..., 0] > 0x00FFFFFF
+        rows = np.flatnonzero(opaque.any(axis=1))
+        if len(rows) == 0:
+            return None
+        y0, y1 = rows[0], rows[-1] + 1
+        cols = np.flatnonzero(opaque[y0:y1].any(axis=0))
+        x0, x1 = cols[0], cols[-1] + 1
+        return y0 - anchor_row, x0 - anchor_col, text_layer(buffer[y0:y1, x0:x1])
+
+
+class ImpostorCanvas(FigureCanvasAgg):
+    """Canvas Agg yang menggambar scene impostor tanpa Figure.draw (writer tidak perlu berubah)"""
+
+    def __init__(self, figure, scene):
+        super().__init__(figure)
+        self.scene = scene
+
+    def draw(self):
+        self.renderer = self.get_renderer()
+        self.scene.render(self.renderer)
@@ -0,0 +1,70 @@
+# Level of detail sphere: resolusi mesh dipilih dari radius proyeksi di layar, transisi dengan geomorph
+from functools import lru_cache  # Untuk cache grid morph
+
+import numpy as np  # Untuk operasi array
+
+from .geometry_cache import geometry  # Grid sphere satuan per resolusi
+
+LOD_LEVELS = (8, 12, 16, 24, 32, 48, 64)  # Resolusi grid yang tersedia (titik per sumbu)
+MORPH_STEPS = 8                           # Tahap transisi antar dua level berurutan
+
+
+def lod_resolution(pixel_radius, tolerance):
+    """Resolusi kontinu agar siluet sphere menyimpang paling banyak tolerance piksel"""
+    # Segmen selebar sudut a menyimpang r (1 - cos(a/2)) dari lingkaran: segmen >= pi / acos(1 - tol/r)
+    half_angle = np.arccos(np.clip(1 - tolerance / max(pixel_radius, 1e-9), -1, 1))
+    return np.pi / half_angle + 1
+
+
+def lod_levels(max_resolution):
+    """Level standar di bawah resolusi maksimum, ditambah resolusi maksimum itu sendiri"""
+    return tuple(level for level in LOD_LEVELS if level < max_resolution) + (max_resolution,)
+
+
+def lod_key(resolution, max_resolution):
+    """Kunci mesh (level kasar, level halus, tahap morph) untuk resolusi kontinu"""
+    levels = lod_levels(max_resolution)
+    resolution = min(max(resolution, levels[0]), levels[-1])
+    index = int(np.searchsorted(levels, resolution))  # levels[index - 1] < resolution <= levels[index]
+    if index == 0:
+        return levels[0], levels[0], 0
+    coarse, fine = levels[index - 1], levels[index]
+    step = round((resolution - coarse) / (fine - coarse) * MORPH_STEPS)
+    if step == 0:
+        return coarse, coarse, 0
+    if step == MORPH_STEPS:
+        return fine, fine, 0
+    return coarse, fine, step
+
+
+def _interpolation(fine, coarse):
+    """Matriks (fine, coarse) interpolasi linear titik grid halus di antara titik grid kasar"""
+    position = np.linspace(0, coarse - 1, fine)
+    left = np.minimum(position.astype(int), coarse - 2)
+    weight = position - left
+    matrix = np.zeros((fine, coarse))
+    rows = np.arange(fine)
+    matrix[rows, left] = 1 - weight
+    matrix[rows, left + 1] += weight
+    return matrix
+
+
+@lru_cache(maxsize=64)
+def morph_sphere(coarse, fine, step):
+    """Grid sphere satuan level halus, digeser sebagian ke permukaan level kasar (geomorph)
+
+    Pada tahap 0 grid identik secara visual dengan level kasar dan pada tahap MORPH_STEPS
+    sama dengan level halus, sehingga pergantian level tidak terlihat melompat."""
+    grids = geometry('sphere', fine)
+    if coarse == fine:
+        return grids
+    W = _interpolation(fine, coarse)
+    t = step / MORPH_STEPS
+    morphed = []
+    for grid, coarse_grid in zip(grids, geometry('sphere', coarse)):
+        # Titik grid halus di atas quad bilinear grid kasar, lalu digeser menuju posisi aslinya
+        flat = W @ coarse_grid @ W.T
+        array = flat + t * (grid - flat)
+        array.setflags(write=False)
+        morphed.append(array)
+    return tuple(morphed)
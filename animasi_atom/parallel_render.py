@@ -0,0 +1,174 @@
+# Render paralel multi-proses untuk pipeline animasi atom
+import importlib  # Untuk memuat modul scene di setiap worker
+import multiprocessing  # Untuk pool worker
+import os  # Untuk operasi sistem file
+import subprocess  # Untuk menjalankan FFmpeg
+
+from .checkpoint import CHECKPOINT_DIR, CHUNK_FRAMES, ChunkManifest  # Potongan dan manifest
+from .preview_tap import SampleTap  # Sampel preview GIF per potongan
+from .renditions import rendition_paths  # Path output setiap rendition
+from .telemetry import JobProgress, RenderTelemetry  # Telemetri per frame (opsional)
+from .video_writer import RawVideoWriter, audio_mux_args, render_frames  # Writer rawvideo ke FFmpeg
+
+
+def _render_chunk(task):
+    """Worker: render satu potongan frame ke file video sendiri (satu file per rendition)
+
+    Dengan preview, sampel GIF dan poster potongan disimpan di samping file videonya dan path
+    file sampel ditambahkan di akhir daftar hasil."""
+    module_name, start, stop, path, fps, size, bitrate, extra_args, renditions, preview = task
+
+    # Setiap worker memiliki salinan modul scene sendiri (figure/axes sendiri); import_module
+    # hanya memuat scene jika belum diwarisi dari proses utama
+    scene = importlib.import_module(module_name)
+
+    # Telemetri ditulis ke file yang sama oleh semua worker (satu baris per write); progress
+    # dan ETA seluruh job dilaporkan proses utama (render_checkpointed)
+    telemetry = RenderTelemetry.from_env(getattr(scene, 'TABLE', None), getattr(scene, 'TIMELINE', None),
+                                         getattr(scene, 'scene', None), progress=False)
+
+    # Sampel preview dipilih dari nomor frame absolut, sama dengan tap render serial
+    tap = None
+    if preview:
+        tap = SampleTap(path, start, stop, size, scene.TOTAL_FRAMES, scene.TABLE.spans)
+
+    # Logika update yang sama dengan render serial
+    try:
+        with RawVideoWriter(path, fps, size, bitrate=bitrate, extra_args=extra_args,
+                            faststart=False, renditions=renditions) as writer:
+            render_frames(scene.fig, scene.update, range(start, stop), writer,
+                          getattr(scene, 'post_process', None), telemetry, tap)
+    except BaseException:
+        if tap is not None:
+            tap.discard()
+        raise
+    paths = rendition_paths(path, renditions)
+    return paths + [tap.close()] if tap is not None else paths
+
+
+def concat_videos(paths, output_path, audio_path=None):
+    """Menggabungkan potongan video berurutan tanpa encode ulang (opsional dengan audio)"""
+    list_path = output_path + ".txt"
+    with open(list_path, "w") as f:
+        for path in paths:
+            f.write(f"file '{os.path.abspath(path)}'\n")
+
+    cmd = [
+        'ffmpeg',
+        '-y',
+        '-loglevel', 'warning',
+        '-f', 'concat',    # Demuxer concat
+        '-safe', '0',      # Izinkan path absolut
+        '-i', list_path,
+    ]
+    if audio_path:
+        # Video dan audio disalin apa adanya ke file output
+        cmd += ['-i', audio_path, '-c:v', 'copy'] + audio_mux_args()
+    else:
+        cmd += ['-c', 'copy']  # Salin stream apa adanya
+    cmd += ['-movflags', '+faststart', output_path]
+    try:
+        subprocess.run(cmd, check=True)
+    finally:
+        os.remove(list_path)
+
+
+def _render_indexed(item):
+    """Worker: render potongan beserta indeksnya (hasil imap_unordered bisa diurutkan lagi)"""
+    index, task = item
+    return index, _render_chunk(task)
+
+
+def render_chunks(module_name, chunks, fps, workers, size=(1080, 1920), bitrate=None,
+                  extra_args=None, renditions=None, on_done=None, preview=False):
+    """Render daftar potongan (start, stop, path); urutan hasil sama dengan urutan input
+
+    Setiap hasil adalah daftar path: potongan utama diikuti potongan setiap rendition (dan
+    file sampel preview jika preview). on_done(index, paths) dipanggil di proses utama segera
+    setelah sebuah potongan selesai."""
+    tasks = [(module_name, start, stop, path, fps, size, bitrate, extra_args, renditions, preview)
+             for start, stop, path in chunks]
+    results = [None] * len(tasks)
+    if workers <= 1 or len(tasks) <= 1:
+        completed = map(_render_indexed, enumerate(tasks))
+        pool = None
+    else:
+        # Dengan fork worker mewarisi modul scene yang sudah dimuat proses utama (tanpa import ulang)
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        pool = context.Pool(processes=min(workers, len(tasks)))
+        # imap_unordered: potongan dicatat begitu selesai, urutan dikembalikan lewat indeks
+        completed = pool.imap_unordered(_render_indexed, enumerate(tasks))
+    try:
+        for index, paths in completed:
+            results[index] = paths
+            if on_done is not None:
+                on_done(index, paths)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    return results
+
+
+def render_checkpointed(module_name, manifests, fps, workers, size=(1080, 1920), bitrate=None,
+                        extra_args=None, renditions=None, preview=False):
+    """Render potongan yang belum selesai dari beberapa manifest dalam satu pool
+
+    Setiap potongan dicatat di manifest-nya begitu selesai, jadi render yang terhenti
+    dilanjutkan dari potongan pertama yang belum ada. Mengembalikan path per potongan
+    setiap manifest (gagal jika ada potongan yang hilang atau usang)."""
+    chunks, owners = [], []
+    for manifest in manifests:
+        for start, stop in manifest.pending():
+            chunks.append((start, stop, manifest.chunk_path(start, stop)))
+            owners.append(manifest)
+    total = sum(len(manifest.ranges) for manifest in manifests)
+    print(f"Potongan dari checkpoint: {total - len(chunks)}/{total}, dirender: {len(chunks)}")
+
+    def mark_done(index, paths):
+        start, stop, _ = chunks[index]
+        owners[index].mark_done(start, stop, paths)
+
+    # Progress job dari record telemetri semua worker; total hanya frame yang benar-benar dirender
+    progress = JobProgress.from_env(name=module_name.rsplit(".", 1)[-1])
+    if progress is not None:
+        progress.start(sum(stop - start for start, stop, _ in chunks))
+    try:
+        render_chunks(module_name, chunks, fps, workers, size, bitrate, extra_args, renditions,
+                      on_done=mark_done, preview=preview)
+    finally:
+        if progress is not None:
+            progress.finish()
+    return [manifest.paths() for manifest in manifests]
+
+
+def render_parallel(module_name, output_path, total_frames, fps, workers,
+                    size=(1080, 1920), bitrate=None, extra_args=None, audio_path=None,
+                    chunk_frames=CHUNK_FRAMES, renditions=None, checkpoint_dir=CHECKPOINT_DIR,
+                    preview=None):
+    """Render semua frame dengan pool worker lalu gabungkan sesuai urutan frame
+
+    Potongan berukuran tetap disimpan di checkpoint_dir sampai video akhir tersimpan, jadi
+    render yang gagal dilanjutkan dari potongan yang belum selesai. preview (PreviewTap)
+    menerima sampel GIF dan poster setiap potongan sesuai urutan frame."""
+    # Import di sini: segment_cache sendiri memakai modul ini
+    from .segment_cache import scene_key
+
+    module = importlib.import_module(module_name)
+    config = (module_name, total_frames, fps, tuple(size), bitrate, list(extra_args or []),
+              list(renditions or []), chunk_frames)
+    manifest = ChunkManifest(os.path.join(checkpoint_dir, f"{module_name}_{module.QUALITY['name']}"),
+                             scene_key(module, config), 0, total_frames, chunk_frames, renditions,
+                             preview is not None)
+
+    [paths] = render_checkpointed(module_name, [manifest], fps, workers, size, bitrate,
+                                  extra_args, renditions, preview is not None)
+    if preview is not None:
+        for outputs in paths:
+            preview.add_samples(outputs[0])
+    # Setiap rendition digabung dari potongannya sendiri (dengan audio yang sama)
+    for i, path in enumerate(rendition_paths(output_path, renditions)):
+        concat_videos([outputs[i] for outputs in paths], path, audio_path)
+    manifest.remove()
+    return output_path
@@ -0,0 +1,147 @@
+# Render partikel batch: semua sphere satu frame dalam satu Poly3DCollection
+from functools import lru_cache  # Untuk cache normal mesh satuan
+
+import numpy as np  # Untuk operasi array
+from matplotlib import colors as mcolors  # Untuk konversi warna dan LightSource
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection  # Koleksi poligon 3D
+
+from .camera import Camera  # Radius proyeksi partikel untuk LOD
+from .geometry_cache import geometry, surface_polys  # Mesh sphere satuan dan urutan quad plot_surface
+from .lod import lod_key, lod_resolution, morph_sphere  # Pemilihan resolusi dan geomorph antar level
+
+# Sumber cahaya default mplot3d (sama dengan shading plot_surface)
+LIGHT_SOURCE = mcolors.LightSource(azdeg=225, altdeg=19.4712)
+
+
+def face_normals(polys):
+    """Normal per face dari tiga titik quad, seperti mplot3d"""
+    normals = np.cross(polys[:, 0] - polys[:, 1], polys[:, 1] - polys[:, 2])
+    polys.setflags(write=False)
+    normals.setflags(write=False)
+    return polys, normals
+
+
+@lru_cache(maxsize=16)
+def unit_sphere_polys(resolution):
+    """Quad sphere satuan dan normal per face untuk satu resolusi"""
+    return face_normals(surface_polys(*geometry('sphere', resolution)))
+
+
+@lru_cache(maxsize=64)
+def lod_sphere_polys(coarse, fine, step):
+    """Quad dan normal sphere satuan untuk satu kunci LOD (level halus di-morph dari level kasar)"""
+    if coarse == fine:
+        return unit_sphere_polys(fine)
+    return face_normals(surface_polys(*morph_sphere(coarse, fine, step)))
+
+
+def shade_colors(color, normals):
+    """Shading warna per face berdasarkan normal (setara plot_surface shade=True)"""
+    with np.errstate(invalid="ignore"):
+        shade = (normals / np.linalg.norm(normals, axis=1, keepdims=True)) @ LIGHT_SOURCE.direction
+    shade[np.isnan(shade)] = 0
+    # Dot product [-1, 1] dipetakan ke fraksi shading [0.3, 1]
+    fraction = 0.3 + 0.7 * (shade + 1) / 2
+    colors = np.tile(mcolors.to_rgba(color), (len(normals), 1))
+    colors[:, :3] *= fraction[:, np.newaxis]
+    return colors
+
+
+def colormap_colors(cmap, polys):
+    """Warna per face dari colormap berdasarkan rata-rata z (setara plot_surface cmap)"""
+    avg_z = polys[..., 2].mean(axis=-1)
+    norm = mcolors.Normalize(avg_z.min(), avg_z.max())
+    return cmap(norm(avg_z))
+
+
+class ParticleBatch:
+    """Semua partikel digabung dalam satu koleksi: satu sort dan satu draw per frame
+
+    Dengan tolerance (piksel), resolusi mesh setiap partikel dipilih per frame dari radius
+    proyeksinya; resolution menjadi batas atas."""
+
+    def __init__(self, ax, tolerance=None):
+        self.ax = ax
+        self.collection = Poly3DCollection(np.empty((0, 4, 3)), edgecolor='none')
+        ax.add_collection3d(self.collection, autolim=False)
+        self.tolerance = tolerance  # Toleransi LOD dalam piksel (None = resolusi tetap)
+        self.particles = {}   # name -> (pusat, radius, warna, cmap, resolusi maksimum)
+        self.meshes = {}      # name -> (kunci LOD, poligon dasar, warna dasar)
+        self.state = {}       # name -> (visible, offset, alpha)
+        self._dirty = True    # Koleksi perlu disusun ulang
+
+    def add(self, name, center, radius, color, cmap=None, resolution=40):
+        """Menambahkan sphere ke batch (tersembunyi sampai ditampilkan)"""
+        self.particles[name] = (np.asarray(center, dtype=float), radius, color, cmap, resolution)
+        self._build(name, (resolution, resolution, 0))
+        self.state[name] = (False, None, 1.0)
+        self._dirty = True
+
+    def _build(self, name, key):
+        """Poligon dan warna dasar satu partikel untuk kunci LOD"""
+        center, radius, color, cmap, _ = self.particles[name]
+        unit_polys, normals = lod_sphere_polys(*key)
+        polys = center + radius * unit_polys
+        if cmap is not None:
+            base_colors = colormap_colors(cmap, polys)
+        else:
+            base_colors = shade_colors(color, normals)
+        self.meshes[name] = (key, polys, base_colors)
+
+    def set(self, name, visible=True, offset=None, alpha=None):
+        """Memperbarui visibilitas, posisi dan alpha satu partikel"""
+        state = (visible, None if offset is None else tuple(offset),
+                 self.state[name][2] if alpha is None else alpha)
+        if state != self.state[name]:
+            self.state[name] = state
+            self._dirty = True
+
+    def clear(self):
+        """Mengosongkan batch saat bagian berganti"""
+        self.particles.clear()
+        self.meshes.clear()
+        self.state.clear()
+        self._dirty = True
+
+    def counts(self):
+        """Jumlah partikel dan quad yang terlihat"""
+        visible = [name for name, state in self.state.items() if state[0]]
+        return len(visible), sum(len(self.meshes[name][1]) for name in visible)
+
+    def update_lod(self):
+        """Memilih ulang resolusi partikel terlihat dari kamera frame ini"""
+        camera = Camera(self.ax, self.ax.figure.bbox.height)
+        for name, (center, radius, _, _, resolution) in self.particles.items():
+            visible, offset, _ = self.state[name]
+            if not visible:
+                continue
+            position = center if offset is None else center + offset
+            key = lod_key(lod_resolution(camera.pixel_radius(position, radius), self.tolerance),
+                          resolution)
+            if key != self.meshes[name][0]:
+                self._build(name, key)
+                self._dirty = True
+
+    def commit(self):
+        """Menyusun semua quad dan warna partikel yang terlihat ke dalam koleksi"""
+        if self.tolerance is not None:
+            self.update_lod()
+        if not self._dirty:
+            return
+        verts, colors = [], []
+        for name, (_, polys, base_colors) in self.meshes.items():
+            visible, offset, alpha = self.state[name]
+            if not visible:
+                continue
+            verts.append(polys if offset is None else polys + offset)
+            face_colors = base_colors.copy()
+            face_colors[:, 3] = np.clip(alpha, 0, 1)
+            colors.append(face_colors)
+
+        if verts:
+            self.collection.set_verts(np.concatenate(verts))
+            self.collection.set_facecolor(np.concatenate(colors))
+        else:
+            self.collection.set_verts(np.empty((0, 4, 3)))
+            self.collection.set_facecolor(np.empty((0, 4)))
+        self._dirty = False
@@ -0,0 +1,211 @@
+# Preview interaktif: scene diputar mengikuti waktu nyata, frame dilewati jika update tertinggal
+# (python -m animasi_atom.preview [scene]; spasi = pause, panah = geser, 1-9 = bagian)
+import argparse  # Untuk argumen command line
+import collections  # Untuk jendela fps
+import math  # Untuk faktor perkecil tampilan
+import sys  # Untuk exit code
+import time  # Untuk jam waktu nyata
+
+import numpy as np  # Untuk buffer frame
+
+from .api import SCENES, load_scene  # Scene yang diputar
+
+PREVIEW_QUALITY = "preview"  # Profil default preview (lebih ringan dari production)
+MAX_HEIGHT = 960             # Tinggi tampilan maksimum (piksel); frame diperkecil dengan stride
+SEEK_SECONDS = 2.0           # Lompatan panah kiri/kanan
+
+
+class PreviewPlayer:
+    """Jam preview: frame dipilih dari waktu nyata, frame yang terlewat dihitung sebagai drop
+
+    step() merender frame target terbaru (update + draw offscreen + post-process yang sama
+    dengan render video) dan mengembalikan buffer RGBA-nya, atau None jika frame belum berganti."""
+
+    def __init__(self, module, clock=time.perf_counter):
+        self.module = module
+        self.fps = module.VIDEO_FPS
+        self.total_frames = module.TOTAL_FRAMES
+        self.spans = module.TABLE.spans                    # Rentang frame setiap bagian
+        self.names = [clip.name for clip in module.TIMELINE.clips]
+        self.clock = clock
+        self.paused = False
+        self.frame = None                                  # Frame terakhir yang digambar
+        self._origin_time = clock()
+        self._origin_frame = 0
+        self._seeked = False                               # Lompatan berikutnya bukan drop
+        self._recent = collections.deque()                 # Waktu frame digambar (1 detik terakhir)
+        # Statistik per bagian: frame digambar, frame di-drop, total waktu render
+        self.drawn = [0] * len(self.spans)
+        self.dropped = [0] * len(self.spans)
+        self.render_s = [0.0] * len(self.spans)
+
+    def section(self, frame):
+        """Indeks bagian sebuah frame"""
+        return int(self.module.TABLE.section[frame])
+
+    def seek(self, frame):
+        """Pindah ke frame tertentu; jam dimulai ulang dari sana (tanpa dihitung drop)"""
+        self._origin_frame = int(frame) % self.total_frames
+        self._origin_time = self.clock()
+        self._seeked = True
+
+    def seek_section(self, section):
+        """Pindah ke awal bagian"""
+        if 0 <= section < len(self.spans):
+            self.seek(self.spans[section][0])
+
+    def toggle_pause(self):
+        """Pause atau lanjutkan dari frame yang sedang tampil"""
+        self.paused = not self.paused
+        if self.frame is not None:
+            self._origin_frame = self.frame
+        self._origin_time = self.clock()
+
+    def step_frame(self, delta):
+        """Maju/mundur satu frame saat pause"""
+        current = self._origin_frame if self.frame is None else self.frame
+        self.seek(current + delta)
+
+    def target(self):
+        """Frame yang seharusnya tampil sekarang menurut waktu nyata (diulang di akhir video)"""
+        if self.paused:
+            return self._origin_frame
+        elapsed = self.clock() - self._origin_time
+        return (self._origin_frame + int(elapsed * self.fps)) % self.total_frames
+
+    def step(self):
+        """Merender frame target jika sudah berganti; frame di antaranya dilewati"""
+        target = self.target()
+        if target == self.frame:
+            return None
+        seeked, self._seeked = self._seeked, False
+        if self.frame is not None and not seeked and not self.paused:
+            # Frame yang terlewat sejak frame terakhir (termasuk saat video berulang)
+            skipped = (target - self.frame - 1) % self.total_frames
+            # Drop dicatat pada bagian frame terakhir: bagian itulah yang terlalu berat
+            self.dropped[self.section(self.frame)] += skipped
+
+        started = self.clock()
+        self.module.update(target)
+        canvas = self.module.fig.canvas
+        canvas.draw()
+        buffer = np.asarray(canvas.buffer_rgba())
+        post_process = getattr(self.module, 'post_process', None)
+        if post_process is not None:
+            post_process(buffer)
+        finished = self.clock()
+
+        section = self.section(target)
+        self.drawn[section] += 1
+        self.render_s[section] += finished - started
+        self._recent.append(finished)
+        while self._recent and finished - self._recent[0] > 1.0:
+            self._recent.popleft()
+        self.frame = target
+        return buffer
+
+    def achieved_fps(self):
+        """Frame yang benar-benar digambar dalam satu detik terakhir"""
+        return len(self._recent) if not self.paused else 0
+
+    def status(self):
+        """Baris status: waktu, bagian, fps tercapai dan jumlah drop"""
+        frame = self.frame or 0
+        section = self.section(frame)
+        state = "  [pause]" if self.paused else ""
+        return (f"{frame / self.fps:5.1f} s  frame {frame}/{self.total_frames}  "
+                f"{section + 1}:{self.names[section]}\n"
+                f"fps {self.achieved_fps():2d}/{self.fps}  drop {sum(self.dropped)}{state}")
+
+    def summary(self):
+        """Ringkasan per bagian: bagian dengan fps tercapai rendah terlalu berat untuk real-time"""
+        lines = [f"{'bagian':<12}{'digambar':>9}{'drop':>7}{'ms/frame':>10}{'fps':>7}"]
+        for section, name in enumerate(self.names):
+            drawn, dropped = self.drawn[section], self.dropped[section]
+            if drawn == 0:
+                continue
+            ms = 1000 * self.render_s[section] / drawn
+            fps = self.fps * drawn / (drawn + dropped)
+            lines.append(f"{name:<12}{drawn:>9}{dropped:>7}{ms:>10.1f}{fps:>7.1f}")
+        return "\n".join(lines)
+
+
+def run_headless(player, seconds):
+    """Memutar preview tanpa jendela selama beberapa detik (mengukur bagian yang berat)"""
+    end = player.clock() + seconds
+    while player.clock() < end:
+        if player.step() is None:
+            time.sleep(0.001)
+
+
+def run_window(player, max_height=MAX_HEIGHT):
+    """Jendela preview: satu gambar dan satu teks status yang dipertahankan, diperbarui per frame"""
+    import matplotlib.pyplot as plt  # Backend GUI hanya dimuat untuk preview
+
+    first = player.step()
+    height, width = first.shape[:2]
+    stride = max(1, math.ceil(height / max_height))  # Perkecil tanpa resampling
+    frame = first[::stride, ::stride]
+    dpi = 100
+    fig = plt.figure(figsize=(frame.shape[1] / dpi, frame.shape[0] / dpi), dpi=dpi)
+    fig.canvas.manager.set_window_title(f"{player.module.TITLE} - preview")
+    # figimage: piksel frame digambar 1:1 tanpa axes dan tanpa interpolasi
+    image = fig.figimage(frame, origin='upper')
+    text = fig.text(0.01, 0.995, player.status(), va='top', ha='left', color='white',
+                    family='monospace', fontsize=8,
+                    bbox=dict(facecolor='black', alpha=0.6, edgecolor='none'))
+
+    def on_key(event):
+        if event.key == ' ':
+            player.toggle_pause()
+        elif event.key in ('right', 'left'):
+            if player.paused:
+                player.step_frame(1 if event.key == 'right' else -1)
+            else:
+                delta = SEEK_SECONDS * player.fps * (1 if event.key == 'right' else -1)
+                player.seek((player.frame or 0) + delta)
+        elif event.key in ('home', '0'):
+            player.seek(0)
+        elif event.key is not None and event.key.isdigit():
+            player.seek_section(int(event.key) - 1)
+
+    def on_tick():
+        buffer = player.step()
+        if buffer is not None:
+            image.set_data(buffer[::stride, ::stride])
+        text.set_text(player.status())
+        fig.canvas.draw_idle()
+
+    fig.canvas.mpl_connect('key_press_event', on_key)
+    # Timer lebih cepat dari frame rate: frame target diperiksa beberapa kali per frame
+    timer = fig.canvas.new_timer(interval=max(1, int(1000 / (2 * player.fps))))
+    timer.add_callback(on_tick)
+    timer.start()
+    plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m animasi_atom.preview",
+                                     description="Preview animasi atom secara real-time")
+    parser.add_argument('scene', nargs='?', default='atom', choices=list(SCENES))
+    parser.add_argument('--quality', default=PREVIEW_QUALITY,
+                        help=f"Profil kualitas (default: {PREVIEW_QUALITY})")
+    parser.add_argument('--backend', help="Backend render (default: ATOM_BACKEND atau mplot3d)")
+    parser.add_argument('--section', type=int, default=1, help="Bagian awal (1 = pertama)")
+    parser.add_argument('--headless', type=float, metavar='SECONDS',
+                        help="Putar tanpa jendela selama beberapa detik lalu cetak ringkasan")
+    args = parser.parse_args(argv)
+
+    module = load_scene(args.scene, args.quality, args.backend)
+    player = PreviewPlayer(module)
+    player.seek_section(args.section - 1)
+    if args.headless is not None:
+        run_headless(player, args.headless)
+    else:
+        run_window(player)
+    print(player.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+# Preview GIF dan poster per bagian diambil dari aliran frame render (tanpa render atau decode kedua)
+import glob  # Untuk poster sampel di samping file video
+import math  # Untuk jarak sampel frame
+import os  # Untuk path poster dan palette
+import re  # Untuk nomor frame poster sampel
+import shutil  # Untuk menyalin poster sampel
+import subprocess  # Untuk menjalankan FFmpeg
+import tempfile  # Untuk spool frame GIF
+
+import numpy as np  # Untuk downscale, histogram dan palette
+
+GIF_WIDTH = 270        # Lebar GIF (piksel); frame diperkecil dengan rata-rata blok
+GIF_FRAMES = 240       # Jumlah frame GIF maksimum (time-lapse seluruh video)
+GIF_FPS = 10           # Frame rate GIF
+POSTER_WIDTH = 540     # Lebar poster per bagian
+POSTER_POSITION = 0.6  # Posisi poster di dalam bagian (0 = awal, 1 = akhir)
+HIST_BITS = 5          # Bit per kanal histogram warna (32768 bin, memori tetap)
+PALETTE_COLORS = 256   # Ukuran palette GIF (16x16 untuk paletteuse)
+SAMPLES_SUFFIX = ".preview.npy"  # Sampel GIF potongan/segmen di samping file videonya
+
+
+def downscale(rgba, factor):
+    """Memperkecil frame RGBA menjadi RGB dengan rata-rata blok factor x factor"""
+    height, width = rgba.shape[0] // factor, rgba.shape[1] // factor
+    rgba = rgba[:height * factor, :width * factor]
+    # Jumlah baris lalu kolom: setiap langkah menjumlahkan blok memori yang berurutan
+    rows = rgba.reshape(height, factor, -1).sum(axis=1, dtype=np.uint32)
+    blocks = rows.reshape(height, width, factor, 4).sum(axis=2, dtype=np.uint32)
+    return (blocks[..., :3] // (factor * factor)).astype(np.uint8)
+
+
+def color_histogram(rgb, bits=HIST_BITS):
+    """Histogram warna terkuantisasi (bits per kanal) sebuah frame RGB"""
+    shift = 8 - bits
+    keys = ((rgb[..., 0].astype(np.int32) >> shift) << (2 * bits)
+            | (rgb[..., 1].astype(np.int32) >> shift) << bits
+            | rgb[..., 2].astype(np.int32) >> shift)
+    return np.bincount(keys.ravel(), minlength=1 << (3 * bits))
+
+
+def median_cut(histogram, colors=PALETTE_COLORS, bits=HIST_BITS):
+    """Palette dari histogram: kotak warna dengan bobot x rentang terbesar dibelah di median"""
+    bins = np.nonzero(histogram)[0]
+    counts = histogram[bins].astype(np.float64)
+    mask = (1 << bits) - 1
+    coords = np.stack([(bins >> (2 * bits)) & mask, (bins >> bits) & mask, bins & mask], axis=1)
+    # Warna tengah setiap bin dalam skala 0-255
+    centers = (coords << (8 - bits)) + (1 << (7 - bits))
+
+    def priority(box):
+        extent = coords[box].max(axis=0) - coords[box].min(axis=0)
+        return counts[box].sum() * (extent.max() + 1) if len(box) > 1 else -1
+
+    boxes = [np.arange(len(bins))]
+    while len(boxes) < colors:
+        scores = [priority(box) for box in boxes]
+        best = int(np.argmax(scores))
+        if scores[best] < 0:
+            break  # Semua kotak tinggal satu bin
+        box = boxes.pop(best)
+        axis = int(np.argmax(coords[box].max(axis=0) - coords[box].min(axis=0)))
+        order = box[np.argsort(coords[box, axis], kind='stable')]
+        cumulative = np.cumsum(counts[order])
+        cut = int(np.clip(np.searchsorted(cumulative, cumulative[-1] / 2) + 1, 1, len(order) - 1))
+        boxes += [order[:cut], order[cut:]]
+
+    palette = np.zeros((colors, 3), dtype=np.uint8)  # Sisa entri hitam
+    for i, box in enumerate(boxes):
+        palette[i] = np.round(np.average(centers[box], axis=0, weights=counts[box]))
+    return palette
+
+
+def gif_stride(total_frames, gif_frames=GIF_FRAMES):
+    """Jarak frame video antar frame GIF (sama untuk render serial dan setiap potongan)"""
+    return max(1, math.ceil(total_frames / gif_frames))
+
+
+def poster_frames(spans):
+    """Frame poster -> indeks bagian (satu per bagian yang tidak kosong)"""
+    return {start + int(POSTER_POSITION * (stop - start)): section
+            for section, (start, stop) in enumerate(spans) if stop > start}
+
+
+def samples_path(path):
+    """File sampel GIF milik file video potongan atau segmen path"""
+    return path + SAMPLES_SUFFIX
+
+
+def _poster_path(path, frame):
+    """Poster sampel frame tertentu milik file video potongan atau segmen path"""
+    return f"{path}.poster{frame:06d}.png"
+
+
+def _sample_posters(path):
+    """Poster sampel milik file video path: {frame: path poster}"""
+    pattern = re.compile(re.escape(path) + r"\.poster(\d+)\.png$")
+    posters = {}
+    for poster in glob.glob(glob.escape(path) + ".poster*.png"):
+        match = pattern.match(poster)
+        if match:
+            posters[int(match.group(1))] = poster
+    return posters
+
+
+class SampleTap:
+    """Tap render satu potongan [start, stop): sampel GIF dan poster disimpan di samping videonya
+
+    Frame sampel dan poster dipilih dari nomor frame absolut dengan aturan yang sama dengan
+    PreviewTap, jadi sampel potongan yang digabung berurutan sama dengan render serial. Sampel
+    ditulis ke file .npy ter-memmap (memori tetap); close() mengembalikan path file sampel."""
+
+    def __init__(self, path, start, stop, size, total_frames, spans, gif_frames=GIF_FRAMES):
+        width, height = size
+        factor = max(1, width // GIF_WIDTH)
+        self.stride = gif_stride(total_frames, gif_frames)
+        first = -(-start // self.stride) * self.stride  # Kelipatan stride pertama >= start
+        self.index = {frame: i for i, frame in enumerate(range(first, stop, self.stride))}
+        self.posters = {frame: _poster_path(path, frame) for frame in poster_frames(spans)
+                        if start <= frame < stop}
+        self.path = samples_path(path)
+        # Ditulis ke file sementara; nama akhir hanya ada setelah semua sampel lengkap
+        self._partial_path = self.path + ".part.npy"
+        self._samples = np.lib.format.open_memmap(
+            self._partial_path, mode='w+', dtype=np.uint8,
+            shape=(len(self.index), height // factor, width // factor, 3))
+
+    def __call__(self, frame, buffer):
+        """Dipanggil loop render dengan buffer RGBA frame yang sudah di-post-process"""
+        if frame not in self.index and frame not in self.posters:
+            return
+        rgba = np.asarray(buffer)
+        if frame in self.posters:
+            import matplotlib.image as mpimg  # Menulis PNG (hanya beberapa kali per render)
+            mpimg.imsave(self.posters[frame], downscale(rgba, max(1, rgba.shape[1] // POSTER_WIDTH)))
+        if frame in self.index:
+            self._samples[self.index[frame]] = downscale(rgba, max(1, rgba.shape[1] // GIF_WIDTH))
+
+    def close(self):
+        """Menyimpan file sampel dan mengembalikan path-nya"""
+        self._samples.flush()
+        del self._samples
+        os.replace(self._partial_path, self.path)
+        return self.path
+
+    def discard(self):
+        """Membuang sampel dan poster (render potongan gagal)"""
+        del self._samples
+        for path in [self._partial_path] + list(self.posters.values()):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def merge_samples(paths, output_path):
+    """Menggabungkan sampel potongan berurutan menjadi sampel satu segmen (poster dipindah)"""
+    parts = [np.load(samples_path(path), mmap_mode='r') for path in paths]
+    partial_path = samples_path(output_path) + ".part.npy"
+    merged = np.lib.format.open_memmap(partial_path, mode='w+', dtype=np.uint8,
+                                       shape=(sum(len(part) for part in parts),) + parts[0].shape[1:])
+    row = 0
+    for part in parts:
+        merged[row:row + len(part)] = part
+        row += len(part)
+    merged.flush()
+    del merged, parts
+    os.replace(partial_path, samples_path(output_path))
+    for path in paths:
+        for frame, poster in _sample_posters(path).items():
+            os.replace(poster, _poster_path(output_path, frame))
+    return samples_path(output_path)
+
+
+class PreviewTap:
+    """Mengambil frame dari loop render: sampel GIF (diperkecil) dan poster setiap bagian
+
+    Frame GIF ditulis ke spool sementara di disk dan histogram warnanya diakumulasi, jadi
+    memori tetap berapa pun durasi video. Render paralel dan segmen memakai SampleTap per
+    potongan; sampelnya ditambahkan sesuai urutan frame dengan add_samples(). close() membuat
+    palette lalu FFmpeg (paletteuse) meng-encode GIF dari spool."""
+
+    def __init__(self, gif_path, total_frames, spans, names, gif_frames=GIF_FRAMES,
+                 gif_fps=GIF_FPS):
+        self.gif_path = gif_path
+        self.gif_fps = gif_fps
+        self.stride = gif_stride(total_frames, gif_frames)  # Frame video per frame GIF
+        root, _ = os.path.splitext(gif_path)
+        # Frame poster -> path file (satu per bagian)
+        self.posters = {frame: f"{root}_s{section + 1}_{names[section].lower()}.png"
+                        for frame, section in poster_frames(spans).items()}
+        self.histogram = np.zeros(1 << (3 * HIST_BITS), dtype=np.int64)
+        self.size = None          # Ukuran frame GIF (lebar, tinggi)
+        self.frames = 0           # Frame GIF di spool
+        self._spool = tempfile.TemporaryFile()  # Terhapus otomatis, juga jika render gagal
+
+    def __call__(self, frame, buffer):
+        """Dipanggil loop render dengan buffer RGBA frame yang sudah di-post-process"""
+        if frame % self.stride and frame not in self.posters:
+            return
+        rgba = np.asarray(buffer)
+        if frame in self.posters:
+            import matplotlib.image as mpimg  # Menulis PNG (hanya beberapa kali per render)
+            mpimg.imsave(self.posters[frame], downscale(rgba, max(1, rgba.shape[1] // POSTER_WIDTH)))
+        if frame % self.stride == 0:
+            self._add(downscale(rgba, max(1, rgba.shape[1] // GIF_WIDTH)))
+
+    def _add(self, small):
+        """Menambahkan satu frame GIF (RGB diperkecil) ke spool dan histogram"""
+        self.size = (small.shape[1], small.shape[0])
+        self.histogram += color_histogram(small)
+        self._spool.write(np.ascontiguousarray(small).tobytes())
+        self.frames += 1
+
+    def add_samples(self, path):
+        """Menambahkan sampel SampleTap milik file video potongan atau segmen path (urut frame)"""
+        for small in np.load(samples_path(path), mmap_mode='r'):
+            self._add(small)
+        for frame, poster in _sample_posters(path).items():
+            if frame in self.posters:
+                shutil.copyfile(poster, self.posters[frame])
+
+    def close(self):
+        """Meng-encode GIF dari spool dengan palette histogram lalu membuang spool"""
+        try:
+            if not self.frames:
+                return
+            palette_path = self.gif_path + ".palette.rgb"
+            median_cut(self.histogram).tofile(palette_path)
+            width, height = self.size
+            side = math.isqrt(PALETTE_COLORS)
+            cmd = [
+                'ffmpeg',
+                '-y',
+                '-loglevel', 'warning',
+                '-f', 'rawvideo', '-pix_fmt', 'rgb24',   # Frame GIF dari spool (stdin)
+                '-s', f'{width}x{height}',
+                '-r', str(self.gif_fps),
+                '-i', '-',
+                '-f', 'rawvideo', '-pix_fmt', 'rgb24',   # Palette 16x16 dari histogram
+                '-s', f'{side}x{side}',
+                '-i', palette_path,
+                '-lavfi', '[0:v][1:v]paletteuse=dither=bayer:bayer_scale=4',
+                '-loop', '0',                            # GIF berulang
+                self.gif_path,
+            ]
+            self._spool.seek(0)
+            try:
+                subprocess.run(cmd, stdin=self._spool, check=True)
+            finally:
+                os.remove(palette_path)
+            print(f"Preview GIF {self.gif_path} ({self.frames} frame), "
+                  f"poster: {', '.join(self.posters.values())}")
+        finally:
+            self._spool.close()
+
+    def discard(self):
+        """Membuang spool tanpa membuat GIF (render gagal)"""
+        self._spool.close()
@@ -0,0 +1,82 @@
+# Profil kualitas render: draft untuk iterasi cepat, production untuk hasil akhir
+import os  # Untuk membaca pilihan profil dari environment
+
+QUALITY_ENV = "ATOM_QUALITY"      # Variabel environment pemilih profil (juga dibaca worker)
+DEFAULT_PROFILE = "production"    # Profil jika tidak dipilih
+
+# Timing bagian dan teks hanya bergantung pada progress (frame / total frame),
+# sehingga semua profil menghasilkan durasi dan urutan yang sama
+PROFILES = {
+    'draft': {
+        'scale': 0.5,           # Skala resolusi (1080x1920 -> 540x960)
+        'frame_stride': 3,      # Render setiap frame ke-3 (30 -> 10 fps)
+        'mesh_scale': 0.3,      # Skala resolusi mesh sphere (batas atas LOD)
+        'lod_tolerance': 1.0,   # Deviasi siluet sphere maksimum (piksel) untuk LOD
+        'glow': False,          # Tanpa glow layar (post-process)
+        'preset': 'ultrafast',  # Preset encoder libx264
+        'crf': 30,              # Kualitas konstan, tanpa batas bitrate
+        'bitrate': False,
+    },
+    'preview': {
+        'scale': 0.75,
+        'frame_stride': 2,
+        'mesh_scale': 0.6,
+        'lod_tolerance': 0.75,
+        'glow': True,
+        'preset': 'veryfast',
+        'crf': 23,
+        'bitrate': False,
+    },
+    'production': {
+        'scale': 1.0,
+        'frame_stride': 1,
+        'mesh_scale': 1.0,
+        'lod_tolerance': 0.5,
+        'glow': True,
+        'preset': 'slow',
+        'crf': 18,
+        'bitrate': True,        # Pakai bitrate target skrip
+    },
+}
+
+
+def load_profile(name=None):
+    """Profil kualitas berdasarkan nama atau variabel environment ATOM_QUALITY"""
+    name = name or os.environ.get(QUALITY_ENV, DEFAULT_PROFILE)
+    if name not in PROFILES:
+        raise ValueError(f"Profil kualitas tidak dikenal: {name!r} "
+                         f"(pilihan: {', '.join(PROFILES)})")
+    return dict(PROFILES[name], name=name)
+
+
+def render_fps(fps, profile):
+    """Frame rate hasil render setelah frame stride"""
+    return max(1, fps // profile['frame_stride'])
+
+
+def scaled_size(width, height, profile):
+    """Ukuran frame setelah skala resolusi (dibulatkan genap untuk yuv420p)"""
+    return (2 * round(width * profile['scale'] / 2), 2 * round(height * profile['scale'] / 2))
+
+
+def mesh_resolution(resolution, profile):
+    """Resolusi mesh sphere untuk profil ini"""
+    return max(8, round(resolution * profile['mesh_scale']))
+
+
+def encoder_args(profile):
+    """Argumen libx264 untuk profil ini"""
+    return ['-preset', profile['preset'], '-crf', str(profile['crf'])]
+
+
+def video_bitrate(bitrate, profile):
+    """Bitrate target skrip, atau None (hanya CRF) untuk profil iterasi"""
+    return bitrate if profile['bitrate'] else None
+
+
+def output_path(path, profile):
+    """Nama file output; profil selain production diberi akhiran agar tidak menimpa"""
+    if profile['name'] == DEFAULT_PROFILE:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_{profile['name']}{ext}"
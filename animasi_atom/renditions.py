@@ -0,0 +1,80 @@
+# Rendition output: frame dirender sekali lalu satu proses FFmpeg meng-encode beberapa varian
+import os  # Untuk membaca pilihan rendition dari environment
+
+from .quality import scaled_size, video_bitrate  # Skala ukuran dan bitrate per profil
+
+RENDITIONS_ENV = "ATOM_RENDITIONS"  # Daftar nama rendition dipisah koma (juga dibaca worker)
+
+# Ukuran dalam piksel production (1080x1920); diskalakan sesuai profil seperti frame sumber.
+# Crop diambil dari tengah frame sumber, lalu scale (jika ada) diterapkan pada hasil crop
+RENDITIONS = {
+    '720p': {
+        'crop': None,          # Tanpa crop
+        'scale': (720, 1280),  # Vertikal 720p
+        'bitrate': 5000,       # Bitrate target (kbps); None = bitrate video utama
+    },
+    'square': {
+        'crop': (1080, 1080),  # Kotak dari tengah frame
+        'scale': None,
+        'bitrate': 8000,
+    },
+    'mobile': {
+        'crop': None,
+        'scale': (540, 960),
+        'bitrate': 1500,       # Varian hemat data
+    },
+}
+
+
+def load_renditions(names=None):
+    """Nama rendition dari daftar/string dipisah koma atau variabel environment ATOM_RENDITIONS"""
+    if names is None:
+        names = os.environ.get(RENDITIONS_ENV, "")
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(",")]
+    names = [name for name in names if name]
+    unknown = [name for name in names if name not in RENDITIONS]
+    if unknown:
+        raise ValueError(f"Rendition tidak dikenal: {', '.join(map(repr, unknown))} "
+                         f"(pilihan: {', '.join(RENDITIONS)})")
+    return list(dict.fromkeys(names))  # Urutan dipertahankan, duplikat dibuang
+
+
+def rendition_filter(name, size, profile):
+    """Filter FFmpeg (crop lalu scale) dari frame sumber berukuran size ke rendition ini"""
+    rendition = RENDITIONS[name]
+    width, height = size
+    filters = []
+    if rendition['crop']:
+        crop = scaled_size(*rendition['crop'], profile)
+        if crop[0] > width or crop[1] > height:
+            raise ValueError(f"Crop rendition {name!r} {crop} lebih besar dari frame {size}")
+        filters.append(f"crop={crop[0]}:{crop[1]}")  # Default FFmpeg: crop di tengah
+        width, height = crop
+    if rendition['scale']:
+        scale = scaled_size(*rendition['scale'], profile)
+        # Frame sumber dirender pada resolusi tertinggi; rendition hanya memperkecil
+        if scale[0] > width or scale[1] > height:
+            raise ValueError(f"Rendition {name!r} {scale} lebih besar dari frame sumber {(width, height)}")
+        filters.append(f"scale={scale[0]}:{scale[1]}:flags=lanczos")
+    return ",".join(filters) or "null"
+
+
+def resolve_renditions(names, size, profile, bitrate=None):
+    """Spesifikasi (nama, filter, bitrate) yang dikirim ke RawVideoWriter dan worker"""
+    specs = []
+    for name in load_renditions(names):
+        target = RENDITIONS[name]['bitrate'] or bitrate
+        specs.append((name, rendition_filter(name, size, profile), video_bitrate(target, profile)))
+    return specs
+
+
+def rendition_path(path, name):
+    """Nama file sebuah rendition: akhiran nama rendition sebelum ekstensi"""
+    root, ext = os.path.splitext(path)
+    return f"{root}_{name}{ext}"
+
+
+def rendition_paths(path, renditions):
+    """Path output utama diikuti path setiap rendition"""
+    return [path] + [rendition_path(path, name) for name, _, _ in renditions or ()]
@@ -0,0 +1,135 @@
+# Scene retained: artist dibuat sekali per bagian lalu hanya diperbarui per frame
+import numpy as np  # Untuk operasi array
+from matplotlib.collections import PolyCollection  # Untuk warna face urutan asli
+
+from .geometry_cache import surface_polys  # Quad surface dengan urutan plot_surface
+from .particle_batch import ParticleBatch  # Semua partikel dalam satu koleksi
+
+
+class RetainedScene:
+    """Kumpulan artist bernama untuk satu bagian animasi"""
+
+    def __init__(self, ax, lod_tolerance=None):
+        self.ax = ax             # Axes 3D tempat artist digambar
+        self.lod_tolerance = lod_tolerance  # Toleransi LOD partikel (piksel), None = resolusi tetap
+        self.section = None      # Bagian yang sedang aktif
+        self.artists = {}        # Artist bernama pada bagian aktif
+        self._base_polys = {}    # Poligon dasar surface untuk translasi
+        self._base_colors = {}   # Warna face dasar surface (RGBA)
+        self._particles = None   # Batch partikel, dibuat saat pertama dipakai
+
+    def enter(self, section, build):
+        """Setup bagian baru hanya jika bagian berganti"""
+        if section == self.section:
+            return False
+        self.clear()
+        self.section = section
+        build()
+        return True
+
+    def clear(self):
+        """Teardown semua artist bagian sebelumnya"""
+        for artist in self.artists.values():
+            artist.remove()
+        self.artists.clear()
+        self._base_polys.clear()
+        self._base_colors.clear()
+        if self._particles is not None:
+            self._particles.clear()
+        self.section = None
+
+    def add_surface(self, name, X, Y, Z, **kwargs):
+        """Membuat surface sekali; posisi dasar disimpan untuk translasi per frame"""
+        artist = self.ax.plot_surface(X, Y, Z, **kwargs)
+        if artist.get_array() is not None:
+            # Warna colormap dibekukan agar alpha bisa diubah tanpa pemetaan ulang
+            colors = artist.to_rgba(artist.get_array())
+            artist.set_array(None)
+        else:
+            # Warna face 3D sesuai urutan poligon (get_facecolor mengembalikan urutan terurut 2D)
+            colors = PolyCollection.get_facecolor(artist)
+        artist.set_visible(False)
+        self.artists[name] = artist
+        self._base_polys[name] = surface_polys(X, Y, Z)
+        self._base_colors[name] = np.array(colors)
+        return artist
+
+    def add_particle(self, name, x, y, z, radius, color, cmap=None, resolution=40):
+        """Menambahkan sphere ke batch partikel bersama"""
+        if self._particles is None:
+            self._particles = ParticleBatch(self.ax, self.lod_tolerance)
+        self._particles.add(name, (x, y, z), radius, color, cmap=cmap, resolution=resolution)
+
+    def add_line(self, name, x, y, z, **kwargs):
+        """Membuat garis 3D sekali"""
+        artist, = self.ax.plot(x, y, z, **kwargs)
+        artist.set_visible(False)
+        self.artists[name] = artist
+        return artist
+
+    def add_text(self, name, x, y, z, text, **kwargs):
+        """Membuat teks 3D sekali"""
+        artist = self.ax.text(x, y, z, text, **kwargs)
+        artist.set_visible(False)
+        self.artists[name] = artist
+        return artist
+
+    def surface(self, name, visible=True, offset=None, alpha=None):
+        """Memperbarui posisi, alpha dan visibilitas surface"""
+        artist = self.artists[name]
+        artist.set_visible(visible)
+        if not visible:
+            return
+        if offset is not None:
+            # Translasi tidak mengubah normal, jadi shading awal tetap valid
+            artist.set_verts(self._base_polys[name] + np.asarray(offset, dtype=float))
+        if alpha is not None:
+            # Alpha diterapkan ke warna face saja; set_alpha juga akan memunculkan edge
+            colors = self._base_colors[name].copy()
+            colors[:, 3] = np.clip(alpha, 0, 1)
+            artist.set_facecolor(colors)
+
+    def particle(self, name, visible=True, offset=None, alpha=None):
+        """Memperbarui posisi, alpha dan visibilitas partikel batch"""
+        self._particles.set(name, visible, offset=offset, alpha=alpha)
+
+    def commit(self):
+        """Menyusun batch partikel sekali per frame setelah semua update"""
+        if self._particles is not None:
+            self._particles.commit()
+
+    def counts(self):
+        """Jumlah objek dan poligon yang terlihat (untuk telemetri)"""
+        objects = polygons = 0
+        for name, artist in self.artists.items():
+            if artist.get_visible():
+                objects += 1
+                if name in self._base_polys:
+                    polygons += len(self._base_polys[name])
+        if self._particles is not None:
+            particle_objects, particle_polygons = self._particles.counts()
+            objects += particle_objects
+            polygons += particle_polygons
+        return objects, polygons
+
+    def line(self, name, visible=True, data=None, alpha=None):
+        """Memperbarui data, alpha dan visibilitas garis"""
+        artist = self.artists[name]
+        artist.set_visible(visible)
+        if not visible:
+            return
+        if data is not None:
+            artist.set_data_3d(*data)
+        if alpha is not None:
+            artist.set_alpha(alpha)
+
+    def text(self, name, visible=True, position=None, alpha=None):
+        """Memperbarui posisi, alpha dan visibilitas teks"""
+        artist = self.artists[name]
+        artist.set_visible(visible)
+        if not visible:
+            return
+        if position is not None:
+            artist.set_position_3d(position)
+        if alpha is not None:
+            artist.set_alpha(alpha)
@@ -0,0 +1,193 @@
+# Cache segmen per bagian: bagian yang kode dan parameternya tidak berubah tidak dirender ulang
+import hashlib  # Untuk kunci cache
+import importlib  # Untuk memuat modul scene
+import inspect  # Untuk membaca source fungsi
+import os  # Untuk operasi sistem file
+import types  # Untuk mengenali fungsi dan modul
+
+import numpy as np  # Untuk hash array konstanta
+
+from .checkpoint import CHECKPOINT_DIR, CHUNK_FRAMES, ChunkManifest  # Potongan dan manifest
+from .frame_table import FrameTable  # Rentang frame setiap clip timeline
+from .parallel_render import concat_videos, render_checkpointed  # Render dan gabung potongan
+from .preview_tap import merge_samples, samples_path  # Sampel preview GIF per segmen
+from .renditions import rendition_paths  # Path output setiap rendition
+
+SEGMENT_CACHE_DIR = os.path.join(".render_cache", "segments")  # Lokasi cache segmen
+
+
+def section_ranges(total_frames, timeline):
+    """Rentang frame (start, stop) setiap clip timeline"""
+    return FrameTable(total_frames, timeline.bounds).spans
+
+
+def _describe(value):
+    """Representasi stabil sebuah nilai global (tanpa alamat memori)"""
+    if isinstance(value, (types.FunctionType, type)):
+        return value.__qualname__
+    if isinstance(value, np.ndarray):
+        return f"ndarray{value.shape}{value.dtype}:{hashlib.sha256(value.tobytes()).hexdigest()}"
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__ + "(" + ",".join(_describe(v) for v in value) + ")"
+    if isinstance(value, dict):
+        return "{" + ",".join(f"{_describe(k)}:{_describe(v)}" for k, v in value.items()) + "}"
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    return type(value).__name__  # Objek runtime (figure, axes, scene) tidak ikut kunci
+
+
+def _code_names(code):
+    """Semua nama global yang dipakai sebuah code object, termasuk lambda/comprehension"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _hash_function(digest, module, function, seen):
+    """Hash source fungsi beserta fungsi dan konstanta modul yang dipakainya"""
+    if function.__name__ in seen:
+        return
+    seen.add(function.__name__)
+    digest.update(inspect.getsource(function).encode())
+    for name in sorted(_code_names(function.__code__)):
+        if name in seen or not hasattr(module, name):
+            continue
+        value = getattr(module, name)
+        if isinstance(value, types.FunctionType) and value.__module__ == module.__name__:
+            _hash_function(digest, module, value, seen)
+        elif not isinstance(value, types.ModuleType):
+            seen.add(name)
+            digest.update(f"{name}={_describe(value)}".encode())
+
+
+def _local_module_files(module):
+    """File source modul lokal (satu direktori dengan scene) yang dipakai scene, termasuk tidak langsung"""
+    root = os.path.dirname(os.path.abspath(module.__file__))
+    files = set()
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        for value in vars(current).values():
+            owner = value if isinstance(value, types.ModuleType) else inspect.getmodule(value)
+            path = getattr(owner, "__file__", None)
+            if owner is module or not path or os.path.dirname(os.path.abspath(path)) != root:
+                continue
+            path = os.path.abspath(path)
+            if path not in files:
+                files.add(path)
+                pending.append(owner)
+    return sorted(files)
+
+
+def _scene_source(module, timeline, section):
+    """Source modul scene tanpa fungsi build/compose milik bagian lain saja
+
+    Semua setup tingkat modul (figure, axes, glow, gaya teks, konstanta) ikut kunci setiap
+    bagian; perubahan fungsi bagian lain tidak membuat segmen bagian ini dirender ulang."""
+    with open(module.__file__, encoding="utf-8") as f:
+        source = f.read()
+    own = {timeline.clips[section].build, timeline.clips[section].compose}
+    for index, clip in enumerate(timeline.clips):
+        if index == section:
+            continue
+        for function in (clip.build, clip.compose):
+            if function in own or getattr(function, "__module__", None) != module.__name__:
+                continue
+            source = source.replace(inspect.getsource(function), "", 1)
+    return source
+
+
+def section_key(module, section, config):
+    """Kunci cache satu bagian: source scene, fungsi bersama, modul renderer dan konfigurasi"""
+    digest = hashlib.sha256()
+    digest.update(_describe(config).encode())
+    digest.update(_describe(getattr(module, "COLORS", None)).encode())
+    digest.update(_describe(getattr(module, "QUALITY", None)).encode())
+    digest.update(_describe(getattr(module, "RENDER_BACKEND", None)).encode())
+    timeline = module.TIMELINE
+    clip = timeline.clips[section]
+    # Durasi semua clip menentukan rentang frame dan progress clip ini
+    digest.update(_describe((clip.name, list(timeline.bounds))).encode())
+    # Objek tingkat modul hanya terwakili nama tipenya di _describe, jadi source modul ikut di-hash
+    digest.update(_scene_source(module, timeline, section).encode())
+    seen = set()
+    for function in (clip.build, clip.compose, timeline.compose):
+        if function is not None:
+            _hash_function(digest, module, function, seen)
+    # Fungsi per frame yang dipakai semua clip (update, overlay)
+    for name in ("update", "post_process"):
+        if hasattr(module, name):
+            _hash_function(digest, module, getattr(module, name), seen)
+    for path in _local_module_files(module):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def scene_key(module, config):
+    """Kunci seluruh scene: gabungan kunci semua bagian"""
+    sections = range(len(module.TIMELINE.clips))
+    return hashlib.sha256("".join(section_key(module, section, config)
+                                  for section in sections).encode()).hexdigest()[:16]
+
+
+def render_sections(module_name, output_path, total_frames, fps, workers,
+                    size=(1080, 1920), bitrate=None, extra_args=None, audio_path=None,
+                    chunk_frames=CHUNK_FRAMES, cache_dir=SEGMENT_CACHE_DIR, renditions=None,
+                    checkpoint_dir=CHECKPOINT_DIR, preview=None):
+    """Render hanya bagian yang berubah, lalu gabungkan semua segmen tanpa encode ulang
+
+    Potongan bagian yang belum selesai disimpan di checkpoint_dir dengan manifest, jadi
+    render yang terhenti dilanjutkan dari potongan pertama yang belum ada. Dengan preview
+    (PreviewTap) setiap segmen menyimpan sampel GIF dan posternya di cache; segmen lama tanpa
+    sampel dirender ulang."""
+    module = importlib.import_module(module_name)
+    config = (module_name, total_frames, fps, tuple(size), bitrate, list(extra_args or []),
+              list(renditions or []))
+    ranges = section_ranges(total_frames, module.TIMELINE)
+    sections = [section for section, (start, stop) in enumerate(ranges) if stop > start]
+
+    os.makedirs(cache_dir, exist_ok=True)
+    keys = {section: section_key(module, section, config) for section in sections}
+    segments = {section: os.path.join(cache_dir, f"{module_name}_s{section}_{keys[section]}.mp4")
+                for section in sections}
+    # Bagian dianggap ada di cache hanya jika segmen semua rendition-nya (dan sampel preview) ada
+    missing = [section for section in sections
+               if not all(map(os.path.exists, rendition_paths(segments[section], renditions)))
+               or preview is not None and not os.path.exists(samples_path(segments[section]))]
+    print(f"Segmen dari cache: {len(segments) - len(missing)}/{len(segments)}, "
+          f"dirender: {missing}")
+
+    if missing:
+        # Satu direktori checkpoint per bagian; kunci bagian menjadi hash konfigurasi manifest
+        manifests = [ChunkManifest(os.path.join(checkpoint_dir, f"{module_name}_"
+                                                f"{module.QUALITY['name']}_s{section}"),
+                                   keys[section], *ranges[section], chunk_frames, renditions,
+                                   preview is not None)
+                     for section in missing]
+        # Potongan semua bagian yang berubah dirender dalam satu pool
+        section_paths = render_checkpointed(module_name, manifests, fps, workers, size, bitrate,
+                                            extra_args, renditions, preview is not None)
+
+        for section, manifest, paths in zip(missing, manifests, section_paths):
+            for i, segment in enumerate(rendition_paths(segments[section], renditions)):
+                partial_path = segment + ".part.mp4"
+                concat_videos([outputs[i] for outputs in paths], partial_path)
+                # Rename atomik: segmen di cache tidak pernah setengah jadi
+                os.replace(partial_path, segment)
+            if preview is not None:
+                merge_samples([outputs[0] for outputs in paths], segments[section])
+            # Segmen sudah tersimpan di cache, potongannya tidak diperlukan lagi
+            manifest.remove()
+
+    if preview is not None:
+        for section in sections:
+            preview.add_samples(segments[section])
+
+    # Gabungkan segmen (dan audio) tanpa encode ulang video
+    for i, path in enumerate(rendition_paths(output_path, renditions)):
+        concat_videos([rendition_paths(segments[section], renditions)[i] for section in sections],
+                      path, audio_path)
+    return output_path
@@ -0,0 +1,367 @@
+# Render terdistribusi: koordinator membagi frame menjadi shard, worker (proses atau host lain
+# dengan direktori bersama) mengklaim shard dengan file lock, lalu langkah merge menggabungkan
+# (python -m animasi_atom.shard plan|work|status|merge JOB_DIR)
+import argparse  # Untuk argumen command line
+import json  # Untuk file job dan penanda selesai
+import os  # Untuk operasi sistem file dan lock
+import socket  # Untuk nama host pemilik lock
+import sys  # Untuk exit code
+import threading  # Untuk heartbeat lock selama render
+import time  # Untuk umur lock dan durasi shard
+
+from .api import SCENES, load_scene  # Scene yang dirender
+from .checkpoint import CHUNK_FRAMES, fixed_chunks  # Ukuran shard tetap
+from .renditions import rendition_paths  # Path output setiap rendition
+
+JOB_FILE = "job.json"   # Manifest job yang ditulis koordinator (tidak diubah worker)
+LOCK_TIMEOUT = 600      # Detik tanpa heartbeat sebelum klaim dianggap milik worker yang mati
+HEARTBEAT = 30          # Interval worker memperbarui waktu lock (detik)
+POLL_INTERVAL = 5       # Jeda worker saat semua shard tersisa sedang diklaim worker lain
+
+
+def _job_settings(module, renditions, chunk_frames):
+    """Parameter encode dan hash konfigurasi job; dihitung ulang worker untuk memastikan kode sama"""
+    from .quality import encoder_args, video_bitrate
+    from .renditions import resolve_renditions
+    from .segment_cache import scene_key
+
+    size = (module.VIDEO_WIDTH, module.VIDEO_HEIGHT)
+    extra_args = encoder_args(module.QUALITY)
+    bitrate = video_bitrate(module.VIDEO_BITRATE, module.QUALITY)
+    renditions = resolve_renditions(renditions, size, module.QUALITY, module.VIDEO_BITRATE)
+    # Bentuk konfigurasi sama dengan render_parallel
+    config = (module.__name__, module.TOTAL_FRAMES, module.VIDEO_FPS, size, bitrate,
+              list(extra_args), list(renditions), chunk_frames)
+    return {'size': size, 'bitrate': bitrate, 'extra_args': extra_args, 'renditions': renditions,
+            'config': scene_key(module, config)}
+
+
+def _write_json(path, data):
+    """Menulis JSON secara atomik (file sementara unik lalu rename)"""
+    partial_path = f"{path}.{socket.gethostname()}-{os.getpid()}.part"
+    with open(partial_path, "w") as f:
+        json.dump(data, f, indent=1)
+    os.replace(partial_path, path)
+
+
+def _read_json(path):
+    """Isi file JSON, atau None jika belum ada atau rusak"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_job(job_dir):
+    """Manifest job dari direktori job"""
+    job = _read_json(os.path.join(job_dir, JOB_FILE))
+    if job is None:
+        raise RuntimeError(f"{os.path.join(job_dir, JOB_FILE)} tidak ada; jalankan 'plan' dahulu")
+    return job
+
+
+def plan_job(job_dir, scene='atom', quality=None, backend=None, renditions=None, audio=None,
+             output=None, chunk_frames=CHUNK_FRAMES):
+    """Koordinator: menulis manifest shard dari TOTAL_FRAMES dan batas bagian timeline
+
+    Shard tidak melewati batas bagian. Menjalankan ulang dengan konfigurasi yang sama
+    tidak mengubah job; konfigurasi lain di direktori yang sama ditolak."""
+    from .segment_cache import section_ranges
+
+    module = load_scene(scene, quality, backend)
+    settings = _job_settings(module, renditions, chunk_frames)
+    shards = []
+    for section, (start, stop) in enumerate(section_ranges(module.TOTAL_FRAMES, module.TIMELINE)):
+        for first, last in fixed_chunks(start, stop, chunk_frames):
+            shards.append({'index': len(shards), 'section': section, 'start': first, 'stop': last})
+
+    job = {
+        'scene': module.__name__,
+        'quality': module.QUALITY['name'],
+        'backend': module.RENDER_BACKEND,
+        'renditions': [name for name, _, _ in settings['renditions']],
+        'chunk_frames': chunk_frames,
+        'config': settings['config'],
+        'fps': module.VIDEO_FPS,
+        'duration': module.VIDEO_DURATION,
+        'total_frames': module.TOTAL_FRAMES,
+        # Path absolut: worker dan merge bisa dijalankan dari direktori kerja lain
+        'audio': os.path.abspath(audio or module.AUDIO_FILE),
+        'output': os.path.abspath(output or module.OUTPUT_FILE),
+        'shards': shards,
+    }
+    os.makedirs(job_dir, exist_ok=True)
+    existing = _read_json(os.path.join(job_dir, JOB_FILE))
+    if existing is not None:
+        if existing['config'] != job['config'] or existing['shards'] != job['shards']:
+            raise RuntimeError(f"{job_dir} berisi job dengan konfigurasi lain; pakai direktori baru")
+        return existing
+    _write_json(os.path.join(job_dir, JOB_FILE), job)
+    print(f"Job {job['config']}: {len(shards)} shard, {module.TOTAL_FRAMES} frame -> {job_dir}")
+    return job
+
+
+def _shard_path(job_dir, shard):
+    return os.path.join(job_dir, f"shard_{shard['index']:04d}.mp4")
+
+
+def _lock_path(job_dir, shard):
+    return os.path.join(job_dir, f"shard_{shard['index']:04d}.lock")
+
+
+def _done_path(job_dir, shard):
+    return os.path.join(job_dir, f"shard_{shard['index']:04d}.done")
+
+
+def _shard_files(job_dir, job, shard):
+    """File shard yang valid (utama lalu rendition), atau None jika belum selesai atau usang"""
+    done = _read_json(_done_path(job_dir, shard))
+    if done is None or done.get('config') != job['config']:
+        return None
+    paths = [os.path.join(job_dir, name) for name in done['files']]
+    if not all(os.path.exists(path) and os.path.getsize(path) == size
+               for path, size in zip(paths, done['bytes'])):
+        return None
+    return paths
+
+
+def _claim(lock_path, lock_timeout):
+    """Mengklaim shard dengan O_CREAT|O_EXCL; mengembalikan token pemilik lock atau None
+
+    Lock tanpa heartbeat lebih dari lock_timeout diambil alih. Token (host:pid:nonce) ditulis
+    di lock agar pemilik hanya melepas lock-nya sendiri, bukan lock worker yang mengambil alih."""
+    owner = f"{socket.gethostname()}:{os.getpid()}:{os.urandom(8).hex()}"
+    for _ in range(2):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                age = time.time() - os.path.getmtime(lock_path)
+            except FileNotFoundError:
+                continue  # Dilepas pemiliknya di antara dua panggilan
+            if age < lock_timeout:
+                return None
+            # Ambil alih lewat rename ke nama unik: dari beberapa worker yang melihat lock usang
+            # hanya satu yang memindahkannya, jadi lock baru hasil ambil alih tidak ikut terhapus
+            stale_path = f"{lock_path}.{owner.replace(':', '-')}.stale"
+            try:
+                os.rename(lock_path, stale_path)
+            except FileNotFoundError:
+                continue
+            if time.time() - os.path.getmtime(stale_path) < lock_timeout:
+                # Yang terpindah ternyata lock baru worker lain: dikembalikan jika belum ada lock
+                try:
+                    os.link(stale_path, lock_path)
+                except FileExistsError:
+                    pass
+                os.remove(stale_path)
+                return None
+            os.remove(stale_path)
+            print(f"Lock {lock_path} tidak diperbarui {age:.0f} s, diambil alih")
+            continue
+        with os.fdopen(fd, "w") as f:
+            json.dump({'owner': owner, 'host': socket.gethostname(), 'pid': os.getpid(),
+                       'time': time.time()}, f)
+        return owner
+    return None
+
+
+def _release(lock_path, owner):
+    """Melepas lock hanya jika token pemiliknya masih owner
+
+    Lock yang sudah diambil alih worker lain dibiarkan. Lock milik sendiri baru saja diperbarui
+    heartbeat, jadi tidak bisa dianggap usang di antara pemeriksaan token dan penghapusan."""
+    lock = _read_json(lock_path)
+    if lock is None or lock.get('owner') != owner:
+        return False
+    try:
+        os.remove(lock_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _heartbeat(lock_path, owner, stop, interval):
+    """Thread: memperbarui waktu lock agar worker lain tahu shard masih dirender
+
+    Berhenti begitu lock bukan lagi milik owner (diambil alih worker lain atau dihapus), jadi
+    lock pemilik baru tidak ikut diperbarui."""
+    while not stop.wait(interval):
+        lock = _read_json(lock_path)
+        if lock is None or lock.get('owner') != owner:
+            return
+        try:
+            os.utime(lock_path)
+        except FileNotFoundError:
+            return
+
+
+def _render_shard(job_dir, job, settings, shard):
+    """Render satu shard ke file sementara milik worker ini lalu catat sebagai selesai"""
+    from .parallel_render import _render_chunk
+
+    # Nama sementara unik: dua worker yang sempat mengklaim shard yang sama tidak saling menimpa
+    final_paths = rendition_paths(_shard_path(job_dir, shard), settings['renditions'])
+    partial_path = _shard_path(job_dir, shard) + f".{socket.gethostname()}-{os.getpid()}.part.mp4"
+    started = time.perf_counter()
+    try:
+        paths = _render_chunk((job['scene'], shard['start'], shard['stop'], partial_path,
+                               job['fps'], settings['size'], settings['bitrate'],
+                               settings['extra_args'], settings['renditions'], False))
+    except BaseException:
+        # File setengah jadi dibuang; shard diklaim ulang oleh worker berikutnya
+        for path in rendition_paths(partial_path, settings['renditions']):
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    for path, final_path in zip(paths, final_paths):
+        os.replace(path, final_path)
+    # Penanda selesai ditulis terakhir: shard tanpa penanda selalu dirender ulang
+    _write_json(_done_path(job_dir, shard), {
+        'config': job['config'],
+        'files': [os.path.basename(path) for path in final_paths],
+        'bytes': [os.path.getsize(path) for path in final_paths],
+        'host': socket.gethostname(),
+        'pid': os.getpid(),
+        'seconds': time.perf_counter() - started,
+    })
+
+
+def work(job_dir, lock_timeout=LOCK_TIMEOUT, wait=True):
+    """Worker: mengklaim dan merender shard sampai semua selesai; mengembalikan jumlah shard dirender
+
+    Scene dimuat dengan profil dan backend job, dan hash konfigurasi dihitung ulang:
+    worker dengan kode atau parameter berbeda berhenti daripada menghasilkan shard usang."""
+    job = read_job(job_dir)
+    module = load_scene(job['scene'], job['quality'], job['backend'])
+    settings = _job_settings(module, job['renditions'], job['chunk_frames'])
+    if settings['config'] != job['config']:
+        raise RuntimeError(f"Konfigurasi worker {settings['config']} tidak sama dengan job "
+                           f"{job['config']} (kode atau parameter berbeda)")
+
+    rendered = 0
+    while True:
+        pending = [shard for shard in job['shards'] if _shard_files(job_dir, job, shard) is None]
+        if not pending:
+            break
+        claimed = False
+        for shard in pending:
+            lock_path = _lock_path(job_dir, shard)
+            # Diperiksa ulang setelah klaim: shard bisa selesai sebelum lock-nya dilepas
+            owner = _claim(lock_path, lock_timeout)
+            if owner is None:
+                continue
+            if _shard_files(job_dir, job, shard) is not None:
+                _release(lock_path, owner)
+                continue
+            claimed = True
+            stop = threading.Event()
+            heartbeat = threading.Thread(target=_heartbeat, name="shard-heartbeat",
+                                         args=(lock_path, owner, stop,
+                                               min(HEARTBEAT, lock_timeout / 3)),
+                                         daemon=True)
+            heartbeat.start()
+            try:
+                print(f"Shard {shard['index']} (frame {shard['start']}-{shard['stop']}) "
+                      f"dirender oleh {socket.gethostname()}:{os.getpid()}")
+                _render_shard(job_dir, job, settings, shard)
+                rendered += 1
+            finally:
+                stop.set()
+                heartbeat.join()
+                _release(lock_path, owner)
+        if not claimed:
+            if not wait:
+                break
+            # Shard tersisa sedang diklaim worker lain; tunggu selesai atau lock-nya kedaluwarsa
+            time.sleep(POLL_INTERVAL)
+    return rendered
+
+
+def job_status(job_dir):
+    """Jumlah shard selesai, sedang diklaim dan belum dimulai"""
+    job = read_job(job_dir)
+    status = {'done': 0, 'claimed': 0, 'pending': 0}
+    for shard in job['shards']:
+        if _shard_files(job_dir, job, shard) is not None:
+            status['done'] += 1
+        elif os.path.exists(_lock_path(job_dir, shard)):
+            status['claimed'] += 1
+        else:
+            status['pending'] += 1
+    return status
+
+
+def merge(job_dir, output=None):
+    """Memeriksa semua shard lalu menggabungkannya dengan audio tanpa encode ulang video
+
+    Gagal jika ada shard yang hilang, rusak atau dari konfigurasi lain."""
+    from .audio_cache import prepare_audio
+    from .parallel_render import concat_videos
+
+    job = read_job(job_dir)
+    files = [_shard_files(job_dir, job, shard) for shard in job['shards']]
+    missing = [shard['index'] for shard, paths in zip(job['shards'], files) if paths is None]
+    if missing:
+        raise RuntimeError(f"Shard belum selesai, hilang atau usang: {missing}")
+
+    output = output or job['output']
+    audio_path = prepare_audio(job['audio'], job['duration'])
+    outputs = rendition_paths(output, [(name, None, None) for name in job['renditions']])
+    for i, path in enumerate(outputs):
+        concat_videos([paths[i] for paths in files], path, audio_path)
+    print(f"{len(files)} shard digabung ke {', '.join(outputs)}")
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m animasi_atom.shard",
+                                     description="Render terdistribusi per shard dengan direktori bersama")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plan = commands.add_parser('plan', help="Menulis manifest shard job")
+    plan.add_argument('job_dir', help="Direktori job (dibagi semua worker)")
+    plan.add_argument('scene', nargs='?', default='atom', choices=list(SCENES))
+    plan.add_argument('--quality', help="Profil kualitas (default: ATOM_QUALITY atau production)")
+    plan.add_argument('--backend', help="Backend render (default: ATOM_BACKEND atau mplot3d)")
+    plan.add_argument('--renditions', help="Varian output tambahan dipisah koma")
+    plan.add_argument('--audio', help="File audio background (default: music.mp3)")
+    plan.add_argument('--output', help="File video hasil merge (default: nama file scene)")
+    plan.add_argument('--chunk-frames', type=int, default=CHUNK_FRAMES, help="Frame per shard")
+
+    worker = commands.add_parser('work', help="Mengklaim dan merender shard sampai job selesai")
+    worker.add_argument('job_dir')
+    worker.add_argument('--lock-timeout', type=float, default=LOCK_TIMEOUT,
+                        help="Detik tanpa heartbeat sebelum lock diambil alih")
+    worker.add_argument('--no-wait', action='store_true',
+                        help="Berhenti jika shard tersisa sedang diklaim worker lain")
+
+    status = commands.add_parser('status', help="Jumlah shard selesai, diklaim dan tertunda")
+    status.add_argument('job_dir')
+
+    merge_parser = commands.add_parser('merge', help="Memeriksa dan menggabungkan shard dengan audio")
+    merge_parser.add_argument('job_dir')
+    merge_parser.add_argument('--output', help="File video hasil (default: dari job)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'plan':
+        plan_job(args.job_dir, args.scene, quality=args.quality, backend=args.backend,
+                 renditions=args.renditions, audio=args.audio, output=args.output,
+                 chunk_frames=args.chunk_frames)
+    elif args.command == 'work':
+        rendered = work(args.job_dir, lock_timeout=args.lock_timeout, wait=not args.no_wait)
+        print(f"{rendered} shard dirender")
+    elif args.command == 'status':
+        print(", ".join(f"{key}: {value}" for key, value in job_status(args.job_dir).items()))
+    else:
+        try:
+            merge(args.job_dir, output=args.output)
+        except RuntimeError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
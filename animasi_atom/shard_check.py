@@ -0,0 +1,146 @@
+# Pemeriksaan protokol shard: beberapa worker pada satu direktori job dengan render palsu;
+# setiap shard harus dirender tepat sekali, lock worker yang dibunuh diambil alih setelah timeout
+# dan heartbeat berhenti pada lock yang sudah diambil alih (python -m animasi_atom.shard_check --workers 3)
+import argparse  # Untuk argumen command line
+import collections  # Untuk menghitung render per shard
+import glob  # Untuk file lock dan sisa file
+import json  # Untuk log render
+import multiprocessing  # Untuk proses worker
+import os  # Untuk operasi sistem file
+import sys  # Untuk exit code
+import tempfile  # Untuk direktori job sementara
+import threading  # Untuk thread heartbeat
+import time  # Untuk jeda render palsu dan timeout
+
+from . import parallel_render, shard  # Modul yang di-stub di setiap worker
+from .renditions import rendition_paths  # Path file setiap rendition
+
+RENDER_SECONDS = 0.2   # Durasi render palsu per shard (memberi waktu worker saling berebut)
+LOCK_TIMEOUT = 3.0     # Timeout lock pemeriksaan (detik); heartbeat setiap sepertiganya
+CHUNK_FRAMES = 60      # Frame per shard (lebih banyak shard daripada worker)
+
+
+def _fake_render_chunk(task, log_path, hang):
+    """Pengganti _render_chunk: menulis file video palsu dan mencatat render ke log"""
+    _, start, stop, path, _, _, _, _, renditions, _ = task
+    if hang:
+        time.sleep(3600)  # Worker korban: menahan lock sampai dibunuh
+    time.sleep(RENDER_SECONDS)
+    paths = rendition_paths(path, renditions)
+    for output in paths:
+        with open(output, "wb") as f:
+            f.write(f"{start}-{stop}".encode())
+    # Satu write O_APPEND per baris: baris dari beberapa proses tidak tercampur
+    line = json.dumps({'start': start, 'pid': os.getpid(), 'time': time.time()}) + "\n"
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
+    return paths
+
+
+def _worker(job_dir, log_path, hang=False):
+    """Proses worker: render shard di-stub, lalu protokol klaim/heartbeat/penanda yang asli"""
+    parallel_render._render_chunk = lambda task: _fake_render_chunk(task, log_path, hang)
+    shard.POLL_INTERVAL = 0.2
+    shard.work(job_dir, lock_timeout=LOCK_TIMEOUT)
+
+
+def check_shards(scene='atom', quality='draft', workers=3):
+    """Menjalankan worker bersamaan setelah satu worker dibunuh; mengembalikan daftar kegagalan"""
+    context = multiprocessing.get_context('spawn')
+    failures = []
+    with tempfile.TemporaryDirectory() as job_dir:
+        job = shard.plan_job(job_dir, scene, quality=quality, chunk_frames=CHUNK_FRAMES)
+        log_path = os.path.join(job_dir, "render.log")
+
+        # Worker korban mengklaim shard pertama lalu dibunuh tanpa melepas lock-nya
+        victim = context.Process(target=_worker, args=(job_dir, log_path, True))
+        victim.start()
+        while not glob.glob(os.path.join(job_dir, "*.lock")):
+            if not victim.is_alive():
+                return ["worker korban berhenti sebelum mengklaim shard"]
+            time.sleep(0.05)
+        [lock_path] = glob.glob(os.path.join(job_dir, "*.lock"))
+        victim.kill()
+        victim.join()
+        stale_since = os.path.getmtime(lock_path)  # Heartbeat terakhir worker korban
+
+        processes = [context.Process(target=_worker, args=(job_dir, log_path))
+                     for _ in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            if process.exitcode != 0:
+                failures.append(f"worker {process.pid} keluar dengan kode {process.exitcode}")
+
+        with open(log_path) as f:
+            renders = [json.loads(line) for line in f]
+        counts = collections.Counter(render['start'] for render in renders)
+        for item in job['shards']:
+            if counts[item['start']] != 1:
+                failures.append(f"shard {item['index']} dirender {counts[item['start']]} kali")
+
+        status = shard.job_status(job_dir)
+        if status != {'done': len(job['shards']), 'claimed': 0, 'pending': 0}:
+            failures.append(f"status job {status}")
+
+        # Shard worker korban hanya boleh diambil alih setelah lock-nya kedaluwarsa
+        victim_start = next(item['start'] for item in job['shards']
+                            if shard._lock_path(job_dir, item) == lock_path)
+        reclaimed = [render['time'] for render in renders if render['start'] == victim_start]
+        if reclaimed and reclaimed[0] < stale_since + LOCK_TIMEOUT:
+            failures.append(f"lock korban diambil alih {reclaimed[0] - stale_since:.1f} s "
+                            f"setelah heartbeat terakhir (timeout {LOCK_TIMEOUT} s)")
+
+        leftovers = [os.path.basename(path) for pattern in ("*.lock", "*.stale", "*.part*")
+                     for path in glob.glob(os.path.join(job_dir, pattern))]
+        if leftovers:
+            failures.append(f"sisa file: {', '.join(sorted(leftovers))}")
+        print(f"{len(job['shards'])} shard, {workers} worker, {len(renders)} render, "
+              f"status {status}")
+    return failures
+
+
+def check_heartbeat():
+    """Heartbeat berhenti dan tidak memperbarui lock yang sudah diambil alih worker lain"""
+    failures = []
+    with tempfile.TemporaryDirectory() as job_dir:
+        lock_path = os.path.join(job_dir, "shard.lock")
+        owner = shard._claim(lock_path, LOCK_TIMEOUT)
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=shard._heartbeat, args=(lock_path, owner, stop, 0.05))
+        heartbeat.start()
+        # Lock diganti milik worker lain dengan waktu lama, seperti hasil ambil alih
+        with open(lock_path, "w") as f:
+            json.dump({'owner': "lain", 'host': "lain", 'pid': 0, 'time': 0}, f)
+        os.utime(lock_path, (1, 1))
+        heartbeat.join(1.0)
+        stop.set()
+        if heartbeat.is_alive():
+            failures.append("heartbeat tetap berjalan setelah lock diambil alih")
+            heartbeat.join()
+        if os.path.getmtime(lock_path) != 1:
+            failures.append("heartbeat memperbarui lock milik worker lain")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m animasi_atom.shard_check",
+                                     description="Setiap shard dirender tepat sekali oleh banyak worker")
+    parser.add_argument('scene', nargs='?', default='atom', help="Scene job (default: atom)")
+    parser.add_argument('--quality', default='draft', help="Profil kualitas (default: draft)")
+    parser.add_argument('--workers', type=int, default=3, help="Jumlah worker bersamaan")
+    args = parser.parse_args(argv)
+
+    failures = check_heartbeat() + check_shards(args.scene, args.quality, args.workers)
+    for failure in failures:
+        print(f"GAGAL: {failure}")
+    print("OK" if not failures else f"{len(failures)} kegagalan")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+# Telemetri render per frame: waktu update / draw / tulis, jumlah objek, progress dan ETA
+import json  # Untuk record JSON-lines
+import os  # Untuk environment dan penulisan atomik per baris
+import sys  # Untuk output progress
+import threading  # Untuk membaca telemetri worker di latar belakang
+import time  # Untuk throughput dan ETA
+
+TELEMETRY_ENV = "ATOM_TELEMETRY"  # Path file telemetri (.jsonl atau .csv); kosong = mati
+FIELDS = ['frame', 'section', 'objects', 'polygons', 'update_ms', 'draw_ms', 'write_ms', 'queue', 'pid']
+
+
+def format_duration(seconds):
+    """Durasi dalam format j:mm:ss"""
+    seconds = int(max(seconds, 0))
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class RenderTelemetry:
+    """Mencatat setiap frame ke file dan menampilkan throughput serta ETA secara berkala"""
+
+    def __init__(self, path, sections=None, labels=None, counts=None, name="render",
+                 interval=5.0, stream=None, progress=True):
+        self.path = path            # File JSON-lines atau CSV (berdasarkan ekstensi)
+        self.csv = path.endswith(".csv")
+        self.sections = sections    # Indeks bagian per frame (mis. FrameTable.section)
+        self.labels = labels        # Nama bagian untuk setiap indeks
+        self.counts = counts        # Fungsi () -> (objek, poligon) yang terlihat
+        self.name = name            # Label progress (mis. rentang frame worker)
+        self.interval = interval    # Jeda antar laporan progress (detik)
+        self.progress = progress    # False: hanya mencatat (progress dilaporkan proses utama)
+        self.stream = stream or sys.stderr
+        self.total = 0
+        self.done = 0
+        self.stage_s = [0.0, 0.0, 0.0]  # Akumulasi update, draw, tulis
+        self._fd = None
+
+    @classmethod
+    def from_env(cls, table=None, timeline=None, scene=None, name="render", progress=True):
+        """Telemetri jika ATOM_TELEMETRY diset, selain itu None (loop render tanpa pengukuran)"""
+        path = os.environ.get(TELEMETRY_ENV)
+        if not path:
+            return None
+        return cls(path,
+                   sections=None if table is None else table.section,
+                   labels=None if timeline is None else [clip.name for clip in timeline.clips],
+                   counts=None if scene is None else scene.counts,
+                   name=name, progress=progress)
+
+    def start(self, total):
+        """Membuka file (mode append, aman untuk beberapa worker) dan memulai jam"""
+        self.total = total
+        self.done = 0
+        self.stage_s = [0.0, 0.0, 0.0]
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        if self.csv and os.fstat(self._fd).st_size == 0:
+            os.write(self._fd, (",".join(FIELDS) + "\n").encode())
+        self._started = self._reported = time.perf_counter()
+
+    def record(self, frame, update_s, draw_s, write_s, queue=None):
+        """Mencatat satu frame; setiap record ditulis dengan satu write agar baris tidak tercampur
+
+        queue adalah jumlah buffer antrean writer yang terpakai setelah frame ini masuk."""
+        section = None if self.sections is None else int(self.sections[frame])
+        if section is not None and self.labels is not None:
+            section = self.labels[section]
+        objects, polygons = self.counts() if self.counts is not None else (None, None)
+        values = [frame, section, objects, polygons, round(update_s * 1000, 3),
+                  round(draw_s * 1000, 3), round(write_s * 1000, 3), queue, os.getpid()]
+        if self.csv:
+            line = ",".join("" if value is None else str(value) for value in values)
+        else:
+            line = json.dumps(dict(zip(FIELDS, values)))
+        os.write(self._fd, (line + "\n").encode())
+
+        self.done += 1
+        self.stage_s[0] += update_s
+        self.stage_s[1] += draw_s
+        self.stage_s[2] += write_s
+        now = time.perf_counter()
+        if self.progress and now - self._reported >= self.interval:
+            self._reported = now
+            self.report(now)
+
+    def report(self, now=None):
+        """Baris progress: frame selesai, fps, rata-rata tiap tahap dan ETA"""
+        elapsed = (now or time.perf_counter()) - self._started
+        fps = self.done / elapsed if elapsed > 0 else 0.0
+        remaining = (self.total - self.done) / fps if fps > 0 else 0.0
+        n = max(self.done, 1)
+        update_ms, draw_ms, write_ms = (1000 * value / n for value in self.stage_s)
+        percent = 100 * self.done / self.total if self.total else 100.0
+        print(f"[{self.name}] {self.done}/{self.total} frame ({percent:.0f}%) | {fps:.2f} fps | "
+              f"update {update_ms:.1f}ms draw {draw_ms:.1f}ms tulis {write_ms:.1f}ms | "
+              f"ETA {format_duration(remaining)}", file=self.stream, flush=True)
+
+    def finish(self):
+        """Laporan akhir dan menutup file"""
+        if self._fd is None:
+            return
+        if self.progress:
+            self.report()
+        os.close(self._fd)
+        self._fd = None
+
+
+class JobProgress(RenderTelemetry):
+    """Progress dan ETA seluruh job di proses utama dari record telemetri semua worker
+
+    Worker hanya mencatat frame ke file telemetri bersama; thread latar belakang membaca
+    record baru dari file itu, jadi persentase dan ETA mencakup semua potongan job."""
+
+    def start(self, total):
+        """Mulai membaca record yang ditulis setelah titik ini (record render sebelumnya diabaikan)"""
+        self.total = total
+        self.done = 0
+        self.stage_s = [0.0, 0.0, 0.0]
+        self._offset = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        self._partial = b""
+        self._started = self._reported = time.perf_counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._follow, daemon=True)
+        self._thread.start()
+
+    def _follow(self):
+        while not self._stop.wait(self.interval):
+            self._read()
+            self.report()
+
+    def _read(self):
+        """Menambahkan record lengkap yang baru ke jumlah frame dan waktu tiap tahap"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()  # Baris terakhir mungkin belum selesai ditulis
+        for line in lines:
+            if not line or line.startswith(b"frame,"):
+                continue
+            if self.csv:
+                values = dict(zip(FIELDS, line.decode().split(",")))
+            else:
+                values = json.loads(line)
+            self.done += 1
+            for i, field in enumerate(('update_ms', 'draw_ms', 'write_ms')):
+                self.stage_s[i] += float(values[field]) / 1000
+
+    def finish(self):
+        """Laporan akhir setelah semua worker selesai"""
+        if getattr(self, "_thread", None) is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._read()
+        self.report()
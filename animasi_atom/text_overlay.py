@@ -0,0 +1,142 @@
+# Overlay teks 2D: setiap state teks dirasterisasi sekali lalu di-blend ke frame buffer
+from collections import OrderedDict  # Untuk cache LRU tile
+
+import numpy as np  # Untuk blending array
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # Canvas offscreen
+from matplotlib.figure import Figure  # Figure offscreen untuk rasterisasi teks
+
+from .glyph_cache import LineRecorder, rasterize_reveal  # Raster string penuh untuk teks bertahap
+
+ALPHA_STEPS = 64  # Kuantisasi alpha agar jumlah state teks tetap terbatas
+
+
+def fixed_point(tile):
+    """Tile RGBA uint8 -> warna premultiplied dan faktor (1 - alpha) dalam skala 8.8 fixed-point"""
+    tile = tile.astype(np.uint16)
+    coverage = tile[..., 3:4] + (tile[..., 3:4] >> 7)  # 0..255 -> 0..256
+    return tile[..., :3] * coverage + 128, 256 - coverage
+
+
+class OverlayText:
+    """Pengganti text2D: menyimpan state teks, dirender oleh TextOverlay"""
+
+    def __init__(self, x, y, style):
+        self.x = x            # Posisi x (koordinat figure 0-1)
+        self.y = y            # Posisi y (koordinat figure 0-1)
+        self.style = style    # Properti teks matplotlib (warna, font, bbox, ...)
+        self.text = ""
+        self.alpha = 1.0
+        self.reveal = None    # (teks penuh, jumlah karakter) selama efek mesin ketik
+
+    def set_text(self, text):
+        self.text = text
+        self.reveal = None
+
+    def set_reveal(self, full_text, chars):
+        """Prefix full_text digambar dari raster string penuh (layout tidak dihitung ulang)"""
+        self.text = full_text[:chars]
+        self.reveal = (full_text, chars)
+
+    def set_alpha(self, alpha):
+        self.alpha = 1.0 if alpha is None else float(np.clip(alpha, 0, 1))
+
+
+class TextOverlay:
+    """Compositor teks: tile RGBA di-cache per (teks, alpha, gaya)"""
+
+    def __init__(self, size, dpi=100, cache_size=512):
+        width, height = size
+        self.size = (width, height)
+        self.texts = []                # Teks overlay, digambar sesuai urutan
+        self.cache_size = cache_size   # Jumlah maksimum tile di cache
+        self._tiles = OrderedDict()
+        self._recorder = LineRecorder(width, height, dpi)  # Renderer untuk raster teks bertahap
+        # Figure offscreen transparan seukuran frame, agar wrapping teks sama
+        self._figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        self._figure.patch.set_alpha(0)
+        FigureCanvasAgg(self._figure)
+
+    def add_text(self, x, y, text="", **style):
+        """Menambahkan teks overlay pada koordinat figure (seperti transFigure)"""
+        item = OverlayText(x, y, style)
+        item.set_text(text)
+        self.texts.append(item)
+        return item
+
+    def _rasterize(self, item, alpha):
+        """Layout dan rasterisasi satu state teks ke tile RGBA yang dipotong"""
+        artist = self._figure.text(item.x, item.y, item.text, alpha=alpha, **item.style)
+        try:
+            self._figure.canvas.draw()
+            buffer = np.asarray(self._figure.canvas.buffer_rgba())
+            rows = np.flatnonzero(buffer[..., 3].any(axis=1))
+            cols = np.flatnonzero(buffer[..., 3].any(axis=0))
+            if len(rows) == 0:
+                return None
+            y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+            premultiplied, inverse_alpha = fixed_point(buffer[y0:y1, x0:x1])
+        finally:
+            artist.remove()
+        return y0, x0, premultiplied, inverse_alpha
+
+    def _rasterize_reveal(self, item):
+        """Raster string penuh (opacity penuh) beserta batas glyph untuk teks bertahap"""
+        artist = self._figure.text(item.x, item.y, item.reveal[0], **item.style)
+        try:
+            return rasterize_reveal(artist, item.reveal[0], self._recorder, convert=fixed_point)
+        finally:
+            artist.remove()
+
+    def tile(self, item):
+        """Tile ter-cache untuk state teks saat ini (RevealRaster untuk teks bertahap)"""
+        alpha = round(item.alpha * ALPHA_STEPS) / ALPHA_STEPS
+        # Kotak bbox memiliki alpha sendiri, jadi tetap tampil saat alpha teks 0
+        if not item.text or alpha <= 0 and item.style.get('bbox') is None:
+            return None
+        style = repr(sorted(item.style.items()))
+        if item.reveal is not None:
+            # Satu raster per string penuh; prefix dan alpha diterapkan saat komposit
+            key = ('reveal', item.reveal[0], style, item.x, item.y)
+        else:
+            key = (item.text, alpha, style, item.x, item.y)
+        if key in self._tiles:
+            self._tiles.move_to_end(key)
+            return self._tiles[key]
+        tile = self._rasterize_reveal(item) if item.reveal is not None else self._rasterize(item, alpha)
+        self._tiles[key] = tile
+        if len(self._tiles) > self.cache_size:
+            self._tiles.popitem(last=False)  # Buang tile yang paling lama tidak dipakai
+        return tile
+
+    def composite(self, frame):
+        """Blend semua teks ke frame RGBA (H, W, 4) uint8 secara in-place"""
+        for item in self.texts:
+            tile = self.tile(item)
+            if tile is None:
+                continue
+            if item.reveal is not None:
+                self._composite_reveal(frame, item, tile)
+                continue
+            y0, x0, premultiplied, inverse_alpha = tile
+            h, w = inverse_alpha.shape[:2]
+            region = frame[y0:y0 + h, x0:x0 + w, :3]
+            region[...] = (region * inverse_alpha + premultiplied) >> 8
+        return frame
+
+    def _composite_reveal(self, frame, item, raster):
+        """Blend blok-blok prefix dari raster string penuh dengan alpha item saat ini
+
+        Seperti Text matplotlib, alpha hanya memudarkan glyph; kotak bbox tetap dengan alpha-nya
+        sendiri. Pada alpha penuh layer lengkap (glyph di atas kotak) dipakai langsung."""
+        scale = np.uint16(round(item.alpha * ALPHA_STEPS) * 256 // ALPHA_STEPS)  # Alpha 0..256
+        for r0, r1, c0, c1, layer in raster.regions(item.reveal[1], separate_box=scale < 256):
+            if layer is not raster.box and scale == 0:
+                continue
+            premultiplied, inverse_alpha = layer
+            premultiplied = premultiplied[r0:r1, c0:c1]
+            inverse_alpha = inverse_alpha[r0:r1, c0:c1]
+            if scale < 256 and layer is not raster.box:
+                premultiplied = (premultiplied >> 8) * scale + 128
+                inverse_alpha = 256 - (((256 - inverse_alpha) * scale) >> 8)
+            region = frame[raster.row + r0:raster.row + r1, raster.col + c0:raster.col + c1, :3]
+            region[...] = (region * inverse_alpha + premultiplied) >> 8
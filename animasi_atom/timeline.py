@@ -0,0 +1,121 @@
+# Timeline keyframe: model atom sebagai data (clip, track, keyframe), disampling sekali per frame
+import numpy as np  # Untuk sampling keyframe
+
+from .frame_table import FrameTable, reveal_chars, text_reveal  # Tabel hasil sampling
+
+
+class Keyframes:
+    """Kurva linear sepotong-sepotong; dua keyframe pada waktu sama membentuk lompatan"""
+
+    def __init__(self, points):
+        times, values = zip(*points)
+        self.times = np.asarray(times, dtype=float)    # Waktu keyframe (urut naik)
+        self.values = np.asarray(values, dtype=float)  # Nilai di setiap keyframe
+        if np.any(np.diff(self.times) < 0):
+            raise ValueError("Waktu keyframe harus urut naik")
+
+    def __call__(self, t, progress=None):
+        """Nilai kurva pada waktu t (skalar atau array)"""
+        t = np.asarray(t, dtype=float)
+        last = len(self.times) - 1
+        # Pencarian biner: keyframe sesudah t; pada lompatan nilai kanan yang berlaku
+        right = np.searchsorted(self.times, t, side='right')
+        left = np.clip(right - 1, 0, last)
+        right = np.clip(right, 0, last)
+        t0, t1 = self.times[left], self.times[right]
+        span = np.where(t1 > t0, t1 - t0, 1.0)
+        weight = np.where(t1 > t0, (t - t0) / span, 0.0)
+        return self.values[left] + (self.values[right] - self.values[left]) * weight
+
+    def __mul__(self, factor):
+        return Keyframes(zip(self.times, self.values * factor))
+
+    __rmul__ = __mul__
+
+
+def ramp(start, end, v0=0.0, v1=1.0):
+    """Kurva naik linear dari v0 (di start) ke v1 (di end), konstan di luar rentang"""
+    return Keyframes([(start, v0), (end, v1)])
+
+
+class Interval:
+    """Track show/hide: terlihat selama start < t < end"""
+
+    def __init__(self, start, end=np.inf):
+        self.start = start
+        self.end = end
+
+    def __call__(self, t, progress=None):
+        t = np.asarray(t, dtype=float)
+        return (t > self.start) & (t < self.end)
+
+
+def stagger(index, start, rate):
+    """Track show: objek ke-index terlihat saat t > start dan int(t * rate) > index"""
+    def visible(t, progress=None):
+        t = np.asarray(t, dtype=float)
+        return (t > start) & (np.trunc(t * rate) > index)
+    return visible
+
+
+def sample(value, t, progress):
+    """Sampling satu nilai track: kurva/interval/fungsi gerak dievaluasi, konstanta apa adanya"""
+    return value(t, progress) if callable(value) else value
+
+
+class Clip:
+    """Satu model dalam timeline: durasi, setup artist dan deklarasi track keyframe"""
+
+    def __init__(self, name, duration, build, compose):
+        self.name = name          # Nama model
+        self.duration = duration  # Durasi relatif (detik)
+        self.build = build        # Membuat artist saat clip mulai
+        self.compose = compose    # compose(clip) mendeklarasikan track clip
+        self.tracks = []
+
+    def add(self, setter, *args, **columns):
+        """Track clip; kolom berupa konstanta, Keyframes, Interval atau fungsi f(t, progress)"""
+        self.tracks.append((setter, args, columns))
+
+    def reveal(self, text_obj, full_text, curve):
+        """Track teks bertahap: jumlah karakter mengikuti kurva 0-1"""
+        self.add(text_reveal(text_obj, full_text),
+                 chars=lambda t, progress: reveal_chars(full_text, np.clip(curve(t), 0, 1)))
+
+
+class Timeline:
+    """Clip berurutan dengan batas progress; track global (mis. kamera) berlaku di semua clip
+
+    Clip aktif setiap frame dicari sekali di table() (FrameTable.section), bukan per frame."""
+
+    def __init__(self, clips, compose=None):
+        self.clips = list(clips)
+        durations = np.array([clip.duration for clip in self.clips], dtype=float)
+        # Batas clip dalam progress global (0-1)
+        self.bounds = np.concatenate([[0.0], np.cumsum(durations)]) / durations.sum()
+        self.compose = compose    # compose(timeline) mendeklarasikan track global
+        self.tracks = []
+
+    def add(self, setter, *args, **columns):
+        """Track global; kurva dan fungsi dievaluasi pada progress global"""
+        self.tracks.append((setter, args, columns))
+
+    def table(self, total_frames):
+        """Sampling semua track untuk setiap frame sekaligus ke FrameTable"""
+        table = FrameTable(total_frames, self.bounds)
+        self.tracks.clear()
+        if self.compose is not None:
+            self.compose(self)
+        for section, clip in enumerate(self.clips):
+            frames = table.frames(section)
+            progress = table.progress[frames]
+            local = table.section_progress[frames]
+            clip.tracks.clear()
+            clip.compose(clip)
+            for setter, args, columns in self.tracks:
+                table.add(section, setter, *args,
+                          **{key: sample(value, progress, progress) for key, value in columns.items()})
+            for setter, args, columns in clip.tracks:
+                table.add(section, setter, *args,
+                          **{key: sample(value, local, progress) for key, value in columns.items()})
+        return table
@@ -0,0 +1,298 @@
+# Writer video: buffer RGBA canvas Agg dikirim langsung ke pipe rawvideo FFmpeg
+import queue  # Untuk antrean frame antara render dan thread penulis
+import subprocess  # Untuk menjalankan FFmpeg
+import threading  # Untuk thread penulis pipe
+import time  # Untuk mengukur throughput
+
+import numpy as np  # Untuk akses buffer frame sebagai array
+
+from .renditions import rendition_paths  # Path output setiap rendition
+
+QUEUE_FRAMES = 3  # Buffer frame praalokasi antara render dan pipe FFmpeg (0 = tulis langsung)
+
+
+def audio_mux_args():
+    """Argumen FFmpeg untuk menggabungkan video input 0 dengan audio input 1"""
+    return [
+        '-c:a', 'copy',     # Audio sudah AAC dari prepare_audio, cukup disalin
+        '-map', '0:v:0',    # Ambil video dari input pertama
+        '-map', '1:a:0',    # Ambil audio dari input kedua
+        '-shortest',        # Sesuaikan durasi dengan yang terpendek
+    ]
+
+
+class RawVideoWriter:
+    """Menulis frame sebagai rawvideo RGBA ke stdin FFmpeg tanpa savefig"""
+
+    def __init__(self, output_path, fps, size=(1080, 1920), bitrate=None, extra_args=None,
+                 audio_path=None, faststart=True, queue_size=QUEUE_FRAMES, renditions=None):
+        self.output_path = output_path  # File video hasil
+        self.fps = fps                  # Frame rate video
+        self.size = tuple(size)         # Ukuran frame (lebar, tinggi) dalam piksel
+        self.bitrate = bitrate          # Bitrate video dalam kbps (None = dari CRF)
+        self.extra_args = list(extra_args or [])
+        self.audio_path = audio_path    # Audio AAC yang di-mux dalam encode yang sama
+        self.faststart = faststart      # Pindahkan moov ke awal file untuk streaming
+        self.queue_size = queue_size    # Jumlah buffer antrean; memori tetap, tidak bergantung durasi
+        self.renditions = list(renditions or [])  # Varian (nama, filter, bitrate) dari encode yang sama
+        self.frames_written = 0         # Jumlah frame yang sudah dikirim
+        self.bytes_written = 0          # Jumlah byte yang sudah dikirim
+        self._proc = None
+        self._started = None
+        self._free = None               # Buffer kosong yang siap diisi frame berikutnya
+        self._filled = None             # Frame yang menunggu ditulis thread penulis
+        self._thread = None
+        self._error = None              # Exception dari thread penulis (dilempar ulang di render)
+        # Statistik antrean: total dan maksimum buffer terpakai, waktu tunggu kedua sisi
+        self._queued = 0
+        self._occupancy_total = 0
+        self._occupancy_max = 0
+        self._stalls = 0
+        self.stall_s = 0.0              # Render menunggu buffer kosong (FFmpeg lebih lambat)
+        self.idle_s = 0.0               # Thread penulis menunggu frame (render lebih lambat)
+
+    def command(self):
+        """Perintah FFmpeg untuk input rawvideo RGBA dari stdin"""
+        width, height = self.size
+        cmd = [
+            'ffmpeg',
+            '-y',
+            '-loglevel', 'warning',
+            '-f', 'rawvideo',           # Input tanpa kontainer
+            '-pix_fmt', 'rgba',         # Format buffer canvas Agg
+            '-s', f'{width}x{height}',  # Ukuran frame tetap
+            '-r', str(self.fps),
+            '-i', '-',                  # Frame dibaca dari stdin
+        ]
+        if self.audio_path:
+            cmd += ['-i', self.audio_path]
+        if not self.renditions:
+            cmd += self._output_args(self.bitrate)
+            if self.audio_path:
+                # Video dan audio ditulis dalam satu pass, tanpa file video sementara
+                cmd += audio_mux_args()
+            return cmd + self._container_args(self.output_path)
+
+        # Multi-rendition: frame dari stdin dipecah (split) ke setiap varian dalam satu proses,
+        # jadi rendition tambahan hanya menambah waktu encode, bukan render
+        paths = rendition_paths(self.output_path, self.renditions)
+        labels = [f"[v{i}]" for i in range(len(paths))]
+        graph = [f"[0:v]split={len(paths)}" + "".join(labels)]
+        for i, (_, video_filter, _) in enumerate(self.renditions, 1):
+            graph.append(f"{labels[i]}{video_filter}[r{i}]")
+        cmd += ['-filter_complex', ";".join(graph)]
+        outputs = [(labels[0], self.bitrate)] + [(f"[r{i}]", bitrate) for i, (_, _, bitrate)
+                                                 in enumerate(self.renditions, 1)]
+        for path, (label, bitrate) in zip(paths, outputs):
+            cmd += ['-map', label]
+            if self.audio_path:
+                cmd += ['-map', '1:a:0', '-c:a', 'copy', '-shortest']
+            cmd += self._output_args(bitrate) + self._container_args(path)
+        return cmd
+
+    def _output_args(self, bitrate):
+        """Argumen encoder video untuk satu output"""
+        cmd = ['-c:v', 'libx264']
+        if bitrate:
+            cmd += ['-b:v', f'{bitrate}k']
+        return cmd + self.extra_args
+
+    def _container_args(self, path):
+        """Format piksel, faststart dan path satu output"""
+        cmd = ['-pix_fmt', 'yuv420p']
+        if self.faststart:
+            cmd += ['-movflags', '+faststart']
+        return cmd + [path]
+
+    def open(self):
+        """Menjalankan proses FFmpeg"""
+        # bufsize=0: memoryview ditulis langsung ke pipe tanpa buffer Python
+        self._proc = subprocess.Popen(self.command(), stdin=subprocess.PIPE, bufsize=0)
+        self._started = time.perf_counter()
+        if self.queue_size > 0:
+            # Buffer dialokasikan sekali; render frame berikutnya berjalan selama pipe ditulis
+            width, height = self.size
+            self._free = queue.Queue()
+            for _ in range(self.queue_size):
+                self._free.put(np.empty((height, width, 4), dtype=np.uint8))
+            self._filled = queue.Queue()
+            self._error = None
+            self._thread = threading.Thread(target=self._drain, name="ffmpeg-writer", daemon=True)
+            self._thread.start()
+        return self
+
+    def write_frame(self, fig, post_process=None):
+        """Menggambar canvas sekali lalu mengirim buffer RGBA-nya ke FFmpeg"""
+        self.write_buffer(self.draw(fig, post_process))
+
+    def draw(self, fig, post_process=None):
+        """Menggambar canvas dan mengembalikan buffer RGBA-nya"""
+        canvas = fig.canvas
+        canvas.draw()
+        if canvas.get_width_height() != self.size:
+            raise ValueError(f"Ukuran canvas {canvas.get_width_height()} "
+                             f"tidak sama dengan ukuran video {self.size}")
+        buffer = canvas.buffer_rgba()
+        if post_process is not None:
+            # Pemrosesan di tempat pada buffer canvas (mis. overlay teks)
+            post_process(np.asarray(buffer))
+        return buffer
+
+    def write_buffer(self, buffer):
+        """Mengirim satu buffer frame RGBA: disalin ke antrean, atau langsung ke pipe tanpa antrean"""
+        if self._thread is None:
+            self._write(buffer)
+            return
+        # Backpressure: jika semua buffer terpakai, render menunggu thread penulis
+        try:
+            frame = self._free.get_nowait()
+        except queue.Empty:
+            self._stalls += 1
+            started = time.perf_counter()
+            frame = self._wait_free()
+            self.stall_s += time.perf_counter() - started
+        # Salinan diperlukan karena canvas menimpa buffer yang sama pada draw berikutnya
+        np.copyto(frame, np.asarray(buffer).reshape(frame.shape))
+        self._filled.put(frame)
+        occupancy = self.queue_size - self._free.qsize()
+        self._queued += 1
+        self._occupancy_total += occupancy
+        self._occupancy_max = max(self._occupancy_max, occupancy)
+
+    def _wait_free(self):
+        """Menunggu buffer kosong sambil memeriksa apakah thread penulis gagal"""
+        while True:
+            if self._error is not None:
+                raise self._error
+            try:
+                return self._free.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+    def _drain(self):
+        """Thread penulis: frame dari antrean ditulis ke pipe lalu buffer dikembalikan"""
+        while True:
+            started = time.perf_counter()
+            frame = self._filled.get()
+            self.idle_s += time.perf_counter() - started
+            if frame is None:
+                return
+            try:
+                self._write(frame)
+            except BaseException as exc:
+                self._error = exc
+                return
+            self._free.put(frame)
+
+    def _write(self, buffer):
+        """Menulis satu buffer frame RGBA ke pipe tanpa salinan perantara"""
+        view = memoryview(buffer).cast('B')
+        nbytes = view.nbytes
+        while view:
+            written = self._proc.stdin.write(view)
+            view = view[written:]
+        self.frames_written += 1
+        self.bytes_written += nbytes
+
+    def occupancy(self):
+        """Jumlah buffer antrean yang sedang terpakai (0 tanpa antrean)"""
+        return 0 if self._free is None else self.queue_size - self._free.qsize()
+
+    def queue_stats(self):
+        """Statistik antrean: rata-rata dan maksimum buffer terpakai, jumlah dan lama menunggu"""
+        n = max(self._queued, 1)
+        return {
+            'capacity': self.queue_size,
+            'mean_occupancy': self._occupancy_total / n,
+            'max_occupancy': self._occupancy_max,
+            'stalls': self._stalls,
+            'stall_s': self.stall_s,
+            'idle_s': self.idle_s,
+        }
+
+    def bytes_per_second(self):
+        """Throughput data ke FFmpeg (byte per detik)"""
+        elapsed = time.perf_counter() - self._started
+        return self.bytes_written / elapsed if elapsed > 0 else 0.0
+
+    def close(self):
+        """Menutup pipe dan menunggu FFmpeg selesai"""
+        if self._proc is None:
+            return
+        self._stop_thread()
+        if self._error is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+            raise self._error
+        rate = self.bytes_per_second()
+        self._proc.stdin.close()
+        returncode = self._proc.wait()
+        self._proc = None
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, 'ffmpeg')
+        print(f"{self.frames_written} frame, {self.bytes_written / 1e6:.1f} MB "
+              f"dikirim ke FFmpeg ({rate / 1e6:.1f} MB/s)")
+        if self.queue_size > 0:
+            stats = self.queue_stats()
+            print(f"Antrean {stats['mean_occupancy']:.1f}/{self.queue_size} buffer rata-rata, "
+                  f"render menunggu {stats['stalls']}x ({stats['stall_s']:.1f} s), "
+                  f"penulis menganggur {stats['idle_s']:.1f} s")
+
+    def _stop_thread(self):
+        """Mengirim penanda akhir lalu menunggu thread penulis mengosongkan antrean"""
+        if self._thread is None:
+            return
+        self._filled.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self._proc is not None:
+            # Render gagal: hentikan FFmpeg tanpa menunggu sisa frame
+            self._proc.kill()
+            self._stop_thread()  # Tulisan yang tertunda gagal karena pipe putus
+            self._proc.wait()
+            self._proc = None
+            return False
+        self.close()
+        return False
+
+
+def render_frames(fig, update, frames, writer, post_process=None, telemetry=None, tap=None):
+    """Loop render: update scene, gambar canvas sekali, kirim ke writer
+
+    Dengan antrean writer, encode FFmpeg berjalan bersamaan dengan render frame berikutnya;
+    waktu tulis di telemetri adalah waktu menyalin ke antrean termasuk menunggu buffer kosong.
+    tap(frame, buffer) opsional menerima buffer setiap frame sebelum dikirim (mis. PreviewTap)."""
+    if telemetry is None:
+        # Tanpa telemetri: loop tanpa pengukuran sama sekali
+        for frame in frames:
+            update(frame)
+            if tap is None:
+                writer.write_frame(fig, post_process)
+                continue
+            buffer = writer.draw(fig, post_process)
+            tap(frame, buffer)
+            writer.write_buffer(buffer)
+        return
+
+    # Dengan telemetri: waktu update, draw dan tulis diukur terpisah per frame
+    clock = time.perf_counter
+    telemetry.start(len(frames))
+    try:
+        for frame in frames:
+            t0 = clock()
+            update(frame)
+            t1 = clock()
+            buffer = writer.draw(fig, post_process)
+            if tap is not None:
+                tap(frame, buffer)  # Dihitung sebagai waktu draw
+            t2 = clock()
+            writer.write_buffer(buffer)
+            telemetry.record(frame, t1 - t0, t2 - t1, clock() - t2, writer.occupancy())
+    finally:
+        telemetry.finish()